@@ -0,0 +1,62 @@
+import timeit
+
+import numpy as np
+
+from fedot.core.data.data import InputData
+from fedot.core.operations.evaluation.operation_implementations.data_operations.sklearn_transformations import \
+    NormalizationImplementation, ScalingImplementation
+from fedot.core.operations.evaluation.operation_implementations.implementation_interfaces import \
+    EncodedInvariantImplementation
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+
+
+def get_table(rows_number: int, columns_number: int, bool_fraction: float = 0.3, seed: int = 1) -> InputData:
+    """ Table with the float columns and the part of one-hot encoded columns """
+    rng = np.random.default_rng(seed)
+    features = rng.normal(size=(rows_number, columns_number))
+    bool_columns = rng.random(columns_number) < bool_fraction
+    features[:, bool_columns] = rng.integers(0, 2, size=(rows_number, bool_columns.sum()))
+    return InputData(idx=np.arange(rows_number), features=features, target=rng.normal(size=rows_number),
+                     task=Task(TaskTypesEnum.regression), data_type=DataTypesEnum.table)
+
+
+def reference_reasonability_check(features: np.ndarray):
+    """ Column by column check with np.unique as it was before the vectorization """
+    bool_ids, non_bool_ids = [], []
+    for column_id in range(features.shape[1]):
+        if len(np.unique(features[:, column_id])) > 2:
+            non_bool_ids.append(column_id)
+        else:
+            bool_ids.append(column_id)
+    return bool_ids, non_bool_ids
+
+
+def run_bool_columns_detection_benchmark(rows_number: int = 2000, columns_numbers=(10, 100, 1000), repeats: int = 5):
+    """
+    Compares the time of the boolean columns detection column by column and the vectorized one,
+    and the time of the fit of scaling and normalization on the same table (the second fit reuses the detected columns)
+    """
+    for columns_number in columns_numbers:
+        input_data = get_table(rows_number, columns_number)
+        features = input_data.features
+
+        reference_time = min(timeit.repeat(lambda: reference_reasonability_check(features), number=1, repeat=repeats))
+        vectorized_time = min(timeit.repeat(lambda: EncodedInvariantImplementation._reasonability_check(features),
+                                            number=1, repeat=repeats))
+        assert [list(ids) for ids in EncodedInvariantImplementation._reasonability_check(features)] == \
+               list(reference_reasonability_check(features))
+
+        start_time = timeit.default_timer()
+        for implementation in [ScalingImplementation(), NormalizationImplementation()]:
+            implementation.fit(input_data)
+            implementation.transform(input_data, is_fit_pipeline_stage=True)
+        operations_time = timeit.default_timer() - start_time
+
+        print(f'{columns_number} columns: detection column by column {reference_time:.4f} s, '
+              f'vectorized {vectorized_time:.4f} s; fit and transform of scaling and normalization '
+              f'{operations_time:.4f} s')
+
+
+if __name__ == '__main__':
+    run_bool_columns_detection_benchmark()
@@ -0,0 +1,79 @@
+import resource
+import timeit
+from multiprocessing import get_context
+
+import numpy as np
+
+from fedot.core.composer.metrics import RMSE
+from fedot.core.data.data import InputData
+from fedot.core.data.data_split import train_test_data_setup
+from fedot.core.data.supplementary_data import SupplementaryData
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+
+
+def get_numeric_table(rows_number: int, columns_number: int, precision: str,
+                      seed: int = 1, chunk_size: int = 100_000) -> InputData:
+    """ Regression data with the same numerical features for any precision, the features table
+    is filled by chunks to not to allocate the float64 table for float32 precision """
+    rng = np.random.default_rng(seed)
+    coefficients = rng.normal(size=columns_number)
+    features = np.empty((rows_number, columns_number), dtype=precision)
+    target = np.empty(rows_number)
+    for start in range(0, rows_number, chunk_size):
+        chunk = rng.normal(size=(min(chunk_size, rows_number - start), columns_number))
+        features[start:start + len(chunk)] = chunk
+        target[start:start + len(chunk)] = chunk @ coefficients + np.sin(chunk[:, 0]) + \
+            rng.normal(scale=0.1, size=len(chunk))
+    supplementary_data = SupplementaryData(was_preprocessed=True,
+                                           column_types={'features': [str(float)] * columns_number,
+                                                         'target': [str(float)]})
+    input_data = InputData(idx=np.arange(rows_number), features=features, target=target,
+                           task=Task(TaskTypesEnum.regression), data_type=DataTypesEnum.table,
+                           supplementary_data=supplementary_data)
+    input_data.precision = precision
+    return input_data
+
+
+def fit_predict_with_precision(model: str, rows_number: int, columns_number: int, precision: str):
+    """ Fit and predict of the pipeline scaling -> model in the separate process to measure its peak memory """
+    train_data, test_data = train_test_data_setup(get_numeric_table(rows_number, columns_number, precision))
+    pipeline = Pipeline(SecondaryNode(model, nodes_from=[PrimaryNode('scaling')]))
+
+    start_time = timeit.default_timer()
+    pipeline.fit(train_data)
+    predicted = pipeline.predict(test_data)
+    pipeline_time = timeit.default_timer() - start_time
+
+    metric = RMSE.metric(test_data, predicted)
+    peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return pipeline_time, peak_memory, metric, np.ravel(predicted.predict).astype(np.float64)
+
+
+def run_float32_precision_benchmark(rows_number: int = 1_000_000, columns_number: int = 50,
+                                    models=('ridge', 'lgbmreg')):
+    """
+    Compares the peak memory (RSS) and the time of fit and predict of the pipeline scaling -> model
+    on the table of rows_number * columns_number cells with float64 and float32 precision of features
+    and the deviations of predictions and metric of float32 pipeline from float64 one
+    """
+    context = get_context('spawn')
+    for model in models:
+        results = {}
+        for precision in ['float64', 'float32']:
+            with context.Pool(1) as pool:
+                results[precision] = pool.apply(fit_predict_with_precision,
+                                                (model, rows_number, columns_number, precision))
+            pipeline_time, peak_memory, metric, _ = results[precision]
+            print(f'{model}, {precision}: fit and predict {pipeline_time:.2f} s, '
+                  f'peak RSS {peak_memory:.0f} MB, RMSE {metric:.5f}')
+        predictions_deviation = np.max(np.abs(results['float32'][3] - results['float64'][3]))
+        metric_deviation = abs(results['float32'][2] - results['float64'][2])
+        print(f'{model}: max deviation of predictions {predictions_deviation:.2e}, '
+              f'deviation of RMSE {metric_deviation:.2e}')
+
+
+if __name__ == '__main__':
+    run_float32_precision_benchmark()
@@ -0,0 +1,104 @@
+import random
+import timeit
+from contextlib import contextmanager, nullcontext
+from copy import deepcopy
+from typing import List
+
+import numpy as np
+
+from fedot.core.composer.advisor import PipelineChangeAdvisor
+from fedot.core.composer.gp_composer.gp_composer import PipelineComposerRequirements
+from fedot.core.dag import graph_operator
+from fedot.core.log import default_log
+from fedot.core.optimisers.adapters import PipelineAdapter
+from fedot.core.optimisers.gp_comp import gp_operators
+from fedot.core.optimisers.gp_comp.gp_operators import random_graph
+from fedot.core.optimisers.gp_comp.individual import Individual
+from fedot.core.optimisers.gp_comp.operators.crossover import CrossoverTypesEnum, crossover
+from fedot.core.optimisers.gp_comp.operators.mutation import MutationTypesEnum, mutation
+from fedot.core.optimisers.graph import OptGraph
+from fedot.core.optimisers.optimizer import GraphGenerationParams
+
+
+@contextmanager
+def deepcopy_cloning():
+    """ Replaces the structural cloning of graphs and nodes with deepcopy as it was before """
+    clone, clone_nodes = OptGraph.clone, graph_operator.clone_nodes
+    OptGraph.clone = deepcopy
+    graph_operator.clone_nodes = gp_operators.clone_nodes = deepcopy
+    try:
+        yield
+    finally:
+        OptGraph.clone = clone
+        graph_operator.clone_nodes = gp_operators.clone_nodes = clone_nodes
+
+
+def get_population(size: int, requirements: PipelineComposerRequirements,
+                   params: GraphGenerationParams) -> List[Individual]:
+    return [Individual(random_graph(params, requirements)) for _ in range(size)]
+
+
+def produce_offspring(population: List[Individual], offspring_number: int,
+                      requirements: PipelineComposerRequirements, params: GraphGenerationParams):
+    log = default_log(__name__)
+    mutation_types = [MutationTypesEnum.simple, MutationTypesEnum.single_edge, MutationTypesEnum.single_add,
+                      MutationTypesEnum.single_change, MutationTypesEnum.single_drop]
+    offspring = []
+    while len(offspring) < offspring_number:
+        first_parent, second_parent = random.sample(population, 2)
+        new_individuals = crossover([CrossoverTypesEnum.subtree, CrossoverTypesEnum.one_point],
+                                    first_parent, second_parent, requirements.max_depth, log,
+                                    requirements.crossover_prob, params)
+        offspring.extend(mutation(mutation_types, params, new_individual, requirements, log)
+                         for new_individual in new_individuals)
+    return offspring
+
+
+def get_requirements_and_params():
+    requirements = PipelineComposerRequirements(primary=['scaling', 'normalization', 'pca', 'knn', 'logit', 'rf'],
+                                                secondary=['logit', 'rf', 'knn', 'dt', 'scaling'],
+                                                max_depth=5, max_arity=3, mutation_prob=1., crossover_prob=1.)
+    params = GraphGenerationParams(advisor=PipelineChangeAdvisor(), adapter=PipelineAdapter())
+    return requirements, params
+
+
+def run_graph_copy_benchmark(pop_size: int = 50, repeats: int = 20, seed: int = 1):
+    """ Compares the time of copy of the population graphs by deepcopy and by the structural cloning """
+    requirements, params = get_requirements_and_params()
+    random.seed(seed)
+    np.random.seed(seed)
+    graphs = [individual.graph for individual in get_population(pop_size, requirements, params)]
+    for name, copy_graph in [('deepcopy', deepcopy), ('structural clone', OptGraph.clone)]:
+        copy_time = min(timeit.repeat(lambda: [copy_graph(graph) for graph in graphs], number=1, repeat=repeats))
+        print(f'Copy of graphs with {name}: {pop_size / copy_time:.1f} graphs/s')
+
+
+def run_genetic_operators_benchmark(pop_size: int = 50, offspring_number: int = 500, repeats: int = 3,
+                                    seed: int = 1):
+    """
+    Compares the number of offspring produced per second by crossover and mutation
+    with the structural cloning of graphs and with deepcopy of them
+    """
+    requirements, params = get_requirements_and_params()
+    random.seed(seed)
+    np.random.seed(seed)
+    population = get_population(pop_size, requirements, params)
+
+    rates = {}
+    for name, cloning in [('deepcopy', deepcopy_cloning), ('structural clone', nullcontext)]:
+        times = []
+        for repeat in range(repeats):
+            random.seed(seed + repeat)
+            np.random.seed(seed + repeat)
+            with cloning():
+                start_time = timeit.default_timer()
+                produce_offspring(population, offspring_number, requirements, params)
+                times.append(timeit.default_timer() - start_time)
+        rates[name] = offspring_number / min(times)
+        print(f'Reproduction with {name} of graphs: {rates[name]:.1f} offspring/s')
+    print(f'Speedup of reproduction: {rates["structural clone"] / rates["deepcopy"]:.2f}x')
+
+
+if __name__ == '__main__':
+    run_graph_copy_benchmark()
+    run_genetic_operators_benchmark()
@@ -0,0 +1,81 @@
+import timeit
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from fedot.core.data.data import InputData
+from fedot.core.data.data_preprocessing import divide_data_categorical_numerical, find_categorical_columns
+from fedot.core.data.supplementary_data import SupplementaryData
+from fedot.core.operations.evaluation.operation_implementations.data_operations.sklearn_transformations import \
+    ImputationImplementation
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+
+
+class ReferenceImputationImplementation(ImputationImplementation):
+    """ Imputation of the separate copies of categorical and numerical parts with the union
+    of them through pandas and the search of binary features on every transform as it was before """
+
+    def transform(self, input_data, is_fit_pipeline_stage: Optional[bool] = None):
+        features_types = input_data.supplementary_data.column_types.get('features')
+        self.categorical_ids, self.non_categorical_ids = find_categorical_columns(input_data.features,
+                                                                                  features_types)
+        numerical, categorical = divide_data_categorical_numerical(input_data, self.categorical_ids,
+                                                                   self.non_categorical_ids)
+        categorical_features = self.imputer_cat.transform(categorical.features)
+
+        numerical_features = numerical.features
+        binary_features = {}
+        df = pd.DataFrame(numerical_features)
+        for column_id, col in enumerate(df):
+            unique_values = df[col].dropna().unique()
+            if len(unique_values) <= 2:
+                binary_features[column_id] = {'min': min(unique_values), 'max': max(unique_values)}
+        self.ids_binary_integer_features = binary_features
+        numerical_features = self._correct_binary_ids_features(self.imputer_num.transform(numerical_features))
+
+        categorical_df = pd.DataFrame(categorical_features, columns=self.categorical_ids)
+        numerical_df = pd.DataFrame(numerical_features, columns=self.non_categorical_ids)
+        all_features_df = pd.concat([numerical_df, categorical_df], axis=1).sort_index(axis=1)
+        return self._convert_to_output(input_data, np.array(all_features_df), data_type=input_data.data_type)
+
+
+def get_mixed_table(rows_number: int, columns_number: int, seed: int = 1) -> InputData:
+    """ Table with numerical, binary and categorical columns (every fourth one) with 10% of gaps """
+    rng = np.random.default_rng(seed)
+    features = rng.normal(size=(rows_number, columns_number)).astype(object)
+    features[:, 1::4] = rng.integers(0, 2, size=(rows_number, len(range(1, columns_number, 4))))
+    categorical_ids = list(range(3, columns_number, 4))
+    categories = np.array(['a', 'b', 'c'], dtype=object)
+    features[:, categorical_ids] = categories[rng.integers(0, 3, size=(rows_number, len(categorical_ids)))]
+    features[rng.random((rows_number, columns_number)) < 0.1] = np.nan
+    column_types = [str(str) if column_id in categorical_ids else str(float) for column_id in range(columns_number)]
+    return InputData(idx=np.arange(rows_number), features=features, target=np.zeros(rows_number),
+                     task=Task(TaskTypesEnum.regression), data_type=DataTypesEnum.table,
+                     supplementary_data=SupplementaryData(column_types={'features': column_types}))
+
+
+def run_imputation_benchmark(shapes=((100, 20), (1000, 20), (10_000, 50), (100_000, 50)), repeats: int = 5):
+    """
+    Compares the time of transform of the mixed table by the imputation with the pandas union of parts
+    and the binary features search on every call and by the imputation into the preallocated table
+    """
+    for rows_number, columns_number in shapes:
+        input_data = get_mixed_table(rows_number, columns_number)
+        imputation, reference_imputation = ImputationImplementation(), ReferenceImputationImplementation()
+        imputation.fit(input_data)
+        reference_imputation.fit(input_data)
+
+        reference_time = min(timeit.repeat(lambda: reference_imputation.transform(input_data),
+                                           number=1, repeat=repeats))
+        imputation_time = min(timeit.repeat(lambda: imputation.transform(input_data), number=1, repeat=repeats))
+
+        assert pd.DataFrame(imputation.transform(input_data).predict).equals(
+            pd.DataFrame(reference_imputation.transform(input_data).predict))
+        print(f'{rows_number} rows, {columns_number} columns: transform with pandas union {reference_time:.4f} s, '
+              f'into preallocated table {imputation_time:.4f} s')
+
+
+if __name__ == '__main__':
+    run_imputation_benchmark()
@@ -0,0 +1,73 @@
+import os
+import resource
+import timeit
+from multiprocessing import get_context
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pandas as pd
+
+from fedot.core.composer.metrics import RMSE
+from fedot.core.data.data import InputData
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+
+
+def write_regression_csv(file_path: str, rows_number: int, columns_number: int,
+                         seed: int = 1, chunk_size: int = 100_000):
+    """ Writes regression table into the CSV by chunks to not to keep the whole table in memory """
+    # Train and test tables share the dependence of target on features
+    coefficients = np.random.default_rng(0).normal(size=columns_number)
+    rng = np.random.default_rng(seed)
+    for start in range(0, rows_number, chunk_size):
+        features = rng.normal(size=(min(chunk_size, rows_number - start), columns_number))
+        data_frame = pd.DataFrame(features, columns=[f'feature_{i}' for i in range(columns_number)],
+                                  index=np.arange(start, start + len(features)))
+        data_frame['target'] = features @ coefficients + np.sin(features[:, 0]) + \
+            rng.normal(scale=0.1, size=len(features))
+        data_frame.to_csv(file_path, mode='a', header=start == 0)
+
+
+def fit_pipeline(model: str, train_path: str, test_path: str, chunk_size: int = None):
+    """ Fit of the pipeline scaling -> model on the whole table or chunk by chunk in the separate process
+    to measure its peak memory """
+    task = Task(TaskTypesEnum.regression)
+    pipeline = Pipeline(SecondaryNode(model, nodes_from=[PrimaryNode('scaling')]))
+
+    start_time = timeit.default_timer()
+    if chunk_size is None:
+        pipeline.fit(InputData.from_csv(train_path, task=task))
+    else:
+        for chunk in InputData.from_csv_chunks(train_path, chunk_size=chunk_size, task=task):
+            pipeline.partial_fit(chunk)
+    fit_time = timeit.default_timer() - start_time
+
+    peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    test_data = InputData.from_csv(test_path, task=task)
+    return fit_time, peak_memory, RMSE.metric(test_data, pipeline.predict(test_data))
+
+
+def run_incremental_fit_benchmark(rows_number: int = 1_000_000, columns_number: int = 20,
+                                  chunk_size: int = 100_000, models=('sgdr', 'lgbmreg')):
+    """
+    Compares the peak memory (RSS), the time of fit and the quality of the pipeline scaling -> model
+    fitted on the whole table read from the CSV and fitted chunk by chunk with streaming of the CSV
+    """
+    context = get_context('spawn')
+    with TemporaryDirectory() as directory:
+        train_path, test_path = os.path.join(directory, 'train.csv'), os.path.join(directory, 'test.csv')
+        write_regression_csv(train_path, rows_number, columns_number)
+        write_regression_csv(test_path, 10_000, columns_number, seed=2)
+
+        for model in models:
+            for name, model_chunk_size in [('whole table', None), (f'chunks of {chunk_size} rows', chunk_size)]:
+                with context.Pool(1) as pool:
+                    fit_time, peak_memory, metric = pool.apply(fit_pipeline,
+                                                               (model, train_path, test_path, model_chunk_size))
+                print(f'{model}, fit on {name}: {fit_time:.2f} s, peak RSS {peak_memory:.0f} MB, '
+                      f'RMSE {metric:.4f}')
+
+
+if __name__ == '__main__':
+    run_incremental_fit_benchmark()
@@ -0,0 +1,83 @@
+import timeit
+from contextlib import contextmanager
+
+import numpy as np
+
+from fedot.core.data.data import InputData
+from fedot.core.operations.hyperparameters_preprocessing import HyperparametersPreprocessor
+from fedot.core.operations.operation import Operation, _eval_strategy_for_task
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+from fedot.core.utils import DEFAULT_PARAMS_STUB
+
+
+def reference_init(self, task: Task, **kwargs):
+    """ Resolution and creation of the evaluation strategy on every fit and predict as it was before """
+    params = kwargs.get('params')
+    params_for_fit = None
+    if params != DEFAULT_PARAMS_STUB:
+        params_for_fit = HyperparametersPreprocessor(operation_type=self.operation_type,
+                                                     n_samples_data=kwargs.get('n_samples_data')).correct(params)
+    self._eval_strategy = _eval_strategy_for_task(self.operation_type, task.task_type,
+                                                  self.operations_repo)(self.operation_type, params_for_fit)
+    if 'output_mode' in kwargs:
+        self._eval_strategy.output_mode = kwargs['output_mode']
+
+
+@contextmanager
+def strategy_created_on_every_call():
+    cached_init = Operation._init
+    Operation._init = reference_init
+    try:
+        yield
+    finally:
+        Operation._init = cached_init
+
+
+def get_classification_data(rows_number: int, seed: int = 1) -> InputData:
+    rng = np.random.default_rng(seed)
+    features = rng.normal(size=(rows_number, 10))
+    target = (features[:, 0] + rng.normal(size=rows_number) > 0).astype(int)
+    return InputData(idx=np.arange(rows_number), features=features, target=target,
+                     task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table)
+
+
+def get_ten_nodes_pipeline() -> Pipeline:
+    scaling_node, normalization_node = PrimaryNode('scaling'), PrimaryNode('normalization')
+    pca_node = SecondaryNode('pca', nodes_from=[scaling_node])
+    first_logit_node = SecondaryNode('logit', nodes_from=[scaling_node])
+    dt_node = SecondaryNode('dt', nodes_from=[normalization_node])
+    second_logit_node = SecondaryNode('logit', nodes_from=[pca_node])
+    second_scaling_node = SecondaryNode('scaling', nodes_from=[first_logit_node, dt_node])
+    third_logit_node = SecondaryNode('logit', nodes_from=[second_scaling_node, second_logit_node])
+    second_normalization_node = SecondaryNode('normalization', nodes_from=[third_logit_node])
+    return Pipeline(SecondaryNode('logit', nodes_from=[second_normalization_node]))
+
+
+def run_inference_overhead_benchmark(batch_size: int = 100, batches_number: int = 100):
+    """
+    Compares the time of prediction of the pipeline with 10 nodes on the small batches with
+    the evaluation strategies created on every predict and reused by the next predictions
+    """
+    pipeline = get_ten_nodes_pipeline()
+    pipeline.fit(get_classification_data(1000))
+    batches = [get_classification_data(batch_size, seed=seed) for seed in range(batches_number)]
+
+    def predict_batches():
+        return [pipeline.predict(batch).predict for batch in batches]
+
+    with strategy_created_on_every_call():
+        reference_time = min(timeit.repeat(predict_batches, number=1, repeat=3)) / batches_number
+        reference_predictions = predict_batches()
+    cached_time = min(timeit.repeat(predict_batches, number=1, repeat=3)) / batches_number
+
+    assert all(np.array_equal(reference, cached)
+               for reference, cached in zip(reference_predictions, predict_batches()))
+    print(f'{len(pipeline.nodes)} nodes, batches of {batch_size} rows: strategies created on every predict '
+          f'{reference_time * 1000:.2f} ms per batch, reused strategies {cached_time * 1000:.2f} ms per batch')
+
+
+if __name__ == '__main__':
+    run_inference_overhead_benchmark()
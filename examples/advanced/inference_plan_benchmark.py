@@ -0,0 +1,56 @@
+import timeit
+
+import numpy as np
+
+from fedot.core.data.data import InputData
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+
+
+def get_classification_data(rows_number: int, seed: int = 1) -> InputData:
+    rng = np.random.default_rng(seed)
+    features = rng.normal(size=(rows_number, 10))
+    target = (features[:, 0] + rng.normal(size=rows_number) > 0).astype(int)
+    return InputData(idx=np.arange(rows_number), features=features, target=target,
+                     task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table)
+
+
+def get_pipelines():
+    scaling_node = PrimaryNode('scaling')
+    pca_node = SecondaryNode('pca', nodes_from=[scaling_node])
+    logit_node = SecondaryNode('logit', nodes_from=[scaling_node, pca_node])
+    dt_node = SecondaryNode('dt', nodes_from=[PrimaryNode('normalization')])
+    return {'scaling -> logit': Pipeline(SecondaryNode('logit', nodes_from=[PrimaryNode('scaling')])),
+            'six nodes': Pipeline(SecondaryNode('logit', nodes_from=[logit_node, dt_node]))}
+
+
+def latency_percentiles(predict, batches):
+    """ Returns p50 and p99 latency of the predict function on the batches in milliseconds """
+    latencies = [timeit.timeit(lambda: predict(batch), number=1) for batch in batches]
+    return np.percentile(latencies, 50) * 1000, np.percentile(latencies, 99) * 1000
+
+
+def run_inference_plan_benchmark(batch_sizes=(1, 1000), batches_number: int = 300):
+    """
+    Compares p50/p99 latency of the prediction of the fitted pipeline on the batches of rows
+    by the 'predict' method of the pipeline and by the compiled inference plan of the pipeline
+    """
+    for name, pipeline in get_pipelines().items():
+        pipeline.fit(get_classification_data(2000))
+        plan = pipeline.compile_inference_plan(Task(TaskTypesEnum.classification))
+
+        for batch_size in batch_sizes:
+            batches = [get_classification_data(batch_size, seed=seed) for seed in range(batches_number)]
+
+            assert all(np.array_equal(pipeline.predict(batch).predict, plan.predict(batch.features))
+                       for batch in batches)
+            pipeline_p50, pipeline_p99 = latency_percentiles(pipeline.predict, batches)
+            plan_p50, plan_p99 = latency_percentiles(plan.predict, [batch.features for batch in batches])
+            print(f'{name}, batches of {batch_size} rows: Pipeline.predict p50 {pipeline_p50:.2f} ms, '
+                  f'p99 {pipeline_p99:.2f} ms; inference plan p50 {plan_p50:.3f} ms, p99 {plan_p99:.3f} ms')
+
+
+if __name__ == '__main__':
+    run_inference_plan_benchmark()
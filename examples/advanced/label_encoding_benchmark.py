@@ -0,0 +1,71 @@
+import timeit
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import LabelEncoder
+
+from fedot.core.data.data import InputData
+from fedot.core.data.supplementary_data import SupplementaryData
+from fedot.core.operations.evaluation.operation_implementations.data_operations.categorical_encoders import \
+    LabelEncodingImplementation
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+
+
+def get_high_cardinality_table(rows_number: int, categories_number: int, seed: int = 1) -> InputData:
+    """ Object table with the categorical column of high cardinality with gaps and the numerical column """
+    rng = np.random.default_rng(seed)
+    categories = np.array([f'id_{i}' for i in range(categories_number)], dtype=object)
+    features = np.empty((rows_number, 2), dtype=object)
+    features[:, 0] = categories[rng.integers(0, categories_number, size=rows_number)]
+    features[rng.random(rows_number) < 0.05, 0] = np.nan
+    features[:, 1] = rng.normal(size=rows_number)
+    supplementary_data = SupplementaryData(column_types={'features': [str(str), str(float)]})
+    return InputData(idx=np.arange(rows_number), features=features, target=np.zeros(rows_number),
+                     task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table,
+                     supplementary_data=supplementary_data)
+
+
+def reference_label_encoding(train_column: np.ndarray, column: np.ndarray) -> np.ndarray:
+    """ Encoding with LabelEncoder fitted on the string representations as it was before the hash index """
+    encoder = LabelEncoder()
+    encoder.fit(train_column.astype(str))
+    column = column.astype(str)
+    gap_ids = np.ravel(np.argwhere(column == 'nan'))
+    encoder_classes = list(encoder.classes_)
+    for label in list(set(column)):
+        if label not in encoder_classes:
+            encoder_classes.append(label)
+    encoder.classes_ = encoder_classes
+    transformed_column = encoder.transform(column).astype(object)
+    transformed_column[gap_ids] = np.nan
+    return transformed_column
+
+
+def run_label_encoding_benchmark(rows_number: int = 200_000, categories_numbers=(100, 10_000, 100_000)):
+    """
+    Compares the time of the fit and transform of the label encoding of high cardinality column
+    by LabelEncoder and by the hash index of categories
+    """
+    for categories_number in categories_numbers:
+        input_data = get_high_cardinality_table(rows_number, categories_number)
+        train_column = input_data.features[:, 0]
+        train_column = train_column[~pd.isna(train_column)]
+
+        start_time = timeit.default_timer()
+        reference = reference_label_encoding(train_column, input_data.features[:, 0])
+        reference_time = timeit.default_timer() - start_time
+
+        start_time = timeit.default_timer()
+        encoder = LabelEncodingImplementation()
+        encoder.fit(input_data)
+        encoded = encoder.transform(input_data, is_fit_pipeline_stage=True).predict[:, 0]
+        hash_index_time = timeit.default_timer() - start_time
+
+        assert pd.Series(encoded).equals(pd.Series(reference))
+        print(f'{categories_number} categories: LabelEncoder {reference_time:.2f} s, '
+              f'hash index {hash_index_time:.2f} s')
+
+
+if __name__ == '__main__':
+    run_label_encoding_benchmark()
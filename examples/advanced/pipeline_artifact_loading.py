@@ -0,0 +1,103 @@
+import os
+import shutil
+import tempfile
+from multiprocessing import get_context
+from statistics import mean
+from timeit import repeat
+
+import numpy as np
+
+from fedot.core.data.data import InputData
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+
+
+def get_ensemble_pipeline(branches_number: int = 13) -> Pipeline:
+    """ Returns the ensemble with 3 * branches_number + 1 nodes """
+    branches = []
+    for _ in range(branches_number):
+        scaling_node = PrimaryNode('scaling')
+        pca_node = SecondaryNode('pca', nodes_from=[scaling_node])
+        pca_node.custom_params = {'n_components': 0.99}
+        branches.append(SecondaryNode('ridge', nodes_from=[pca_node]))
+    return Pipeline(SecondaryNode('ridge', nodes_from=branches))
+
+
+def get_regression_data(samples: int = 20000, features: int = 300) -> InputData:
+    features_array = np.random.rand(samples, features)
+    target = features_array @ np.random.rand(features)
+    return InputData(idx=np.arange(samples), features=features_array, target=target,
+                     task=Task(TaskTypesEnum.regression), data_type=DataTypesEnum.table)
+
+
+def _proportional_memory_in_mb() -> float:
+    """ Returns proportional set size of the current process (shared pages are divided between processes) """
+    with open('/proc/self/smaps_rollup') as smaps:
+        for line in smaps:
+            if line.startswith('Pss:'):
+                return int(line.split()[1]) / 1024
+    return float('nan')
+
+
+def _load_replica(args):
+    load_function, path, barrier = args
+    # Import all the modules required by the operations before the measurement
+    get_ensemble_pipeline(branches_number=1)
+    before = _proportional_memory_in_mb()
+    pipeline = load_function(path)
+    # Wait for all the replicas to load the pipeline, so the shared pages are divided between them
+    barrier.wait()
+    after = _proportional_memory_in_mb()
+    barrier.wait()
+    return after - before, pipeline.is_fitted
+
+
+def load_template(path: str) -> Pipeline:
+    pipeline = Pipeline()
+    pipeline.load(path)
+    return pipeline
+
+
+def load_artifact(path: str) -> Pipeline:
+    pipeline = Pipeline()
+    pipeline.load_artifact(path)
+    return pipeline
+
+
+def run_artifact_loading_comparison(replicas: int = 4, load_repeats: int = 5):
+    """
+    Compares loading time and per-replica memory of the pipeline stored with
+    the JSON template (one pickle file per operation) and with the single-file binary artifact
+    """
+    data = get_regression_data()
+    pipeline = get_ensemble_pipeline()
+    pipeline.fit(data)
+    print(f'Pipeline with {pipeline.length} nodes is fitted')
+
+    save_dir = tempfile.mkdtemp()
+    try:
+        pipeline.save(os.path.join(save_dir, 'template'), datetime_in_path=False)
+        template_path = os.path.join(save_dir, 'template', 'template.json')
+        artifact_path = pipeline.save_artifact(os.path.join(save_dir, 'pipeline.fedot'))
+
+        is_linux = os.path.exists('/proc/self/smaps_rollup')
+        for name, load_function, path in [('template', load_template, template_path),
+                                          ('artifact', load_artifact, artifact_path)]:
+            load_time = mean(repeat(lambda: load_function(path), repeat=load_repeats, number=1))
+            message = f'{name}: mean loading time {load_time:.3f} s'
+
+            if is_linux:
+                manager = get_context('spawn').Manager()
+                barrier = manager.Barrier(replicas)
+                with get_context('spawn').Pool(replicas) as pool:
+                    results = pool.map(_load_replica, [(load_function, path, barrier)] * replicas)
+                message += f', mean memory per replica {mean(memory for memory, _ in results):.1f} MB'
+            print(message)
+    finally:
+        shutil.rmtree(save_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    run_artifact_loading_comparison()
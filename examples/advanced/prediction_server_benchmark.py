@@ -0,0 +1,59 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import TemporaryDirectory
+from urllib.request import Request, urlopen
+
+import numpy as np
+
+from fedot.core.data.data import InputData
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+from fedot.remote.prediction_server import PredictionServer, ServedPipeline
+
+
+def get_classification_data(rows_number: int, seed: int = 1) -> InputData:
+    rng = np.random.default_rng(seed)
+    features = rng.normal(size=(rows_number, 10))
+    target = (features[:, 0] + rng.normal(size=rows_number) > 0).astype(int)
+    return InputData(idx=np.arange(rows_number), features=features, target=target,
+                     task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table)
+
+
+def request_prediction(url: str, row: np.ndarray) -> list:
+    request = Request(url, data=json.dumps({'features': row.tolist()}).encode('utf-8'),
+                      headers={'Content-Type': 'application/json'})
+    with urlopen(request) as response:
+        return json.loads(response.read())['predict']
+
+
+def run_prediction_server_benchmark(requests_number: int = 3000, clients_number: int = 16,
+                                    workers_number: int = 2):
+    """
+    Compares the throughput and p50/p99 latency of the local prediction server for concurrent
+    single-row requests from the clients with and without micro-batching of the requests
+    """
+    pipeline = Pipeline(SecondaryNode('logit', nodes_from=[PrimaryNode('scaling')]))
+    pipeline.fit(get_classification_data(2000))
+    rows = get_classification_data(requests_number, seed=2).features
+
+    with TemporaryDirectory() as directory:
+        artifact_path = pipeline.save_artifact(os.path.join(directory, 'pipeline.fedot'))
+        served_pipelines = {'logit': ServedPipeline(artifact_path, Task(TaskTypesEnum.classification))}
+
+        for name, max_batch_size in [('without batching', 1), ('with micro-batching', 1000)]:
+            with PredictionServer(served_pipelines, workers_number=workers_number,
+                                  max_batch_size=max_batch_size) as server:
+                url = f'{server.url}/predict/logit'
+                with ThreadPoolExecutor(clients_number) as executor:
+                    list(executor.map(lambda row: request_prediction(url, row), rows))
+                stats = server.stats()
+            print(f'{name}: {stats["requests_per_second"]:.0f} requests per second, '
+                  f'{stats["mean_batch_rows"]:.1f} rows per batch, latency p50 {stats["latency_p50_ms"]:.2f} ms, '
+                  f'p99 {stats["latency_p99_ms"]:.2f} ms')
+
+
+if __name__ == '__main__':
+    run_prediction_server_benchmark()
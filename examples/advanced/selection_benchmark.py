@@ -0,0 +1,130 @@
+import math
+import random
+import timeit
+from copy import copy
+from typing import List
+
+from fedot.core.composer.advisor import PipelineChangeAdvisor
+from fedot.core.composer.gp_composer.gp_composer import PipelineComposerRequirements
+from fedot.core.optimisers.adapters import PipelineAdapter
+from fedot.core.optimisers.fitness.fitness import SingleObjFitness
+from fedot.core.optimisers.gp_comp.gp_operators import random_graph
+from fedot.core.optimisers.gp_comp.individual import Individual, graph_structural_hash
+from fedot.core.optimisers.gp_comp.operators.selection import SelectionTypesEnum, individuals_selection
+from fedot.core.optimisers.graph import OptGraph, OptNode
+from fedot.core.optimisers.optimizer import GraphGenerationParams
+
+
+def get_population(size: int) -> List[Individual]:
+    population = []
+    for _ in range(size):
+        individual = Individual(OptGraph(OptNode('model')))
+        individual.fitness = SingleObjFitness(random.random())
+        population.append(individual)
+    return population
+
+
+def reference_individuals_selection(individuals: List[Individual], pop_size: int) -> List[Individual]:
+    """ Implementation of the tournament-based individuals_selection with the membership checks over lists """
+
+    def random_selection(individuals, pop_size):
+        chosen = []
+        n_iter = 0
+        while len(chosen) < pop_size and n_iter < pop_size * 10:
+            if not individuals:
+                return []
+            if len(individuals) <= 1:
+                return [individuals[0]] * pop_size
+            individual = random.choice(individuals)
+            if individual.uid not in (c.uid for c in chosen):
+                chosen.append(individual)
+        return chosen
+
+    def tournament_selection(individuals, pop_size, fraction=0.1):
+        group_size = math.ceil(len(individuals) * fraction)
+        min_group_size = 2 if len(individuals) > 1 else 1
+        group_size = max(group_size, min_group_size)
+        chosen = []
+        n_iter = 0
+        while len(chosen) < pop_size and n_iter < pop_size * 10:
+            group = random_selection(individuals, group_size)
+            best = min(group, key=lambda ind: ind.fitness)
+            if best.uid not in (c.uid for c in chosen):
+                chosen.append(best)
+            n_iter += 1
+        return chosen
+
+    chosen = []
+    remaining_individuals = individuals
+    individuals_pool_size = len(individuals)
+    n_iter = 0
+    while len(chosen) < pop_size and n_iter < pop_size * 10 and remaining_individuals:
+        random.choice([SelectionTypesEnum.tournament])
+        individual = tournament_selection(remaining_individuals, pop_size=1)[0]
+        if individual.uid not in (c.uid for c in chosen):
+            chosen.append(individual)
+            if pop_size <= individuals_pool_size:
+                remaining_individuals.remove(individual)
+        n_iter += 1
+    return chosen
+
+
+def run_selection_benchmark(pop_sizes=(50, 100, 200, 500, 1000, 2000), seed: int = 1):
+    """
+    Measures the time of the selection of the next population from the previous and the new ones
+    (as in the steady-state genetic scheme) and compares the selected individuals with the ones
+    selected by the implementation with the membership checks over lists
+    """
+    for pop_size in pop_sizes:
+        individuals = get_population(2 * pop_size)
+
+        random.seed(seed)
+        start_time = timeit.default_timer()
+        reference = reference_individuals_selection(copy(individuals), pop_size)
+        reference_time = timeit.default_timer() - start_time
+
+        random.seed(seed)
+        start_time = timeit.default_timer()
+        selected = individuals_selection([SelectionTypesEnum.tournament], copy(individuals), pop_size, None)
+        selection_time = timeit.default_timer() - start_time
+
+        assert [ind.uid for ind in selected] == [ind.uid for ind in reference]
+        print(f'Population size {pop_size}: selection with list membership {reference_time:.3f} s, '
+              f'with uid sets {selection_time:.3f} s, same individuals selected')
+
+
+def run_deduplication_benchmark(pop_sizes=(50, 100, 200, 500, 1000, 2000)):
+    """
+    Compares the deduplication of randomly generated pipelines with the membership check over the list
+    (individuals are compared by uid, so equal graphs aren't detected) and with the set of structural hashes
+    """
+    requirements = PipelineComposerRequirements(primary=['scaling', 'knn', 'logit', 'rf'],
+                                                secondary=['logit', 'rf', 'knn'], max_depth=4)
+    params = GraphGenerationParams(advisor=PipelineChangeAdvisor(), adapter=PipelineAdapter())
+    for pop_size in pop_sizes:
+        individuals = [Individual(random_graph(params, requirements)) for _ in range(pop_size)]
+
+        start_time = timeit.default_timer()
+        list_population = []
+        for individual in individuals:
+            if individual not in list_population:
+                list_population.append(individual)
+        list_time = timeit.default_timer() - start_time
+
+        start_time = timeit.default_timer()
+        hash_population, population_hashes = [], set()
+        for individual in individuals:
+            individual_hash = graph_structural_hash(individual.graph)
+            if individual_hash not in population_hashes:
+                population_hashes.add(individual_hash)
+                hash_population.append(individual)
+        hash_time = timeit.default_timer() - start_time
+
+        print(f'Population size {pop_size}: deduplication with list membership {list_time:.3f} s '
+              f'({len(list_population)} individuals left), with structural hashes {hash_time:.3f} s '
+              f'({len(hash_population)} unique graphs left)')
+
+
+if __name__ == '__main__':
+    run_selection_benchmark()
+    run_deduplication_benchmark()
@@ -0,0 +1,75 @@
+import timeit
+from copy import deepcopy
+
+import numpy as np
+
+from fedot.core.composer.metrics import MSE
+from fedot.core.data.data import InputData
+from fedot.core.data.data_split import train_test_data_setup
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+from fedot.sensitivity.operations_hp_sensitivity.multi_operations_sensitivity import MultiOperationsHPAnalyze
+from fedot.sensitivity.operations_hp_sensitivity.problem import MultiOperationsProblem
+from fedot.sensitivity.sa_requirements import SensitivityAnalysisRequirements
+
+
+def get_pipeline() -> Pipeline:
+    """ Pipeline with the prefix (scaling -> lgbmreg) without hyperparameters to sample """
+    lgbm_node = SecondaryNode('lgbmreg', nodes_from=[PrimaryNode('scaling')])
+    ridge_node = SecondaryNode('ridge', nodes_from=[lgbm_node])
+    knn_node = SecondaryNode('knnreg', nodes_from=[lgbm_node])
+    return Pipeline(SecondaryNode('ridge', nodes_from=[ridge_node, knn_node]))
+
+
+def get_regression_data(samples: int = 5000, features: int = 50):
+    features_array = np.random.rand(samples, features)
+    target = np.sin(features_array[:, 0] * 5) + features_array @ np.random.rand(features)
+    data = InputData(idx=np.arange(samples), features=features_array, target=target,
+                     task=Task(TaskTypesEnum.regression), data_type=DataTypesEnum.table)
+    return train_test_data_setup(data)
+
+
+def sequential_response_matrix(samples, train_data: InputData, test_data: InputData) -> np.array:
+    """ Every sample is fitted from scratch one by one """
+    responses = []
+    for sample in samples:
+        sample = deepcopy(sample)
+        sample.fit(train_data)
+        responses.append(MSE.metric(test_data, sample.predict(test_data)))
+    return np.array(responses)
+
+
+def run_hp_analysis_evaluation_comparison(sample_size: int = 8, n_jobs: int = -1):
+    """
+    Compares time of evaluation of the hyperparameters samples for Sobol analysis:
+    sequential fitting of every sample from scratch and the evaluation in the pool of processes
+    with reuse of the fitted prefix of the pipeline and deduplication of samples
+    """
+    train_data, test_data = get_regression_data()
+    pipeline = get_pipeline()
+
+    requirements = SensitivityAnalysisRequirements(hyperparams_analysis_samples_size=sample_size, n_jobs=n_jobs)
+    analyzer = MultiOperationsHPAnalyze(pipeline=pipeline, train_data=train_data, test_data=test_data,
+                                        requirements=requirements)
+    analyzer.problem = MultiOperationsProblem([node.operation.operation_type for node in pipeline.nodes])
+    samples = analyzer.sample(sample_size)
+    unique_samples = len({sample.root_node.descriptive_id for sample in samples})
+    print(f'Samples: {len(samples)}, unique samples: {unique_samples}')
+
+    start_time = timeit.default_timer()
+    sequential_response = sequential_response_matrix(samples, train_data, test_data)
+    sequential_time = timeit.default_timer() - start_time
+
+    start_time = timeit.default_timer()
+    response = analyzer._get_response_matrix(samples)
+    parallel_time = timeit.default_timer() - start_time
+
+    print(f'Sequential evaluation time: {sequential_time:.2f} s')
+    print(f'Evaluation with the pool of processes and the fitted prefix reuse: {parallel_time:.2f} s')
+    print(f'Max absolute difference of the responses: {np.max(np.abs(response - sequential_response))}')
+
+
+if __name__ == '__main__':
+    run_hp_analysis_evaluation_comparison()
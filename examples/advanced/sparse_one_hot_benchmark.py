@@ -0,0 +1,73 @@
+import timeit
+from contextlib import contextmanager, nullcontext
+
+import numpy as np
+from scipy import sparse
+
+from fedot.core.data.data import InputData
+from fedot.core.data.data_split import train_test_data_setup
+from fedot.core.data.supplementary_data import SupplementaryData
+from fedot.core.operations.evaluation.operation_implementations.data_operations import categorical_encoders
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+
+
+@contextmanager
+def dense_one_hot_encoding():
+    """ Makes One Hot Encoding return dense tables for any number of categories as it was before """
+    min_encoded_columns = categorical_encoders.MIN_ENCODED_COLUMNS_FOR_SPARSE
+    categorical_encoders.MIN_ENCODED_COLUMNS_FOR_SPARSE = np.inf
+    try:
+        yield
+    finally:
+        categorical_encoders.MIN_ENCODED_COLUMNS_FOR_SPARSE = min_encoded_columns
+
+
+def get_high_cardinality_data(rows_number: int, categories_number: int, seed: int = 1) -> InputData:
+    """ Classification data with two categorical columns of high cardinality and two numerical columns """
+    rng = np.random.default_rng(seed)
+    features = np.empty((rows_number, 4), dtype=object)
+    for column_id, prefix in enumerate(['user', 'item']):
+        categories = np.array([f'{prefix}_{i}' for i in range(categories_number)], dtype=object)
+        features[:, column_id] = categories[rng.integers(0, categories_number, size=rows_number)]
+    features[:, 2:] = rng.normal(size=(rows_number, 2))
+    target = (features[:, 2].astype(float) + rng.normal(size=rows_number) > 0).astype(int)
+    supplementary_data = SupplementaryData(column_types={'features': [str(str)] * 2 + [str(float)] * 2})
+    return InputData(idx=np.arange(rows_number), features=features, target=target,
+                     task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table,
+                     supplementary_data=supplementary_data)
+
+
+def table_size_in_mb(table) -> float:
+    if sparse.issparse(table):
+        return (table.data.nbytes + table.indices.nbytes + table.indptr.nbytes) / 1024 ** 2
+    return table.nbytes / 1024 ** 2
+
+
+def run_sparse_one_hot_benchmark(rows_number: int = 20_000, categories_numbers=(500, 1000, 2000)):
+    """
+    Compares the size of the encoded table and the time of fit and predict of the pipeline
+    one_hot_encoding -> logit with the dense and the sparse encoded tables
+    """
+    for categories_number in categories_numbers:
+        train_data, test_data = train_test_data_setup(get_high_cardinality_data(rows_number, categories_number))
+        for name, encoding in [('dense', dense_one_hot_encoding), ('sparse', nullcontext)]:
+            with encoding():
+                encoding_node = PrimaryNode('one_hot_encoding')
+                pipeline = Pipeline(SecondaryNode('logit', nodes_from=[encoding_node]))
+
+                start_time = timeit.default_timer()
+                pipeline.fit(train_data)
+                predicted = pipeline.predict(test_data)
+                pipeline_time = timeit.default_timer() - start_time
+
+                encoded = encoding_node.fitted_operation.transform(train_data, True).predict
+            print(f'{categories_number} categories per column, {name} encoding: '
+                  f'encoded table {table_size_in_mb(encoded):.1f} MB, fit and predict {pipeline_time:.2f} s, '
+                  f'mean probability {np.mean(predicted.predict):.4f}')
+
+
+if __name__ == '__main__':
+    run_sparse_one_hot_benchmark()
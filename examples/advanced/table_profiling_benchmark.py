@@ -0,0 +1,73 @@
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from fedot.core.data.data import InputData
+from fedot.core.data.data_preprocessing import TableProfile
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+
+
+def get_object_table(rows_number: int, seed: int = 1) -> InputData:
+    """ Object table with numerical column, numerical column with nans and categorical column """
+    rng = np.random.default_rng(seed)
+    features = np.empty((rows_number, 3), dtype=object)
+    features[:, 0] = rng.normal(size=rows_number)
+    with_nans = rng.normal(size=rows_number)
+    with_nans[rng.random(rows_number) < 0.1] = np.nan
+    features[:, 1] = with_nans
+    categories = np.array([f'category_{i}' for i in range(30)], dtype=object)
+    features[:, 2] = categories[rng.integers(0, len(categories), size=rows_number)]
+    return InputData(idx=np.arange(rows_number), features=features, target=np.zeros(rows_number),
+                     task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table)
+
+
+def reference_categorical_determination(table: np.ndarray):
+    """ Search of the first string in every column element by element as it was before the profiling """
+    categorical_ids, non_categorical_ids = [], []
+    for column_id in range(table.shape[1]):
+        if any(isinstance(element, str) for element in table[:, column_id]):
+            categorical_ids.append(column_id)
+        else:
+            non_categorical_ids.append(column_id)
+    return categorical_ids, non_categorical_ids
+
+
+def reference_has_missing_values(table: np.ndarray) -> bool:
+    return pd.DataFrame(table).isna().sum().sum() > 0
+
+
+def reference_cardinality(table: np.ndarray, categorical_ids) -> int:
+    return sum(np.unique(table[:, column_id].astype(str)).shape[0] for column_id in categorical_ids)
+
+
+def run_table_profiling_benchmark(rows_numbers=(100_000, 1_000_000, 10_000_000)):
+    """
+    Compares the time of the search of categorical columns, the check of missing values and the estimation
+    of categorical cardinality by the element by element scans and by the vectorized profile of the table
+    """
+    for rows_number in rows_numbers:
+        table = get_object_table(rows_number).features
+
+        start_time = timeit.default_timer()
+        reference_ids = reference_categorical_determination(table)
+        reference_missing = reference_has_missing_values(table)
+        reference_total_cardinality = reference_cardinality(table, reference_ids[0])
+        reference_time = timeit.default_timer() - start_time
+
+        start_time = timeit.default_timer()
+        profile = TableProfile(table)
+        profile_ids = profile.categorical_ids, profile.non_categorical_ids
+        profile_missing = profile.has_missing_values
+        profile_total_cardinality = sum(profile.cardinality.values())
+        profile_time = timeit.default_timer() - start_time
+
+        assert profile_ids == reference_ids and profile_missing == reference_missing
+        assert profile_total_cardinality == reference_total_cardinality
+        print(f'{rows_number} rows: element by element scans {reference_time:.2f} s, '
+              f'vectorized profile {profile_time:.2f} s')
+
+
+if __name__ == '__main__':
+    run_table_profiling_benchmark()
@@ -0,0 +1,56 @@
+import timeit
+
+import numpy as np
+
+from fedot.core.data.data import InputData
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.pipelines.ts_wrappers import out_of_sample_ts_forecast, out_of_sample_ts_forecast_batch
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum, TsForecastingParams
+
+
+def generate_series(series_number: int, length: int) -> np.array:
+    """ Generates sine waves with different periods and noise """
+    periods = np.random.uniform(5, 50, size=(series_number, 1))
+    time_range = np.arange(length)
+    return np.sin(2 * np.pi * time_range / periods) + np.random.normal(scale=0.1, size=(series_number, length))
+
+
+def run_batch_forecasting_comparison(series_number: int = 5000, length: int = 200,
+                                     forecast_length: int = 7, horizon: int = 28):
+    """
+    Compares time of the out-of-sample forecasting for many time series with the same
+    pipeline: series by series with 'out_of_sample_ts_forecast' and for the whole batch
+    with 'out_of_sample_ts_forecast_batch'
+    """
+    task = Task(TaskTypesEnum.ts_forecasting, TsForecastingParams(forecast_length=forecast_length))
+    series = generate_series(series_number, length)
+
+    # The pipeline is fitted on one of the time series
+    node_lagged = PrimaryNode('lagged')
+    node_lagged.custom_params = {'window_size': 30}
+    pipeline = Pipeline(SecondaryNode('ridge', nodes_from=[node_lagged]))
+    pipeline.fit(InputData(idx=np.arange(length), features=series[0], target=series[0],
+                           task=task, data_type=DataTypesEnum.ts))
+
+    start_time = timeit.default_timer()
+    one_by_one_forecast = [
+        out_of_sample_ts_forecast(pipeline, InputData(idx=np.arange(length, length + forecast_length),
+                                                      features=ts, target=None, task=task,
+                                                      data_type=DataTypesEnum.ts), horizon)
+        for ts in series]
+    one_by_one_time = timeit.default_timer() - start_time
+
+    start_time = timeit.default_timer()
+    batch_forecast = out_of_sample_ts_forecast_batch(pipeline, series, task, horizon)
+    batch_time = timeit.default_timer() - start_time
+
+    print(f'Series: {series_number}, horizon: {horizon}')
+    print(f'One by one forecasting time: {one_by_one_time:.2f} s')
+    print(f'Batch forecasting time: {batch_time:.2f} s')
+    print(f'Max absolute difference: {np.max(np.abs(np.array(one_by_one_forecast) - batch_forecast))}')
+
+
+if __name__ == '__main__':
+    run_batch_forecasting_comparison()
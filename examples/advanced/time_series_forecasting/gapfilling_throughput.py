@@ -0,0 +1,58 @@
+import timeit
+
+import numpy as np
+
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.utilities.ts_gapfilling import ModelGapFiller
+
+
+def get_series_with_gaps(length: int, gaps_number: int, max_gap_length: int = 10,
+                         gap_value: float = -100.0) -> np.array:
+    """ Generates noisy sine wave with gaps of random length in random places """
+    time_range = np.arange(length)
+    series = np.sin(2 * np.pi * time_range / 50) + np.random.normal(scale=0.1, size=length)
+
+    gaps_starts = np.sort(np.random.choice(np.arange(100, length - max_gap_length), gaps_number, replace=False))
+    for gap_start in gaps_starts:
+        series[gap_start:gap_start + np.random.randint(1, max_gap_length + 1)] = gap_value
+    return series
+
+
+def get_gapfilling_pipeline() -> Pipeline:
+    node_lagged = PrimaryNode('lagged')
+    node_lagged.custom_params = {'window_size': 10}
+    return Pipeline(SecondaryNode('ridge', nodes_from=[node_lagged]))
+
+
+def run_gapfilling_throughput_comparison(length: int = 20000, gaps_number: int = 1000,
+                                         max_train_length: int = 300, n_jobs: int = -1):
+    """
+    Compares throughput (filled gaps per second) of the forward gap-filling:
+    with the training on all the elements before the gap (every gap depends on all the previous ones)
+    and with the limited training part, when independent gaps are filled in the pool of processes
+    """
+    gap_value = -100.0
+    series = get_series_with_gaps(length, gaps_number, gap_value=gap_value)
+    gaps_number = len(ModelGapFiller(gap_value, None)._parse_gap_ids(np.flatnonzero(series == gap_value)))
+    print(f'Series length: {length}, gaps: {gaps_number}')
+
+    modes = {'all previous elements, sequential': dict(),
+             f'last {max_train_length} elements, sequential': dict(max_train_length=max_train_length),
+             f'last {max_train_length} elements, parallel': dict(max_train_length=max_train_length, n_jobs=n_jobs)}
+    for mode_name, params in modes.items():
+        gapfiller = ModelGapFiller(gap_value=gap_value, pipeline=get_gapfilling_pipeline(), **params)
+        levels_number = len(gapfiller._gaps_dependency_levels(
+            gapfiller._parse_gap_ids(np.flatnonzero(series == gap_value))))
+
+        start_time = timeit.default_timer()
+        filled_series = gapfiller.forward_filling(series)
+        filling_time = timeit.default_timer() - start_time
+
+        assert not np.any(filled_series == gap_value)
+        print(f'Training on {mode_name}: {levels_number} groups of independent gaps, '
+              f'{filling_time:.1f} s, {gaps_number / filling_time:.1f} gaps/s')
+
+
+if __name__ == '__main__':
+    run_gapfilling_throughput_comparison()
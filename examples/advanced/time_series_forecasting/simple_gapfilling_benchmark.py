@@ -0,0 +1,62 @@
+import timeit
+
+import numpy as np
+
+from fedot.utilities.ts_gapfilling import SimpleGapFiller
+from test.unit.tasks.test_gapfilling import reference_batch_poly_approximation, reference_local_poly_approximation
+
+
+def get_series_with_scattered_gaps(length: int, gaps_share: float = 0.01, max_gap_length: int = 20,
+                                   gap_value: float = -100.0) -> np.array:
+    """ Generates noisy sine wave with gaps of random length in random places """
+    time_range = np.arange(length)
+    series = np.sin(2 * np.pi * time_range / 1440) + np.random.normal(scale=0.1, size=length)
+
+    gaps_number = max(1, int(length * gaps_share / ((max_gap_length + 1) / 2)))
+    gaps_starts = np.random.randint(0, length - max_gap_length, gaps_number)
+    gaps_lengths = np.random.randint(1, max_gap_length + 1, gaps_number)
+    gaps_borders = np.zeros(length + 1, dtype=int)
+    np.add.at(gaps_borders, gaps_starts, 1)
+    np.add.at(gaps_borders, gaps_starts + gaps_lengths, -1)
+    series[np.cumsum(gaps_borders[:-1]) > 0] = gap_value
+    return series
+
+
+def run_simple_gapfilling_benchmark(check_length: int = 10 ** 5, length: int = 10 ** 7):
+    """
+    Compares the polynomial approximations of SimpleGapFiller with the gap by gap implementations
+    on the series of check_length elements and measures the time of gap-filling of the series
+    with length elements (e.g. 10^7 is about 19 years of minute-resolution data)
+    """
+    gap_value = -100.0
+    gapfiller = SimpleGapFiller(gap_value=gap_value)
+    methods = {'local_poly_approximation': (gapfiller.local_poly_approximation, reference_local_poly_approximation),
+               'batch_poly_approximation': (gapfiller.batch_poly_approximation, reference_batch_poly_approximation)}
+
+    check_series = get_series_with_scattered_gaps(check_length, gap_value=gap_value)
+    series = get_series_with_scattered_gaps(length, gap_value=gap_value)
+    print(f'Gaps in the series: {np.sum(check_series == gap_value)} of {check_length}, '
+          f'{np.sum(series == gap_value)} of {length}')
+
+    for method_name, (method, reference_method) in methods.items():
+        start_time = timeit.default_timer()
+        reference = reference_method(check_series, gap_value)
+        reference_time = timeit.default_timer() - start_time
+
+        start_time = timeit.default_timer()
+        filled = method(check_series)
+        check_time = timeit.default_timer() - start_time
+
+        start_time = timeit.default_timer()
+        filled_long = method(series)
+        filling_time = timeit.default_timer() - start_time
+
+        assert not np.any(filled_long == gap_value)
+        print(f'{method_name}: {check_length} elements - gap by gap {reference_time:.2f} s, '
+              f'vectorized {check_time:.2f} s, max relative difference '
+              f'{np.max(np.abs(filled - reference) / np.maximum(np.abs(reference), 1)):.2e}; '
+              f'{length} elements - vectorized {filling_time:.2f} s')
+
+
+if __name__ == '__main__':
+    run_simple_gapfilling_benchmark()
@@ -0,0 +1,83 @@
+import tempfile
+from typing import List, Optional
+
+import numpy as np
+from sklearn.datasets import make_friedman1
+from sklearn.metrics import mean_squared_error
+
+from fedot.core.data.data import InputData
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.pipelines.tuning.trials_store import TuningTrialsStore
+from fedot.core.pipelines.tuning.unified import PipelineTuner
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+
+
+def get_daily_data(day: int, rows_per_day: int = 100, initial_rows: int = 2000) -> InputData:
+    """ Regression data extended with the new rows every day """
+    features, target = make_friedman1(n_samples=initial_rows + rows_per_day * day, noise=1.0, random_state=0)
+    return InputData(idx=np.arange(len(target)), features=features, target=target,
+                     task=Task(TaskTypesEnum.regression), data_type=DataTypesEnum.table)
+
+
+def get_pipeline() -> Pipeline:
+    return Pipeline(SecondaryNode('dtreg', nodes_from=[PrimaryNode('scaling')]))
+
+
+def tune_with_losses_record(data: InputData, iterations: int,
+                            trials_store: Optional[TuningTrialsStore] = None) -> List[float]:
+    """ Tunes the pipeline and returns the values of loss in order of the evaluations
+    (including the initial and the final checks) """
+    losses = []
+
+    def rmse(target, predict):
+        loss = mean_squared_error(target, predict, squared=False)
+        # Tuner calls the loss on the toy arrays to define the direction of optimization
+        if len(target) > 2:
+            losses.append(loss)
+        return loss
+
+    tuner = PipelineTuner(get_pipeline(), data.task, iterations=iterations, timeout=None,
+                          trials_store=trials_store)
+    tuner.tune_pipeline(data, loss_function=rmse)
+    return losses
+
+
+def iterations_to_target(losses: List[float], target: float) -> Optional[int]:
+    reached = np.flatnonzero(np.array(losses) <= target)
+    return int(reached[0]) + 1 if len(reached) else None
+
+
+def run_tuning_warm_start_benchmark(iterations: int = 100, warm_iterations: int = 30,
+                                    repeats: int = 5, target_deviation: float = 0.01):
+    """
+    Compares the number of evaluations required to reach the target loss on the updated data
+    for the tuning from scratch and for the tuning warm-started from the trials of the previous day.
+    The target is the best loss of the tuning from scratch with deviation of target_deviation
+    """
+    yesterday_data, today_data = get_daily_data(day=0), get_daily_data(day=1)
+    cold_evaluations, warm_evaluations = [], []
+    for repeat in range(repeats):
+        cold_losses = tune_with_losses_record(today_data, iterations)
+        target = min(cold_losses) * (1 + target_deviation)
+
+        with tempfile.TemporaryDirectory() as store_path:
+            trials_store = TuningTrialsStore(store_path)
+            tune_with_losses_record(yesterday_data, iterations, trials_store)
+            warm_losses = tune_with_losses_record(today_data, warm_iterations, trials_store)
+
+        cold_evaluations.append(iterations_to_target(cold_losses, target))
+        warm_evaluations.append(iterations_to_target(warm_losses, target))
+        print(f'Repeat {repeat}: target RMSE {target:.3f}, evaluations to reach it: '
+              f'from scratch {cold_evaluations[-1]} of {len(cold_losses)}, '
+              f'warm-started {warm_evaluations[-1]} of {len(warm_losses)}')
+
+    for name, evaluations in [('from scratch', cold_evaluations), ('warm-started', warm_evaluations)]:
+        reached = [number for number in evaluations if number is not None]
+        print(f'Tuning {name}: target is reached in {len(reached)} of {repeats} runs, '
+              f'mean number of evaluations {np.mean(reached) if reached else np.nan:.1f}')
+
+
+if __name__ == '__main__':
+    run_tuning_warm_start_benchmark()
@@ -211,6 +211,10 @@ class ApiComposer:
         primary_operations, secondary_operations = self.divide_operations(composer_params['available_operations'],
                                                                           api_params['task'])
 
+        max_evaluation_time = composer_params.get('max_evaluation_time')
+        if max_evaluation_time is not None:
+            max_evaluation_time = datetime.timedelta(minutes=max_evaluation_time)
+
         # the choice and initialisation of the GP composer
         composer_requirements = PipelineComposerRequirements(primary=primary_operations,
                                                              secondary=secondary_operations,
@@ -223,7 +227,10 @@ class ApiComposer:
                                                              timeout=self.timer.datetime_composing,
                                                              n_jobs=api_params['n_jobs'],
                                                              collect_intermediate_metric=composer_params[
-                                                                 'collect_intermediate_metric'])
+                                                                 'collect_intermediate_metric'],
+                                                             max_graph_evaluation_time=max_evaluation_time,
+                                                             max_graph_evaluation_memory=composer_params.get(
+                                                                 'max_evaluation_memory'))
 
         genetic_scheme_type = GeneticSchemeTypesEnum.parameter_free
 
@@ -244,7 +251,8 @@ class ApiComposer:
             mutation_types=mutations,
             crossover_types=[CrossoverTypesEnum.one_point, CrossoverTypesEnum.subtree],
             history_folder=composer_params.get('history_folder'),
-            stopping_after_n_generation=composer_params.get('stopping_after_n_generation')
+            stopping_after_n_generation=composer_params.get('stopping_after_n_generation'),
+            history_full_generations=composer_params.get('history_full_generations')
         )
         if 'optimizer' in composer_params:
             self.optimiser = composer_params['optimizer']
@@ -420,9 +428,10 @@ def _divide_parameters(common_dict: dict) -> List[dict]:
 
     composer_params_dict = dict(max_depth=None, max_arity=None, pop_size=None, num_of_generations=None,
                                 available_operations=None, composer_metric=None, validation_blocks=None,
-                                cv_folds=None, genetic_scheme=None, history_folder=None,
+                                cv_folds=None, genetic_scheme=None, history_folder=None, history_full_generations=None,
                                 stopping_after_n_generation=None, optimizer=None, optimizer_external_params=None,
-                                collect_intermediate_metric=False)
+                                collect_intermediate_metric=False, max_evaluation_time=None,
+                                max_evaluation_memory=None)
 
     tuner_params_dict = dict(with_tuning=False, tuner_metric=None)
 
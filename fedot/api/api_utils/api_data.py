@@ -24,10 +24,16 @@ class ApiDataProcessor:
         * InputData (FEDOT dataclass)
 
     Data preprocessing such a class performing also
+
+    :param task: task to solve
+    :param log: Log object to record messages
+    :param precision: float dtype of numeric features of tabular data ('float32' or 'float64'),
+    if None - features dtypes are kept
     """
 
-    def __init__(self, task: Task, log: Optional[Log] = None):
+    def __init__(self, task: Task, log: Optional[Log] = None, precision: Optional[str] = None):
         self.task = task
+        self.precision = precision
         self.preprocessor = DataPreprocessor(log)
 
         # Dictionary with recommendations (e.g. 'cut' for cutting dataset, 'label_encode'
@@ -61,6 +67,11 @@ class ApiDataProcessor:
                              'Numpy array/Pandas DataFrame/FEDOT InputData/dict for multimodal data, '
                              f'Exception: {ex}')
 
+        if self.precision is not None:
+            # Numeric features are kept in the desired precision from here on
+            for data_part in (data.values() if isinstance(data, MultiModalData) else [data]):
+                data_part.precision = self.precision
+
         # Perform obligatory steps of data preprocessing
         if is_predict:
             data = self.preprocessor.obligatory_prepare_for_predict(data)
@@ -1,8 +1,7 @@
-import numpy as np
 from typing import Dict, Tuple, Any
 
 from fedot.core.data.data import InputData
-from fedot.core.data.data_preprocessing import find_categorical_columns
+from fedot.core.data.data_preprocessing import features_profile
 from fedot.core.data.multi_modal import MultiModalData
 from fedot.core.repository.dataset_types import DataTypesEnum
 
@@ -65,12 +64,5 @@ class DataAnalyser:
         :param input_data: data for preprocessing
         """
 
-        categorical_ids, _ = find_categorical_columns(input_data.features)
-        all_cardinality = 0
-        need_label = False
-        for idx in categorical_ids:
-            all_cardinality += np.unique(input_data.features[:, idx].astype(str)).shape[0]
-            if all_cardinality > self.max_cat_cardinality:
-                need_label = True
-                break
-        return need_label
+        all_cardinality = sum(features_profile(input_data).cardinality.values())
+        return all_cardinality > self.max_cat_cardinality
@@ -70,8 +70,11 @@ class Fedot:
             'initial_assumption' - initial assumption for composer
             'genetic_scheme' - name of the genetic scheme
             'history_folder' - name of the folder for composing history
+            'history_full_generations' - number of the last generations kept in the history with full pipelines
             'metric' - metric for quality calculation during composing
             'collect_intermediate_metric' - save metrics for intermediate (non-root) nodes in pipeline
+            'max_evaluation_time' - time limit (in minutes) of the evaluation of one pipeline during composing
+            'max_evaluation_memory' - limit of the memory (in megabytes) used by the evaluation of one pipeline
     :param task_params:  additional parameters of the task
     :param seed: value for fixed random seed
     :param verbose_level: level of the output detailing
@@ -82,6 +85,9 @@ class Fedot:
     :param initial_assumption: initial assumption for composer
     :param n_jobs: num of n_jobs for parallelization (-1 for use all cpu's)
     :param use_cache: bool indicating if it is needed to use pipeline structures caching
+    :param precision: float dtype of numeric features of tabular data ('float32' or 'float64').
+        'float32' halves the memory for features in the preprocessing, pipelines and models.
+        If None, the features dtypes are kept as they are
     """
 
     def __init__(self,
@@ -94,7 +100,8 @@ class Fedot:
                  safe_mode=True,
                  initial_assumption: Union[Pipeline, List[Pipeline]] = None,
                  n_jobs: int = 1,
-                 use_cache: bool = False
+                 use_cache: bool = False,
+                 precision: Optional[str] = None
                  ):
 
         # Classes for dealing with metrics, data sources and hyperparameters
@@ -119,7 +126,8 @@ class Fedot:
 
         # Initialize data processors for data preprocessing and preliminary data analysis
         self.data_processor = ApiDataProcessor(task=self.params.api_params['task'],
-                                               log=self.params.api_params['logger'])
+                                               log=self.params.api_params['logger'],
+                                               precision=precision)
         self.data_analyser = DataAnalyser(safe_mode=safe_mode)
 
         self.target: Optional[TargetType] = None
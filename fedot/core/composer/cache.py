@@ -63,7 +63,7 @@ class OperationsCache(metaclass=SingletonMeta):
             ]
             self._db.add_operations(mapped)
         except Exception as ex:
-            self.log.info(f'Nodes can not be saved: {ex}. Continue')
+            self.log.info('Nodes can not be saved: %s. Continue', ex)
 
     def save_pipeline(self, pipeline: 'Pipeline', fold_id: Optional[int] = None):
         """
@@ -91,7 +91,7 @@ class OperationsCache(metaclass=SingletonMeta):
                 else:
                     nodes_lst[idx].fitted_operation = None
         except Exception as ex:
-            self.log.info(f'Cache can not be loaded: {ex}. Continue.')
+            self.log.info('Cache can not be loaded: %s. Continue.', ex)
         finally:
             return cache_was_used
 
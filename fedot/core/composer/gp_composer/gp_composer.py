@@ -1,3 +1,4 @@
+import datetime
 import platform
 from dataclasses import dataclass
 from multiprocessing import set_start_method
@@ -37,6 +38,10 @@ class PipelineComposerRequirements(ComposerRequirements):
     :attribute validation_blocks: number of validation blocks for time series validation
     :attribute n_jobs: num of n_jobs
     :attribute collect_intermediate_metric: save metrics for intermediate (non-root) nodes in pipeline
+    :attribute max_graph_evaluation_time: wall-clock time limit of the evaluation of one pipeline,
+    pipeline exceeding it is stopped and gets null fitness
+    :attribute max_graph_evaluation_memory: limit of the memory (in megabytes) used by the evaluation of one pipeline,
+    pipeline exceeding it is stopped and gets null fitness
     """
     pop_size: Optional[int] = 20
     num_of_generations: Optional[int] = 20
@@ -48,6 +53,8 @@ class PipelineComposerRequirements(ComposerRequirements):
     validation_blocks: int = None
     n_jobs: int = 1
     collect_intermediate_metric: bool = False
+    max_graph_evaluation_time: Optional[datetime.timedelta] = None
+    max_graph_evaluation_memory: Optional[float] = None
 
 
 class GPComposer(Composer):
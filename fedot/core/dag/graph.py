@@ -71,6 +71,12 @@ class Graph:
         """
         self.operator.delete_subtree(subroot)
 
+    def clone(self) -> 'Graph':
+        """
+        Copy of the graph structure and contents of nodes that shares the rest of attributes with the original
+        """
+        return self.operator.clone()
+
     def show(self, path: str = None):
         GraphVisualiser().visualise(self, path)
 
@@ -1,11 +1,12 @@
-from copy import deepcopy
-from typing import Any, List, Optional, Union, Tuple, Dict
+from copy import copy
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from networkx import set_node_attributes, graph_edit_distance
 
 from fedot.core.dag.graph_node import GraphNode
+from fedot.core.dag.node_operator import NodeOperator
 from fedot.core.pipelines.convert import graph_structure_as_nx_graph
-from fedot.core.utilities.data_structures import ensure_wrapped_in_sequence, remove_items
+from fedot.core.utilities.data_structures import UniqueList, ensure_wrapped_in_sequence, remove_items
 
 
 class GraphOperator:
@@ -48,12 +49,28 @@ class GraphOperator:
 
     def update_subtree(self, old_node: GraphNode, new_node: GraphNode):
         """Exchange subtrees with old and new nodes as roots of subtrees"""
-        new_node = deepcopy(new_node)
+        new_node = clone_nodes([new_node])[0]
         self.actualise_old_node_children(old_node, new_node)
         self.delete_subtree(old_node)
         self.add_node(new_node)
         self.sort_nodes()
 
+    def clone(self):
+        """
+        Structural copy of the graph: nodes, links between them, and contents of nodes are copied,
+        the rest of attributes of the graph and nodes (operations, logs etc.) are shared with the original.
+        It is much cheaper than deepcopy, so it is used by the genetic operators
+
+        :return: graph of the same class
+        """
+        graph = copy(self._graph)
+        graph.nodes = clone_nodes(self._graph.nodes)
+        postproc_nodes = self._postproc_nodes
+        if getattr(postproc_nodes, '__self__', None) is self._graph:
+            postproc_nodes = postproc_nodes.__func__.__get__(graph)
+        graph.operator = GraphOperator(graph, postproc_nodes)
+        return graph
+
     def add_node(self, node: GraphNode):
         """
         Add new node to the Pipeline
@@ -239,3 +256,30 @@ class GraphOperator:
 
         distance = graph_edit_distance(*nx_graphs, node_match=node_match)
         return int(distance)
+
+
+def clone_nodes(nodes: Iterable[GraphNode], memo: Optional[Dict[int, GraphNode]] = None) -> List[GraphNode]:
+    """
+    Copies the nodes with all their parents keeping the links between them.
+    The copies have their own contents (except the operations), the rest of attributes is shared
+
+    :param nodes: nodes to copy
+    :param memo: copies of already copied nodes by ids of the original ones
+    :return: copies of the nodes in the same order
+    """
+    memo = {} if memo is None else memo
+    return [_clone_node(node, memo) for node in nodes]
+
+
+def _clone_node(node: GraphNode, memo: Dict[int, GraphNode]) -> GraphNode:
+    node_clone = memo.get(id(node))
+    if node_clone is None:
+        node_clone = copy(node)
+        memo[id(node)] = node_clone
+        # Operation (or its name) is shared, params and metadata of the node are copied
+        node_clone.content = {key: value if key == 'name' else copy(value)
+                              for key, value in node.content.items()}
+        node_clone._operator = NodeOperator(node_clone)
+        if node.nodes_from is not None:
+            node_clone._nodes_from = UniqueList(_clone_node(parent, memo) for parent in node.nodes_from)
+    return node_clone
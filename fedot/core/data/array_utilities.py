@@ -2,15 +2,35 @@ from functools import reduce
 from typing import Optional
 
 import numpy as np
+from scipy import sparse
 
 
 def find_common_elements(*indices: np.array) -> np.array:
     """ Returns array with unique elements common to *all* indices
     or the first index if it's the only one. """
-    common_elements = reduce(np.intersect1d, indices[1:], indices[0])
+    if len(indices) == 1:
+        return indices[0]
+    # Sorted unique indices are intersected by binary search instead of sorting of their concatenation
+    common_elements = reduce(lambda common, index: common[isin_sorted(common, index)], map(np.unique, indices))
     return common_elements
 
 
+def are_equal_arrays(*arrays: np.array) -> bool:
+    """ Checks whether all arrays are equal. The same objects aren't compared elementwise. """
+    first_array = arrays[0]
+    return all(array is first_array or np.array_equal(array, first_array) for array in arrays[1:])
+
+
+def isin_sorted(elements: np.array, sorted_test_elements: np.array) -> np.array:
+    """ Equivalent of np.isin for sorted array of unique test elements,
+    which is found by binary search without sorting of the elements. """
+    if len(sorted_test_elements) == 0:
+        return np.zeros(len(elements), dtype=bool)
+    positions = np.searchsorted(sorted_test_elements, elements)
+    positions[positions == len(sorted_test_elements)] = 0
+    return sorted_test_elements[positions] == elements
+
+
 def flatten_extra_dim(data: Optional[np.array]) -> Optional[np.array]:
     """ Removes extra dimension if it is equal to one.
 
@@ -37,3 +57,13 @@ def atleast_2d(data: np.array) -> np.array:
 
 def atleast_4d(data: np.array) -> np.array:
     return atleast_n_dimensions(data, ndim=4)
+
+
+def as_float_precision(table, precision: Optional[str]):
+    """ Cast the float table (dense or sparse) into the float dtype of the precision ('float32' or 'float64').
+
+    :return: the same table if precision isn't set or the table isn't a float one (e.g. it contains strings). """
+    is_float_table = (isinstance(table, np.ndarray) or sparse.issparse(table)) and table.dtype.kind == 'f'
+    if precision is None or not is_float_table or table.dtype == precision:
+        return table
+    return table.astype(precision)
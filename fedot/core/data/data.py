@@ -2,13 +2,13 @@ import glob
 import os
 from copy import copy, deepcopy
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple, Union
+from typing import Iterator, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
 import pandas as pd
 
-from fedot.core.data.array_utilities import atleast_2d
+from fedot.core.data.array_utilities import as_float_precision, atleast_2d
 from fedot.core.data.load_data import JSONBatchLoader, TextBatchLoader
 from fedot.core.data.supplementary_data import SupplementaryData
 from fedot.core.repository.dataset_types import DataTypesEnum
@@ -58,6 +58,41 @@ class Data:
 
         return InputData(idx=idx, features=features, target=target, task=task, data_type=data_type)
 
+    @staticmethod
+    def from_csv_chunks(file_path=None,
+                        chunk_size: int = 100000,
+                        delimiter=',',
+                        task: Task = Task(TaskTypesEnum.classification),
+                        data_type: DataTypesEnum = DataTypesEnum.table,
+                        columns_to_drop: Optional[List] = None,
+                        target_columns: Union[str, List] = '',
+                        index_col: Optional[Union[str, int]] = 0) -> Iterator['InputData']:
+        """
+        Read the CSV by chunks of rows, so the data which doesn't fit into memory
+        can be processed chunk by chunk (e.g. with Pipeline.partial_fit)
+
+        :param file_path: the path to the CSV with data
+        :param chunk_size: the number of rows in the chunk
+        :param delimiter: the delimiter to separate the columns
+        :param task: the task that should be solved with data
+        :param data_type: the type of data interpretation
+        :param columns_to_drop: the names of columns that should be dropped
+        :param target_columns: name of target column (last column if empty and no target if None)
+        :param index_col: column name or index to use as the Data.idx;
+            if None then arrange new unique index
+        :return: iterator over InputData with chunks
+        """
+
+        with pd.read_csv(file_path, sep=delimiter, index_col=index_col, chunksize=chunk_size) as reader:
+            for data_frame in reader:
+                if columns_to_drop:
+                    data_frame = data_frame.drop(columns_to_drop, axis=1)
+
+                idx = data_frame.index.to_numpy()
+                features, target = process_target_and_features(data_frame, target_columns)
+
+                yield InputData(idx=idx, features=features, target=target, task=task, data_type=data_type)
+
     @staticmethod
     def from_csv_time_series(task: Task,
                              file_path=None,
@@ -296,6 +331,20 @@ class InputData(Data):
     Data class for input data for the nodes
     """
 
+    @property
+    def precision(self) -> Optional[str]:
+        """ Float dtype of numeric tabular features ('float32' or 'float64') kept through the preprocessing
+        and pipelines. If it is None (by default), features dtypes are not changed """
+        return self.supplementary_data.precision
+
+    @precision.setter
+    def precision(self, precision: Optional[str]):
+        if precision not in (None, 'float32', 'float64'):
+            raise ValueError(f'Precision {precision} is not supported, use "float32" or "float64"')
+        self.supplementary_data.precision = precision
+        if data_type_is_table(self):
+            self.features = as_float_precision(self.features, precision)
+
     @property
     def num_classes(self) -> Optional[int]:
         if self.task.task_type == TaskTypesEnum.classification and self.target is not None:
@@ -348,7 +397,7 @@ class InputData(Data):
         Shuffles features and target if possible
         """
         if self.data_type is DataTypesEnum.table:
-            shuffled_ind = np.random.permutation(len(self.features))
+            shuffled_ind = np.random.permutation(self.features.shape[0])
             idx, features, target = np.asarray(self.idx)[shuffled_ind], self.features[shuffled_ind], self.target[
                 shuffled_ind]
             self.idx = idx
@@ -1,7 +1,8 @@
-from typing import Union
+from typing import Dict, List, Union
 
 import numpy as np
 import pandas as pd
+from scipy import sparse
 
 from fedot.core.data.data import InputData, data_type_is_table, data_type_is_ts, data_type_is_multi_ts
 from fedot.core.repository.dataset_types import DataTypesEnum
@@ -14,12 +15,13 @@ def data_type_is_suitable_preprocessing(data: InputData) -> bool:
 
 
 def replace_inf_with_nans(input_data: InputData):
-    values_to_replace = [np.inf, -np.inf]
-    features_with_replaced_inf = np.where(np.isin(input_data.features,
-                                                  values_to_replace),
-                                          np.nan,
-                                          input_data.features)
-    input_data.features = features_with_replaced_inf
+    features = input_data.features
+    dtype_kind = features.dtype.kind if isinstance(features, np.ndarray) else None
+    is_inf = np.isinf(features) if dtype_kind == 'f' else np.isin(features, [np.inf, -np.inf])
+    if dtype_kind in ('f', 'O') and not is_inf.any():
+        # Features table is kept the same if there is nothing to replace (so its profile is kept too)
+        return
+    input_data.features = np.where(is_inf, np.nan, features)
 
 
 def convert_into_column(array: np.array):
@@ -84,30 +86,8 @@ def find_categorical_columns(table: np.array, column_types: dict = None):
 
 def force_categorical_determination(table):
     """ Find string columns using 'computationally expensive' approach """
-    source_shape = table.shape
-    columns_number = source_shape[1] if len(source_shape) > 1 else 1
-
-    categorical_ids = []
-    non_categorical_ids = []
-    # For every column in table make check for first element
-    for column_id in range(0, columns_number):
-        column = table[:, column_id] if columns_number > 1 else table
-        col_shape = column.shape
-        for i in column:
-            # Check if element is string object or not until the first appearance
-            if len(col_shape) == 2 and isinstance(i[0], str):
-                # Column looks like [[n], [n], [n]]
-                categorical_ids.append(column_id)
-                break
-            elif len(col_shape) == 1 and isinstance(i, str):
-                # Column [n, n, n]
-                categorical_ids.append(column_id)
-                break
-
-        if column_id not in categorical_ids:
-            non_categorical_ids.append(column_id)
-
-    return categorical_ids, non_categorical_ids
+    profile = TableProfile(table)
+    return profile.categorical_ids, profile.non_categorical_ids
 
 
 def data_has_missing_values(data: Union[InputData, 'MultiModalData']) -> bool:
@@ -116,12 +96,115 @@ def data_has_missing_values(data: Union[InputData, 'MultiModalData']) -> bool:
     if not isinstance(data, InputData):
         for data_source_name, values in data.items():
             if data_type_is_table(values):
-                return pd.DataFrame(values.features).isna().sum().sum() > 0
+                return _features_have_missing_values(values)
     elif data_type_is_suitable_preprocessing(data):
-        return pd.DataFrame(data.features).isna().sum().sum() > 0
+        return _features_have_missing_values(data)
     return False
 
 
+def _features_have_missing_values(data: InputData) -> bool:
+    if sparse.issparse(data.features):
+        # Only stored elements of sparse table can be missing
+        return bool(np.isnan(data.features.data).any())
+    return features_profile(data).has_missing_values
+
+
+def features_profile(data: InputData) -> 'TableProfile':
+    """ Profile of the features table of the data. It is computed once for the table and kept
+    in the supplementary data, so the preprocessing steps don't scan the same table again """
+    profile = data.supplementary_data.features_profile
+    if profile is None or profile.table is not data.features:
+        profile = TableProfile(data.features)
+        data.supplementary_data.features_profile = profile
+    return profile
+
+
+class TableProfile:
+    """
+    Profile of the columns of the table: presence of strings, numbers of missing values and estimated
+    numbers of unique values of string columns. Every characteristic is computed by one vectorized pass
+    over the table on the first request, for numeric dtypes no pass is needed to find strings
+
+    :param table: tabular data to profile (one-dimensional array is considered as a column)
+    """
+
+    def __init__(self, table: np.ndarray):
+        table = np.asarray(table)
+        self.table = table
+        self._columns = table.reshape(-1, 1) if table.ndim < 2 else table
+        self._has_strings = None
+        self._nan_counts = None
+        self._cardinality = None
+
+    @property
+    def dtype_kind(self) -> str:
+        return self._columns.dtype.kind
+
+    @property
+    def has_strings(self) -> np.ndarray:
+        """ Boolean mask of columns that contain at least one string """
+        if self._has_strings is None:
+            columns_number = self._columns.shape[1]
+            if self.dtype_kind == 'U':
+                self._has_strings = np.full(columns_number, len(self._columns) > 0)
+            elif self.dtype_kind == 'O':
+                self._has_strings = np.array([_has_strings(column) for column in self._columns.T], dtype=bool)
+            else:
+                self._has_strings = np.zeros(columns_number, dtype=bool)
+        return self._has_strings
+
+    @property
+    def categorical_ids(self) -> List[int]:
+        return np.flatnonzero(self.has_strings).tolist()
+
+    @property
+    def non_categorical_ids(self) -> List[int]:
+        return np.flatnonzero(~self.has_strings).tolist()
+
+    @property
+    def nan_counts(self) -> np.ndarray:
+        """ Numbers of missing values (nan, None, NaT) in columns """
+        if self._nan_counts is None:
+            if self.dtype_kind in 'biuUS':
+                self._nan_counts = np.zeros(self._columns.shape[1], dtype=int)
+            elif self.dtype_kind == 'f':
+                self._nan_counts = np.isnan(self._columns).sum(axis=0)
+            else:
+                # Check of the columns one by one is much faster than of the whole object table
+                self._nan_counts = np.array([pd.isna(column).sum() for column in self._columns.T], dtype=int)
+        return self._nan_counts
+
+    @property
+    def has_missing_values(self) -> bool:
+        return bool(self.nan_counts.sum() > 0)
+
+    @property
+    def cardinality(self) -> Dict[int, int]:
+        """ Estimated numbers of unique values (missing value is one of them) of categorical columns by their ids.
+        Values are compared by hashes of their string representations """
+        if self._cardinality is None:
+            self._cardinality = {column_id: len(pd.unique(pd.util.hash_array(self._columns[:, column_id])))
+                                 for column_id in self.categorical_ids}
+        return self._cardinality
+
+
+# Types of the values inferred by pandas which are certainly not strings
+_NON_STRING_INFERRED_TYPES = {'empty', 'floating', 'integer', 'mixed-integer-float', 'decimal', 'complex',
+                              'boolean', 'datetime64', 'datetime', 'date', 'timedelta64', 'timedelta',
+                              'time', 'period', 'interval'}
+
+
+def _has_strings(column: np.ndarray) -> bool:
+    """ Check if the object column contains at least one string """
+    inferred_type = pd.api.types.infer_dtype(column, skipna=True)
+    if inferred_type == 'string':
+        return True
+    if inferred_type in _NON_STRING_INFERRED_TYPES:
+        return False
+    # Column with values of mixed types, so the first string is searched
+    return any(isinstance(value, str) for value in column)
+
+
 def data_has_categorical_features(data: Union[InputData, 'MultiModalData']) -> bool:
     """
     Check data for categorical columns.
@@ -1,11 +1,12 @@
 from typing import List, Iterable, Union
 
+from scipy import sparse
+
 from fedot.core.data.data import OutputData, InputData
 from fedot.core.data.merge.supplementary_data_merger import SupplementaryDataMerger
 from fedot.core.log import Log, default_log
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.data.array_utilities import *
-from fedot.core.utilities.data_structures import are_same_length
 
 
 class DataMerger:
@@ -27,7 +28,9 @@ class DataMerger:
 
         # Ensure outputs are of equal length, find common index if it is not
         idx_list = [np.asarray(output.idx) for output in outputs]
-        self.common_indices = find_common_elements(*idx_list)
+        # Usually all outputs share the same index and don't need an alignment
+        self.has_common_index = are_equal_arrays(*idx_list)
+        self.common_indices = idx_list[0] if self.has_common_index else find_common_elements(*idx_list)
         if len(self.common_indices) == 0:
             raise ValueError(f'There are no common indices for outputs')
 
@@ -96,11 +99,11 @@ class DataMerger:
 
         if any(is_forecast_indices):
             # Cut prediction length to minimum length
-            predict_len = min(len(output.predict) for output in self.outputs)
+            predict_len = min(output.predict.shape[0] for output in self.outputs)
             common_predicts = [output.predict[:predict_len] for output in self.outputs]
         else:
             common_predicts = [self.select_common(output.idx, output.predict) for output in self.outputs]
-            if not are_same_length(common_predicts):
+            if len({predict.shape[0] for predict in common_predicts}) > 1:
                 raise ValueError('Indices of merged data are not equal and not unique. Check validity of the pipeline.')
         return common_predicts
 
@@ -110,6 +113,9 @@ class DataMerger:
 
     def merge_predicts(self, predicts: List[np.array]) -> np.array:
         # Finally, merge predictions into features for the next stage
+        if any(map(sparse.issparse, predicts)):
+            # Sparse features (e.g. after one hot encoding) are kept sparse
+            return sparse.hstack(predicts, format='csr')
         return np.concatenate(predicts, axis=-1)
 
     def postprocess_predicts(self, merged_predicts: np.array) -> np.array:
@@ -119,14 +125,17 @@ class DataMerger:
     def select_common(self, idx: Union[list, np.array], data: Union[list, np.array] = None):
         """ Select elements from data according to index for data.
          Includes only elements with index from self.common_indices. """
-        index_mask = np.isin(idx, self.common_indices)
         sliced = data if data is not None else idx
-        sliced = np.asarray(sliced)[index_mask]
-        return sliced
+        if not sparse.issparse(sliced):
+            sliced = np.asarray(sliced)
+        if self.has_common_index:
+            return sliced
+        index_mask = isin_sorted(np.asarray(idx), self.common_indices)
+        return sliced[index_mask]
 
     @staticmethod
     def is_forecast_index(output: 'OutputData'):
-        return len(output.idx) != len(output.predict)
+        return len(output.idx) != output.predict.shape[0]
 
     @staticmethod
     def find_main_output(outputs: List['OutputData']) -> 'OutputData':
@@ -1,11 +1,14 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple, TYPE_CHECKING
 
 import numpy as np
 
 from fedot.core.repository.operation_types_repository import OperationTypesRepository
 from fedot.core.repository.tasks import TaskTypesEnum
 
+if TYPE_CHECKING:
+    from fedot.core.data.data_preprocessing import TableProfile
+
 
 @dataclass
 class SupplementaryData:
@@ -27,6 +30,12 @@ class SupplementaryData:
     non_int_idx: Optional[list] = None
     # Dictionary with features and target column types
     column_types: Optional[dict] = None
+    # Features table and indices of its boolean columns (with at most two unique values) defined for it
+    bool_columns: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    # Profile of the columns of features table (see TableProfile)
+    features_profile: Optional['TableProfile'] = None
+    # Float dtype of numeric features tables ('float32' or 'float64'), if None - dtypes are kept as they are
+    precision: Optional[str] = None
 
     @property
     def compound_mask(self):
@@ -1,12 +1,15 @@
+import atexit
+import itertools
 import json
 import logging
+import multiprocessing
 import os
 import sys
 from functools import wraps
 from logging.config import dictConfig
-from logging.handlers import RotatingFileHandler
-from threading import RLock
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from threading import Event, RLock
+from typing import Callable, Dict, List, Optional, Union
 
 from fedot.core.utils import default_fedot_data_dir
 
@@ -32,7 +35,16 @@ class SingletonMeta(type):
 
 
 class LogManager(metaclass=SingletonMeta):
+    """
+    Keeps loggers by names. Records of the default loggers of the main process are passed
+    through the queue to the listener thread, which writes them to the file and to the console,
+    so the logging thread doesn't wait for I/O. Worker processes (e.g. spawned by the composer)
+    create their own loggers writing records directly to the handlers, since the listener thread
+    of the worker would be killed with the queue on the worker exit.
+    """
     __logger_dict = {}
+    __listeners = {}
+    __handlers = {}
 
     def __init__(self):
         pass
@@ -48,14 +60,34 @@ class LogManager(metaclass=SingletonMeta):
         return self.__logger_dict[name]
 
     def _setup_default_logger(self, log_file, logger_name):
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler = RotatingFileHandler(log_file)
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        console_handler = logging.StreamHandler(sys.stdout)
-        self.__logger_dict[logger_name].setLevel(logging.DEBUG)
-        self.__logger_dict[logger_name].addHandler(file_handler)
-        self.__logger_dict[logger_name].addHandler(console_handler)
+        logger = self.__logger_dict[logger_name]
+        logger.setLevel(logging.DEBUG)
+        if multiprocessing.current_process().name == 'MainProcess':
+            logger.addHandler(_LogQueueHandler(self.get_listener(log_file)))
+        else:
+            for handler in self._get_handlers(log_file):
+                logger.addHandler(handler)
+
+    def _get_handlers(self, log_file: str) -> List[logging.Handler]:
+        """ Returns the handlers writing records to the log file and to the console """
+        if log_file not in self.__handlers:
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            file_handler = RotatingFileHandler(log_file)
+            file_handler.setLevel(logging.DEBUG)
+            file_handler.setFormatter(formatter)
+            console_handler = logging.StreamHandler(sys.stdout)
+            self.__handlers[log_file] = [file_handler, console_handler]
+        return self.__handlers[log_file]
+
+    def get_listener(self, log_file: str) -> '_LogListener':
+        """ Returns the running listener writing records to the log file and to the console """
+        if log_file not in self.__listeners:
+            listener = _LogListener(multiprocessing.Queue(-1), *self._get_handlers(log_file),
+                                    respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.close)
+            self.__listeners[log_file] = listener
+        return self.__listeners[log_file]
 
     def _setup_logger_from_json_file(self, config_file):
         """Setup logging configuration from file"""
@@ -80,6 +112,81 @@ class LogManager(metaclass=SingletonMeta):
         self.__logger_dict.clear()
 
 
+class _FlushRequest:
+    """ Marker put to the queue of the listener, which is handled after the records put before it """
+
+    def __init__(self, request_id: int):
+        self.request_id = request_id
+
+
+class _LogListener(QueueListener):
+    """
+    Listener of the queue with log records, which can be stopped only by the process started it.
+    The listener owns the file and the console handlers shared by the loggers writing to the same file
+    """
+
+    def __init__(self, queue, *handlers, respect_handler_level: bool = False):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self._pid = os.getpid()
+        self._flush_events: Dict[int, Event] = {}
+        self._flush_requests_ids = itertools.count()
+
+    def flush(self):
+        """ Waits until all the records put to the queue by this process are written """
+        if self._thread is not None and self._pid == os.getpid():
+            request_id = next(self._flush_requests_ids)
+            flushed = self._flush_events[request_id] = Event()
+            self.queue.put_nowait(_FlushRequest(request_id))
+            # The listener can be stopped concurrently before it handles the request
+            while not flushed.wait(0.1) and self._thread is not None:
+                pass
+        for handler in self.handlers:
+            handler.flush()
+
+    def handle(self, record):
+        if isinstance(record, _FlushRequest):
+            self._flush_events.pop(record.request_id).set()
+        else:
+            super().handle(record)
+
+    def stop(self):
+        if self._pid == os.getpid() and self._thread is not None:
+            super().stop()
+
+    def close(self):
+        """ Stops the listener writing the remaining records and closes the shared handlers """
+        if self._pid == os.getpid() and self._thread is not None:
+            self.stop()
+            for handler in self.handlers:
+                handler.close()
+
+
+class _LogQueueHandler(QueueHandler):
+    """ Handler of the logger putting records to the queue of the listener.
+    Closing it doesn't close the handlers of the listener shared with other loggers """
+
+    def __init__(self, listener: _LogListener):
+        super().__init__(listener.queue)
+        self.listener = listener
+
+    def flush(self):
+        self.listener.flush()
+
+    def close(self):
+        self.flush()
+        super().close()
+
+
+class _LazyMessage:
+    """ Message constructed only when the record is really emitted """
+
+    def __init__(self, construct_message: Callable[[], str]):
+        self._construct_message = construct_message
+
+    def __str__(self):
+        return str(self._construct_message())
+
+
 def default_log(logger_name: str,
                 log_file: Optional[str] = None,
                 verbose_level: int = 2) -> 'Log':
@@ -100,7 +207,10 @@ def default_log(logger_name: str,
 
 class Log:
     """
-    This class provides with basic logging object
+    This class provides with basic logging object.
+    Messages are formatted only if they are recorded, when they are passed
+    with arguments in %-style (e.g. ``log.debug('Fitted %s', node)``)
+    or as callables returning a string (e.g. ``log.debug(lambda: f'Fitted {node}')``)
 
     :param str logger_name: name of the logger object
     :param str config_json_file: json file with configuration for logger setup
@@ -123,46 +233,51 @@ class Log:
                                               log_file=self.log_file)
         self.verbosity_level = output_verbosity_level
 
-    def message(self, message):
+    def message(self, message: Union[str, Callable[[], str]], *args):
         """Record the message to user"""
         for_verbosity = 1
         if self.verbosity_level >= for_verbosity:
-            self.logger.info(message)
+            self.logger.info(_deferred(message), *args)
 
-    def info(self, message):
+    def info(self, message: Union[str, Callable[[], str]], *args):
         """Record the INFO log message"""
         for_verbosity = 2
         if self.verbosity_level >= for_verbosity:
-            self.logger.info(message)
+            self.logger.info(_deferred(message), *args)
 
-    def debug(self, message):
+    def debug(self, message: Union[str, Callable[[], str]], *args):
         """Record the DEBUG log message"""
         for_verbosity = 3
         if self.verbosity_level >= for_verbosity:
-            self.logger.debug(message)
+            self.logger.debug(_deferred(message), *args)
 
-    def ext_debug(self, message):
+    def ext_debug(self, message: Union[str, Callable[[], str]], *args):
         """Record the extended DEBUG log message"""
         for_verbosity = 4
         if self.verbosity_level >= for_verbosity:
-            self.logger.debug(message)
+            self.logger.debug(_deferred(message), *args)
 
-    def warn(self, message):
+    def warn(self, message: Union[str, Callable[[], str]], *args):
         """Record the WARN log message"""
         for_verbosity = 2
         if self.verbosity_level >= for_verbosity:
-            self.logger.warning(message)
+            self.logger.warning(_deferred(message), *args)
 
-    def error(self, message):
+    def error(self, message: Union[str, Callable[[], str]], *args):
         """Record the ERROR log message"""
         for_verbosity = 0
         if self.verbosity_level >= for_verbosity:
-            self.logger.error(message, exc_info=True)
+            self.logger.error(_deferred(message), *args, exc_info=True)
 
     @property
     def handlers(self):
         return self.logger.handlers
 
+    def flush(self):
+        """Waits until all the recorded messages are written"""
+        for handler in self.handlers:
+            handler.flush()
+
     def release_handlers(self):
         """This function closes handlers of logger"""
         for handler in self.handlers:
@@ -195,6 +310,10 @@ class Log:
         return self.__str__()
 
 
+def _deferred(message: Union[str, Callable[[], str]]):
+    return _LazyMessage(message) if callable(message) else message
+
+
 def start_end_log_decorator(start_msg='Starting...', end_msg='Finished'):
     def decorator(method):
         @wraps(method)
@@ -1,4 +1,5 @@
 import warnings
+from functools import partial
 from typing import Optional
 
 from fedot.core.data.data import InputData
@@ -42,6 +43,9 @@ class SkLearnClassificationStrategy(SkLearnEvaluationStrategy):
         converted = self._convert_to_output(prediction, predict_data)
         return converted
 
+    def compile_predict(self, trained_operation):
+        return partial(self._sklearn_compatible_prediction, trained_operation)
+
 
 class FedotClassificationStrategy(EvaluationStrategy):
     __operations_by_types = {
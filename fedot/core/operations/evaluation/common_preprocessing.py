@@ -45,6 +45,25 @@ class FedotPreprocessingStrategy(EvaluationStrategy):
         operation_implementation.fit(train_data)
         return operation_implementation
 
+    def partial_fit(self, trained_operation, train_data: InputData):
+        """
+        This method is used for incremental operation training with the chunk of data provided
+        :param trained_operation: operation trained on the previous chunks (None for the first chunk)
+        :param InputData train_data: chunk of data used for operation training
+        :return: trained operation
+        """
+
+        warnings.filterwarnings("ignore", category=RuntimeWarning)
+        operation_implementation = trained_operation
+        if operation_implementation is None:
+            if self.params_for_fit:
+                operation_implementation = self.operation_impl(**self.params_for_fit)
+            else:
+                operation_implementation = self.operation_impl()
+
+        operation_implementation.partial_fit(train_data)
+        return operation_implementation
+
     def predict(self, trained_operation, predict_data: InputData,
                 is_fit_pipeline_stage: bool):
         """
@@ -61,6 +80,9 @@ class FedotPreprocessingStrategy(EvaluationStrategy):
         converted = self._convert_to_output(prediction, predict_data)
         return converted
 
+    def compile_predict(self, trained_operation):
+        return trained_operation.transform_features
+
     def _convert_to_operation(self, operation_type: str):
         if operation_type in self.__operations_by_types.keys():
             return self.__operations_by_types[operation_type]
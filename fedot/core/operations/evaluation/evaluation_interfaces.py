@@ -1,6 +1,6 @@
 import warnings
 from abc import abstractmethod
-from typing import Optional
+from typing import Callable, Optional
 
 import numpy as np
 from catboost import CatBoostClassifier, CatBoostRegressor
@@ -67,6 +67,16 @@ class EvaluationStrategy:
         """
         raise NotImplementedError()
 
+    def partial_fit(self, trained_operation, train_data: InputData):
+        """
+        Method to train the operation incrementally with the chunk of data provided.
+        It is implemented only for the strategies of operations tagged as 'incremental'
+        :param trained_operation: operation trained on the previous chunks (None for the first chunk)
+        :param InputData train_data: chunk of data used for operation training
+        :return: trained operation
+        """
+        raise NotImplementedError(f'Incremental fit is not supported for {self.operation_id}')
+
     @abstractmethod
     def predict(self, trained_operation, predict_data: InputData,
                 is_fit_pipeline_stage: bool) -> OutputData:
@@ -79,6 +89,15 @@ class EvaluationStrategy:
         """
         raise NotImplementedError()
 
+    def compile_predict(self, trained_operation) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Method to obtain the function predicting with the trained operation on the features table
+        directly, without InputData and OutputData. It is used by compiled inference plans of pipelines
+        :param trained_operation: trained operation object
+        :return: function from the features table to the predicted table
+        """
+        raise NotImplementedError(f'Prediction on features tables is not supported for {self.operation_id}')
+
     @abstractmethod
     def _convert_to_operation(self, operation_type: str):
         raise NotImplementedError()
@@ -185,6 +204,46 @@ class SkLearnEvaluationStrategy(EvaluationStrategy):
             operation_implementation.fit(train_data.features, train_data.target)
         return operation_implementation
 
+    def partial_fit(self, trained_operation, train_data: InputData):
+        """
+        This method is used for incremental operation training with the chunk of data provided.
+        Operations with partial_fit (e.g. SGD, naive Bayes) are updated with the chunk and boosting
+        operations continue boosting from the trees of the trained operation.
+        The first chunk must contain all the classes for classification task
+        :param trained_operation: operation trained on the previous chunks (None for the first chunk)
+        :param InputData train_data: chunk of data used for operation training
+        :return: trained Sklearn operation
+        """
+        warnings.filterwarnings("ignore", category=RuntimeWarning)
+
+        if is_multi_output_task(train_data):
+            raise ValueError(f'Incremental fit of {self.operation_id} is not supported for multi-output task')
+        features, target = train_data.features, np.ravel(train_data.target)
+
+        if trained_operation is not None and hasattr(trained_operation, 'partial_fit'):
+            trained_operation.partial_fit(features, target)
+            return trained_operation
+
+        if self.params_for_fit:
+            operation_implementation = self.operation_impl(**self.params_for_fit)
+        else:
+            operation_implementation = self.operation_impl()
+
+        if hasattr(operation_implementation, 'partial_fit'):
+            if train_data.task.task_type == TaskTypesEnum.classification:
+                operation_implementation.partial_fit(features, target, classes=np.unique(target))
+            else:
+                operation_implementation.partial_fit(features, target)
+        elif isinstance(operation_implementation, (LGBMClassifier, LGBMRegressor)):
+            init_model = trained_operation.booster_ if trained_operation is not None else None
+            operation_implementation.fit(features, target, init_model=init_model)
+        elif isinstance(operation_implementation, (XGBClassifier, XGBRegressor)):
+            xgb_model = trained_operation.get_booster() if trained_operation is not None else None
+            operation_implementation.fit(features, target, xgb_model=xgb_model)
+        else:
+            raise NotImplementedError(f'Incremental fit is not supported for {self.operation_id}')
+        return operation_implementation
+
     def predict(self, trained_operation, predict_data: InputData,
                 is_fit_pipeline_stage: bool) -> OutputData:
         """
@@ -1,17 +1,24 @@
-from copy import deepcopy
-from typing import Optional, Union
+from copy import copy
+from typing import Dict, Optional
 
 import numpy as np
-from sklearn.preprocessing import OneHotEncoder, LabelEncoder
+import pandas as pd
+from scipy import sparse
+from sklearn.preprocessing import OneHotEncoder
 
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.data.data_preprocessing import find_categorical_columns
 from fedot.core.operations.evaluation.operation_implementations.implementation_interfaces import \
     DataOperationImplementation
 
+# Encoded tables with such number of binary columns are stored as sparse matrices
+MIN_ENCODED_COLUMNS_FOR_SPARSE = 1000
+
 
 class OneHotEncodingImplementation(DataOperationImplementation):
-    """ Class for automatic categorical data detection and one hot encoding """
+    """ Class for automatic categorical data detection and one hot encoding.
+    If categorical features have many levels, the encoded table is returned as scipy.sparse CSR matrix
+    """
 
     def __init__(self, **params: Optional[dict]):
         super().__init__()
@@ -57,9 +64,7 @@ class OneHotEncodingImplementation(DataOperationImplementation):
         :param is_fit_pipeline_stage: is this fit or predict stage for pipeline
         :return output_data: output data with transformed features table
         """
-        copied_data = deepcopy(input_data)
-
-        features = copied_data.features
+        features = input_data.features
         if not self.categorical_ids:
             # If there are no categorical features in the table
             transformed_features = features
@@ -68,8 +73,10 @@ class OneHotEncodingImplementation(DataOperationImplementation):
             transformed_features = self._apply_one_hot_encoding(features)
 
         # Update features
-        output_data = self._convert_to_output(copied_data,
+        output_data = self._convert_to_output(input_data,
                                               transformed_features)
+        # Supplementary data is shared with the source data, so it is copied before the update of the column types
+        output_data.supplementary_data = copy(input_data.supplementary_data)
         self._update_column_types(output_data)
         return output_data
 
@@ -84,25 +91,39 @@ class OneHotEncodingImplementation(DataOperationImplementation):
             encoded_columns_number = output_data.predict.shape[1] - len(numerical_columns)
             numerical_columns.extend([str(int)] * encoded_columns_number)
 
-            output_data.supplementary_data.column_types['features'] = numerical_columns
+            output_data.supplementary_data.column_types = {**output_data.supplementary_data.column_types,
+                                                           'features': numerical_columns}
 
     def _apply_one_hot_encoding(self, features: np.array):
         """
         The method creates a table based on categorical and real features after One Hot Encoding transformation
 
         :param features: tabular data for processing
-        :return transformed_features: transformed features table
+        :return transformed_features: transformed features table (CSR matrix if there are
+        at least MIN_ENCODED_COLUMNS_FOR_SPARSE encoded columns and all the features are numerical)
         """
 
         categorical_features = np.array(features[:, self.categorical_ids])
-        transformed_categorical = self.encoder.transform(categorical_features).toarray()
+        transformed_categorical = self.encoder.transform(categorical_features)
+        non_categorical_features = np.array(features[:, self.non_categorical_ids])
+
+        if sparse.issparse(transformed_categorical):
+            if transformed_categorical.shape[1] >= MIN_ENCODED_COLUMNS_FOR_SPARSE:
+                try:
+                    non_categorical_features = non_categorical_features.astype(float)
+                except ValueError:
+                    # Non-numerical features can't be stored in sparse matrix
+                    pass
+                else:
+                    frames = (sparse.csr_matrix(non_categorical_features), transformed_categorical)
+                    return sparse.hstack(frames, format='csr')
+            transformed_categorical = transformed_categorical.toarray()
 
         # If there are non-categorical features in the data
         if not self.non_categorical_ids:
             transformed_features = transformed_categorical
         else:
             # Stack transformed categorical and non-categorical data
-            non_categorical_features = np.array(features[:, self.non_categorical_ids])
             frames = (non_categorical_features, transformed_categorical)
             transformed_features = np.hstack(frames)
 
@@ -113,12 +134,16 @@ class OneHotEncodingImplementation(DataOperationImplementation):
 
 
 class LabelEncodingImplementation(DataOperationImplementation):
-    """ Class for categorical features encoding based on LabelEncoding """
+    """ Class for categorical features encoding based on LabelEncoding.
+    Known categories are encoded by their indices in the sorted categories of the train data,
+    unseen categories get the next codes in order of their appearance and keep them for the next transformations,
+    gaps stay nan. Codes are searched in the hash index of categories, so categories are not sorted at transform
+    """
 
     def __init__(self, **params: Optional[dict]):
         super().__init__()
         # LabelEncoder has no parameters
-        self.encoders = {}
+        self.categories: Dict[int, pd.Index] = {}
         self.categorical_ids = None
         self.non_categorical_ids = None
 
@@ -131,28 +156,23 @@ class LabelEncodingImplementation(DataOperationImplementation):
         if self.categorical_ids:
             # For every categorical feature - perform encoding
             self._fit_label_encoders(input_data)
-        return self.encoders
+        return self.categories
 
     def transform(self, input_data, is_fit_pipeline_stage: Optional[bool]):
         """ Apply LabelEncoder on categorical features and doesn't process float or int ones """
-        copied_data = deepcopy(input_data)
+        transformed_features = input_data.features
         if self.categorical_ids:
-            # If categorical features are exists - transform them inplace in InputData
+            # Only references to the values of the object table are copied
+            transformed_features = input_data.features.copy()
             for categorical_id in self.categorical_ids:
                 categorical_column = input_data.features[:, categorical_id]
-
-                # Converting into string - so nans becomes marked as 'nan'
-                categorical_column = categorical_column.astype(str)
-                gap_ids = np.ravel(np.argwhere(categorical_column == 'nan'))
-
-                transformed = self._apply_label_encoder(categorical_column, categorical_id, gap_ids)
-                copied_data.features[:, categorical_id] = transformed
+                transformed_features[:, categorical_id] = self._apply_label_encoder(categorical_column,
+                                                                                    categorical_id)
 
         # Update features
-        output_data = self._convert_to_output(copied_data,
-                                              copied_data.features)
-        # Store source features values
-        output_data.features = input_data.features
+        output_data = self._convert_to_output(input_data, transformed_features)
+        # Supplementary data is shared with the source data, so it is copied before the update of the column types
+        output_data.supplementary_data = copy(input_data.supplementary_data)
 
         self._update_column_types(output_data)
         return output_data
@@ -161,47 +181,52 @@ class LabelEncodingImplementation(DataOperationImplementation):
         """ Update column types after encoding. Categorical becomes integer """
         if self.categorical_ids:
             # Categorical features were in the dataset
-            col_types = output_data.supplementary_data.column_types['features']
+            col_types = list(output_data.supplementary_data.column_types['features'])
             for categorical_id in self.categorical_ids:
                 col_types[categorical_id] = str(int)
 
-            output_data.supplementary_data.column_types['features'] = col_types
+            output_data.supplementary_data.column_types = {**output_data.supplementary_data.column_types,
+                                                           'features': col_types}
 
     def _fit_label_encoders(self, input_data: InputData):
-        """ Fit LabelEncoder for every categorical column in the dataset """
+        """ Define sorted categories (string representations of the values without gaps)
+        for every categorical column in the dataset """
         for categorical_id in self.categorical_ids:
             categorical_column = input_data.features[:, categorical_id]
-            le = LabelEncoder()
-            le.fit(categorical_column)
+            categories = pd.unique(categorical_column[~pd.isna(categorical_column)]).astype(str)
+            self.categories[categorical_id] = pd.Index(np.unique(categories))
 
-            self.encoders.update({categorical_id: le})
-
-    def _apply_label_encoder(self, categorical_column: np.array, categorical_id: int,
-                             gap_ids: Union[np.array, None]):
-        """ Apply fitted LabelEncoder for column transformation
+    def _apply_label_encoder(self, categorical_column: np.array, categorical_id: int) -> np.array:
+        """ Apply fitted categories for column transformation
 
         :param categorical_column: numpy array with categorical features
         :param categorical_id: index of current categorical column
-        :param gap_ids: indices of gap elements in array
+        :return: codes of the categories (object array with nan values if there are gaps in the column)
         """
-        column_encoder = self.encoders[categorical_id]
-        encoder_classes = list(column_encoder.classes_)
-
-        # If the column contains categories not previously encountered
-        for label in list(set(categorical_column)):
-            if label not in encoder_classes:
-                encoder_classes.append(label)
-
-        # Extent encoder classes
-        column_encoder.classes_ = encoder_classes
-
-        transformed_column = column_encoder.transform(categorical_column)
-        if len(gap_ids) > 0:
+        categories = self.categories[categorical_id]
+        gaps = pd.isna(categorical_column)
+        codes = categories.get_indexer(categorical_column)
+
+        # Non-string values are compared with the categories by their string representations
+        unknown = (codes == -1) & ~gaps
+        if unknown.any():
+            unknown_values = categorical_column[unknown].astype(str)
+            codes[unknown] = categories.get_indexer(unknown_values)
+            unseen = codes == -1
+            unseen[~unknown] = False
+            if unseen.any():
+                # The column contains categories not previously encountered
+                unseen_values = categorical_column[unseen].astype(str)
+                categories = categories.append(pd.Index(pd.unique(unseen_values)))
+                self.categories[categorical_id] = categories
+                codes[unseen] = categories.get_indexer(unseen_values)
+
+        if gaps.any():
             # Store np.nan values
-            transformed_column = transformed_column.astype(object)
-            transformed_column[gap_ids] = np.nan
-
-        return transformed_column
+            transformed_column = codes.astype(object)
+            transformed_column[gaps] = np.nan
+            return transformed_column
+        return codes
 
     def get_params(self):
         """ Due to LabelEncoder has no parameters - return empty set """
@@ -2,14 +2,13 @@ import random
 from typing import Optional
 
 import numpy as np
-import pandas as pd
 from sklearn.decomposition import KernelPCA, PCA, FastICA
 from sklearn.impute import SimpleImputer
 from sklearn.preprocessing import MinMaxScaler, PolynomialFeatures, StandardScaler
 
 from fedot.core.data.data import InputData, data_type_is_table, OutputData
 from fedot.core.data.data_preprocessing import replace_inf_with_nans, convert_into_column, \
-    divide_data_categorical_numerical, find_categorical_columns, data_has_categorical_features
+    find_categorical_columns, data_has_categorical_features, features_profile
 from fedot.core.operations.evaluation.operation_implementations. \
     implementation_interfaces import DataOperationImplementation, EncodedInvariantImplementation
 
@@ -53,10 +52,7 @@ class ComponentAnalysisImplementation(DataOperationImplementation):
         :return input_data: data with transformed features attribute
         """
 
-        if self.number_of_features > 1:
-            transformed_features = self.pca.transform(input_data.features)
-        else:
-            transformed_features = input_data.features
+        transformed_features = self.transform_features(input_data.features)
 
         # Update features
         output_data = self._convert_to_output(input_data,
@@ -64,6 +60,17 @@ class ComponentAnalysisImplementation(DataOperationImplementation):
         self.update_column_types(output_data)
         return output_data
 
+    def transform_features(self, features: np.ndarray) -> np.ndarray:
+        """
+        Method for transformation of the features table using PCA
+
+        :param features: tabular features to transform
+        :return: transformed features table
+        """
+        if self.number_of_features > 1:
+            return self.pca.transform(features)
+        return features
+
     def check_and_correct_params(self):
         """ Method check if number of features in data enough for n_components
         parameter in PCA or not. And if not enough - fixes it
@@ -181,20 +188,13 @@ class PolyFeaturesImplementation(EncodedInvariantImplementation):
 
         return super().fit(input_data)
 
-    def transform(self, input_data, is_fit_pipeline_stage: Optional[bool]):
+    def transform_features(self, features: np.ndarray) -> np.ndarray:
         """ Firstly perform filtration of columns """
-        clipped_input_data = input_data
-        if self.columns_to_take is not None:
-            clipped_input_data = input_data.subset_features(self.columns_to_take)
-        output_data = super().transform(clipped_input_data, is_fit_pipeline_stage)
-
-        if self.columns_to_take is not None:
-            # Get generated features from poly function
-            generated_features = output_data.predict[:, self.th_columns:]
-            # Concat source features with generated one
-            all_features = np.hstack((input_data.features, generated_features))
-            output_data.predict = all_features
-        return output_data
+        if self.columns_to_take is None:
+            return super().transform_features(features)
+        transformed_features = super().transform_features(features[:, self.columns_to_take])
+        # Concat source features with generated from poly function
+        return np.hstack((features, transformed_features[:, self.th_columns:]))
 
     def get_params(self):
         return self.operation.get_params()
@@ -288,19 +288,21 @@ class ImputationImplementation(DataOperationImplementation):
 
         if data_type_is_table(input_data):
             # Tabular data contains categorical features
-            categorical_ids, non_categorical_ids = find_categorical_columns(input_data.features)
-            numerical, categorical = divide_data_categorical_numerical(input_data, categorical_ids,
-                                                                       non_categorical_ids)
+            profile = features_profile(input_data)
+            categorical_ids, non_categorical_ids = profile.categorical_ids, profile.non_categorical_ids
+            features = convert_into_column(input_data.features)
 
-            if categorical is not None and categorical.features.size > 0:
-                categorical.features = convert_into_column(categorical.features)
+            if categorical_ids and features.shape[0] > 0:
                 # Imputing for categorical values
-                self.imputer_cat.fit(categorical.features)
+                self.imputer_cat.fit(features[:, categorical_ids])
 
-            if numerical is not None and numerical.features.size > 0:
-                numerical.features = convert_into_column(numerical.features)
+            if non_categorical_ids and features.shape[0] > 0:
+                numerical_features = features[:, non_categorical_ids]
                 # Imputing for numerical values
-                self.imputer_num.fit(numerical.features)
+                self.imputer_num.fit(numerical_features)
+                if categorical_ids:
+                    # Features with only two unique values must be filled in a specific way
+                    self._find_binary_features(numerical_features)
         else:
             # Time series or other type of non-tabular data
             input_data.features = convert_into_column(input_data.features)
@@ -320,32 +322,17 @@ class ImputationImplementation(DataOperationImplementation):
             features_types = input_data.supplementary_data.column_types.get('features')
             self.categorical_ids, self.non_categorical_ids = find_categorical_columns(input_data.features,
                                                                                       features_types)
-            numerical, categorical = divide_data_categorical_numerical(input_data, self.categorical_ids,
-                                                                       self.non_categorical_ids)
-
-            if categorical is not None:
-                categorical_features = convert_into_column(categorical.features)
-                categorical_features = self.imputer_cat.transform(categorical_features)
-
-            if numerical is not None:
-                numerical_features = convert_into_column(numerical.features)
-
-                # Features with only two unique values must be filled in a specific way
-                self._find_binary_features(numerical_features)
-                numerical_features = self.imputer_num.transform(numerical_features)
-                numerical_features = self._correct_binary_ids_features(numerical_features)
-
-            if categorical is not None and numerical is not None:
-                # Stack both categorical and numerical features
-                transformed_features = self._categorical_numerical_union(categorical_features,
-                                                                         numerical_features)
-            elif categorical is not None and numerical is None:
-                # Dataset contain only categorical features
-                transformed_features = categorical_features
-            elif categorical is None and numerical is not None:
-                # Dataset contain only numerical features
-                transformed_features = numerical_features
-
+            features = convert_into_column(input_data.features)
+
+            # Both parts are filled into the table with the source order of columns
+            transformed_features = np.empty(features.shape, dtype=object)
+            if self.categorical_ids:
+                transformed_features[:, self.categorical_ids] = \
+                    self.imputer_cat.transform(features[:, self.categorical_ids])
+            if self.non_categorical_ids:
+                numerical_features = self.imputer_num.transform(features[:, self.non_categorical_ids])
+                transformed_features[:, self.non_categorical_ids] = \
+                    self._correct_binary_ids_features(numerical_features)
         else:
             input_data.features = convert_into_column(input_data.features)
             transformed_features = self.imputer_num.transform(input_data.features)
@@ -365,30 +352,19 @@ class ImputationImplementation(DataOperationImplementation):
         output_data = self.transform(input_data)
         return output_data
 
-    def _categorical_numerical_union(self, categorical_features: np.array, numerical_features: np.array):
-        """ Merge numerical and categorical features in right order (as it was in source table) """
-        categorical_df = pd.DataFrame(categorical_features, columns=self.categorical_ids)
-        numerical_df = pd.DataFrame(numerical_features, columns=self.non_categorical_ids)
-        all_features_df = pd.concat([numerical_df, categorical_df], axis=1)
-
-        # Sort column names
-        all_features_df = all_features_df.sort_index(axis=1)
-        return np.array(all_features_df)
-
     def _find_binary_features(self, numerical_features: np.array):
-        """ Find indices of features with only two unique values in column.
-        All features in table are numerical.
+        """ Find indices of features with only two unique values in column (excluding nans)
+        and their values. All features in table are numerical.
         """
-        df = pd.DataFrame(numerical_features)
-
-        # Calculate unique values per column (excluding nans)
-        for column_id, col in enumerate(df):
-            unique_values = df[col].dropna().unique()
-            if len(unique_values) <= 2:
-                # Current numerical column has only two values
-                column_info = {column_id: {'min': min(unique_values),
-                                           'max': max(unique_values)}}
-                self.ids_binary_integer_features.update(column_info)
+        numerical_features = numerical_features.astype(float)
+        # fmin and fmax ignore nans, so columns of nans are not considered binary
+        columns_min = np.fmin.reduce(numerical_features, axis=0)
+        columns_max = np.fmax.reduce(numerical_features, axis=0)
+        is_binary = np.all((numerical_features == columns_min) | (numerical_features == columns_max) |
+                           np.isnan(numerical_features), axis=0) & ~np.isnan(columns_min)
+        self.ids_binary_integer_features = {column_id: {'min': columns_min[column_id],
+                                                        'max': columns_max[column_id]}
+                                            for column_id in np.flatnonzero(is_binary)}
 
     def _correct_binary_ids_features(self, filled_numerical_features: np.array) -> np.array:
         """ Correct filled features if previously it was binary. Discretization is performed
@@ -400,16 +376,15 @@ class ImputationImplementation(DataOperationImplementation):
             # Return source array
             return filled_numerical_features
 
-        for bin_id in list_binary_ids:
-            # Correct values inplace
-            filled_column = filled_numerical_features[:, bin_id]
-            min_value = self.ids_binary_integer_features[bin_id]['min']
-            max_value = self.ids_binary_integer_features[bin_id]['max']
-            mean_value = (max_value - min_value) / 2
-
-            filled_column[filled_column > mean_value] = max_value
-            filled_column[filled_column < mean_value] = min_value
+        min_values = np.array([self.ids_binary_integer_features[bin_id]['min'] for bin_id in list_binary_ids])
+        max_values = np.array([self.ids_binary_integer_features[bin_id]['max'] for bin_id in list_binary_ids])
+        mean_values = (max_values - min_values) / 2
 
+        # Correct values of all binary columns at once
+        filled_columns = filled_numerical_features[:, list_binary_ids]
+        filled_columns = np.where(filled_columns > mean_values, max_values,
+                                  np.where(filled_columns < mean_values, min_values, filled_columns))
+        filled_numerical_features[:, list_binary_ids] = filled_columns
         return filled_numerical_features
 
     def get_params(self) -> dict:
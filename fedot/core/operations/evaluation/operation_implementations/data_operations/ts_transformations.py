@@ -770,7 +770,11 @@ def prepare_target(all_idx, idx, features_columns: np.array, target, forecast_le
     idx = idx[: -1]
 
     # Update target (clip first "window size" values)
-    row_nums = [list(all_idx).index(i) for i in idx]
+    # Positions of the first occurrences of indices (as with list.index)
+    positions = {}
+    for position, index in enumerate(all_idx):
+        positions.setdefault(index, position)
+    row_nums = [positions[i] for i in idx]
     ts_target = target[row_nums]
 
     # Multi-target transformation
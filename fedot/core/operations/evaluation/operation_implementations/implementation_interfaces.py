@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Tuple
 
 import numpy as np
 
@@ -25,6 +25,13 @@ class DataOperationImplementation(ABC):
         """
         raise NotImplementedError()
 
+    def partial_fit(self, input_data):
+        """ Method fit operation incrementally on the chunk of a dataset
+
+        :param input_data: chunk of data with features, target and ids to process
+        """
+        raise NotImplementedError(f'Incremental fit is not supported for {self.__class__.__name__}')
+
     @abstractmethod
     def transform(self, input_data, is_fit_pipeline_stage: Optional[bool]):
         """ Method apply transform operation on a dataset
@@ -34,6 +41,13 @@ class DataOperationImplementation(ABC):
         """
         raise NotImplementedError()
 
+    def transform_features(self, features: np.ndarray) -> np.ndarray:
+        """ Method apply transform operation on a features table directly (without InputData)
+
+        :param features: tabular features to process
+        """
+        raise NotImplementedError(f'Transformation of features tables is not supported for {self.__class__.__name__}')
+
     @abstractmethod
     def get_params(self):
         """ Method return parameters, which can be optimized for particular
@@ -75,15 +89,27 @@ class EncodedInvariantImplementation(DataOperationImplementation):
         features = input_data.features
 
         # Find boolean columns in features table
-        bool_ids, ids_to_process = self._reasonability_check(features)
+        bool_ids, ids_to_process = self._define_bool_columns(input_data)
         self.ids_to_process = ids_to_process
         self.bool_ids = bool_ids
 
         if len(ids_to_process) > 0:
-            features_to_process = np.array(features[:, ids_to_process])
-            self.operation.fit(features_to_process)
-        else:
-            pass
+            self.operation.fit(self._take_columns(features, ids_to_process))
+
+        return self.operation
+
+    def partial_fit(self, input_data):
+        """ Method for incremental fit of transformer with partial_fit method (e.g. scalers).
+        Boolean features are determined on the first chunk
+
+        :param input_data: chunk of data with features, target and ids to process
+        :return operation: trained transformer (optional output)
+        """
+        if self.ids_to_process is None:
+            self.bool_ids, self.ids_to_process = self._define_bool_columns(input_data)
+
+        if len(self.ids_to_process) > 0:
+            self.operation.partial_fit(self._take_columns(input_data.features, self.ids_to_process))
 
         return self.operation
 
@@ -96,17 +122,24 @@ class EncodedInvariantImplementation(DataOperationImplementation):
         :return output_data: output data with transformed features table
         """
         source_features_shape = input_data.features.shape
-        features = input_data.features
-        if len(self.ids_to_process) > 0:
-            transformed_features = self._make_new_table(features)
-        else:
-            transformed_features = features
+        transformed_features = self.transform_features(input_data.features)
 
         # Update features and column types
         output_data = self._convert_to_output(input_data, transformed_features)
         self._update_column_types(source_features_shape, output_data)
         return output_data
 
+    def transform_features(self, features: np.ndarray) -> np.ndarray:
+        """
+        The method that transforms the source features table using "operation"
+
+        :param features: tabular features to process
+        :return transformed_features: transformed features table
+        """
+        if len(self.ids_to_process) > 0:
+            return self._make_new_table(features)
+        return features
+
     def _make_new_table(self, features):
         """
         The method creates a table based on transformed data and source boolean
@@ -116,20 +149,27 @@ class EncodedInvariantImplementation(DataOperationImplementation):
         :return transformed_features: transformed features table
         """
 
-        features_to_process = np.array(features[:, self.ids_to_process])
-        transformed_part = self.operation.transform(features_to_process)
+        transformed_part = self.operation.transform(self._take_columns(features, self.ids_to_process))
 
         # If there are no binary features in the dataset
         if len(self.bool_ids) == 0:
-            transformed_features = transformed_part
-        else:
-            # Stack transformed features and bool features
-            bool_features = np.array(features[:, self.bool_ids])
-            frames = (bool_features, transformed_part)
-            transformed_features = np.hstack(frames)
-
+            return transformed_part
+
+        # Boolean features are followed by the transformed ones
+        bool_columns_number = len(self.bool_ids)
+        transformed_features = np.empty((len(features), bool_columns_number + transformed_part.shape[1]),
+                                        dtype=np.result_type(features, transformed_part))
+        transformed_features[:, :bool_columns_number] = features[:, self.bool_ids]
+        transformed_features[:, bool_columns_number:] = transformed_part
         return transformed_features
 
+    @staticmethod
+    def _take_columns(features: np.ndarray, ids: np.ndarray) -> np.ndarray:
+        """ Columns of the table with the given indices (the table itself if all columns are taken in order) """
+        if len(ids) == features.shape[1] and np.array_equal(ids, np.arange(features.shape[1])):
+            return features
+        return features[:, ids]
+
     def get_params(self):
         return self.operation.get_params()
 
@@ -140,33 +180,57 @@ class EncodedInvariantImplementation(DataOperationImplementation):
         """
         return output_data
 
+    def _define_bool_columns(self, input_data) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Defines boolean columns of the features table once for it, so the operations
+        fitted on the same table (e.g. in the primary nodes of the pipeline) reuse them
+
+        :param input_data: tabular data for check
+        :return bool_ids: indices of boolean columns in table
+        :return non_bool_ids: indices of non boolean columns in table
+        """
+        features = input_data.features
+        supplementary_data = input_data.supplementary_data
+        if supplementary_data.bool_columns is not None and supplementary_data.bool_columns[0] is features:
+            bool_ids = supplementary_data.bool_columns[1]
+        else:
+            bool_ids, _ = self._reasonability_check(features)
+            supplementary_data.bool_columns = (features, bool_ids)
+        non_bool_ids = np.setdiff1d(np.arange(features.shape[1]), bool_ids)
+        return bool_ids, non_bool_ids
+
     @staticmethod
     def _reasonability_check(features):
         """
-        Method for checking which columns contain boolean data
+        Method for checking which columns contain boolean data (at most two unique values, nan is one of them)
 
         :param features: tabular data for check
         :return bool_ids: indices of boolean columns in table
         :return non_bool_ids: indices of non boolean columns in table
         """
-        # TODO perhaps there is a more effective way to do this
-        source_shape = features.shape
-
-        columns_amount = source_shape[1] if len(source_shape) > 1 else 1
-
-        # Indices of boolean columns in features table
-        bool_ids = []
-        non_bool_ids = []
-
-        # For every column in table make check
-        for column_id in range(0, columns_amount):
-            column = features[:, column_id] if columns_amount >= 1 else features
-            if len(np.unique(column)) > 2:
-                non_bool_ids.append(column_id)
-            else:
-                bool_ids.append(column_id)
-
-        return bool_ids, non_bool_ids
+        features = np.asarray(features)
+        if features.ndim < 2:
+            features = features.reshape(-1, 1)
+        if features.dtype.kind not in 'biuf':
+            # Values of the arbitrary types can be compared only by np.unique
+            is_bool = np.array([len(np.unique(column)) <= 2 for column in features.T], dtype=bool)
+        else:
+            is_bool = _columns_with_two_values(features)
+        return np.flatnonzero(is_bool), np.flatnonzero(~is_bool)
+
+
+def _columns_with_two_values(features: np.ndarray) -> np.ndarray:
+    """ Vectorized check whether the numeric columns have at most two unique values (all nan values are the same) """
+    if len(features) == 0:
+        return np.ones(features.shape[1], dtype=bool)
+    nan_mask = np.isnan(features) if features.dtype.kind == 'f' else np.zeros(features.shape, dtype=bool)
+    # fmin and fmax ignore nan, so they are nan only for the columns of nan values
+    columns_min, columns_max = np.fmin.reduce(features, axis=0), np.fmax.reduce(features, axis=0)
+    is_two_valued = np.all((features == columns_min) | (features == columns_max) | nan_mask, axis=0)
+    with np.errstate(invalid='ignore'):
+        not_nan_values_number = np.where(np.isnan(columns_min.astype(float)), 0,
+                                         np.where(columns_min == columns_max, 1, 2))
+    return is_two_valued & (not_nan_values_number + nan_mask.any(axis=0) <= 2)
 
 
 class ModelImplementation(ABC):
@@ -33,6 +33,9 @@ class SkLearnRegressionStrategy(SkLearnEvaluationStrategy):
 
         return converted
 
+    def compile_predict(self, trained_operation):
+        return trained_operation.predict
+
 
 class FedotRegressionPreprocessingStrategy(EvaluationStrategy):
     """ Strategy for applying custom algorithms from FEDOT to preprocess data
@@ -1,13 +1,14 @@
-from typing import Optional
+from typing import Callable, Optional, Union
 
 import numpy as np
 
+from fedot.core.data.array_utilities import atleast_2d
 from fedot.core.data.data import OutputData
 from fedot.core.log import Log
 from fedot.core.operations.operation import Operation
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.operation_types_repository import OperationTypesRepository
-from fedot.core.repository.tasks import TaskTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
 
 
 class Model(Operation):
@@ -22,6 +23,17 @@ class Model(Operation):
         super().__init__(operation_type=operation_type, log=log)
         self.operations_repo = OperationTypesRepository('model')
 
+    def compile_predict(self, fitted_operation, task: Task, params: Union[str, dict, None] = None,
+                        output_mode: str = 'default') -> Callable[[np.ndarray], np.ndarray]:
+        predict = super().compile_predict(fitted_operation, task, params, output_mode)
+        if task.task_type in (TaskTypesEnum.regression, TaskTypesEnum.ts_forecasting):
+            return predict
+
+        def predict_as_columns(features: np.ndarray) -> np.ndarray:
+            # Predictions for classification are columns as in assign_tabular_column_types
+            return atleast_2d(predict(features))
+        return predict_as_columns
+
     @staticmethod
     def assign_tabular_column_types(output_data: OutputData, output_mode: str) -> OutputData:
         """
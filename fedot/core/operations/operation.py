@@ -1,7 +1,13 @@
 from abc import abstractmethod
-from typing import Optional, Union
+from copy import copy, deepcopy
+from typing import Callable, Optional, Union
 
-from fedot.core.data.data import InputData, OutputData
+import numpy as np
+
+from scipy import sparse
+
+from fedot.core.data.array_utilities import as_float_precision
+from fedot.core.data.data import InputData, OutputData, data_type_is_table
 from fedot.core.log import Log, default_log
 from fedot.core.operations.warnings_processor import suppress_stdout
 from fedot.core.operations.hyperparameters_preprocessing import HyperparametersPreprocessor
@@ -25,29 +31,45 @@ class Operation:
         self._eval_strategy = None
         self.operations_repo = None
         self.fitted_operation = None
+        # Evaluation strategy classes by task types
+        self._eval_strategy_types = {}
+        # Evaluation strategies for prediction by task types with the params they were created with
+        self._predict_strategies = {}
 
         self.log = log or default_log(__name__)
 
     def _init(self, task: Task, **kwargs):
+        """ Define evaluation strategy for the task. The strategy for fit is created every time, because
+        params are corrected according to the number of samples in data. The strategy for predict
+        is created once for the task and params and reused by the next predictions """
         params = kwargs.get('params')
+        if 'n_samples_data' in kwargs:
+            self._eval_strategy = self._new_eval_strategy(task, params, kwargs['n_samples_data'])
+        else:
+            strategy_params, eval_strategy = self._predict_strategies.get(task.task_type, (None, None))
+            if eval_strategy is None or strategy_params != params:
+                eval_strategy = self._new_eval_strategy(task, params)
+                self._predict_strategies[task.task_type] = (deepcopy(params), eval_strategy)
+            self._eval_strategy = eval_strategy
+
+        self._eval_strategy.output_mode = kwargs.get('output_mode', False)
+
+    def _new_eval_strategy(self, task: Task, params: Union[str, dict, None], n_samples_data: Optional[int] = None):
         params_for_fit = None
         if params != DEFAULT_PARAMS_STUB:
             params_for_fit = HyperparametersPreprocessor(operation_type=self.operation_type,
-                                                         n_samples_data=kwargs.get('n_samples_data')).correct(params)
+                                                         n_samples_data=n_samples_data).correct(params)
 
         try:
-            self._eval_strategy = \
-                _eval_strategy_for_task(self.operation_type,
-                                        task.task_type,
-                                        self.operations_repo)(self.operation_type,
-                                                              params_for_fit)
+            if task.task_type not in self._eval_strategy_types:
+                self._eval_strategy_types[task.task_type] = _eval_strategy_for_task(self.operation_type,
+                                                                                    task.task_type,
+                                                                                    self.operations_repo)
+            return self._eval_strategy_types[task.task_type](self.operation_type, params_for_fit)
         except Exception as ex:
             self.log.error(f'Can not find evaluation strategy because of {ex}')
             raise ex
 
-        if 'output_mode' in kwargs:
-            self._eval_strategy.output_mode = kwargs['output_mode']
-
     def description(self, operation_params: dict) -> str:
         operation_type = self.operation_type
         return f'n_{operation_type}_{operation_params}'
@@ -75,6 +97,7 @@ class Operation:
         :return: tuple of trained operation and prediction on train data
         :param is_fit_pipeline_stage: is this fit or predict stage for pipeline
         """
+        data = self._to_supported_features_format(data)
 
         self._init(data.task, params=params, n_samples_data=data.features.shape[0])
 
@@ -85,6 +108,28 @@ class Operation:
 
         return self.fitted_operation, predict_train
 
+    def partial_fit(self, params: Union[str, dict, None], data: InputData, fitted_operation=None):
+        """
+        This method is used for defining and running of the evaluation strategy
+        to train the operation incrementally with the chunk of data provided
+
+        :param params: hyperparameters for operation
+        :param data: chunk of data used for operation training
+        :param fitted_operation: operation trained on the previous chunks (None for the first chunk)
+        :return: tuple of trained operation and prediction on the chunk
+        """
+        data = self._to_supported_features_format(data)
+
+        self._init(data.task, params=params, n_samples_data=data.features.shape[0])
+
+        with suppress_stdout():
+            self.fitted_operation = self._eval_strategy.partial_fit(trained_operation=fitted_operation,
+                                                                    train_data=data)
+
+        predict_train = self.predict(self.fitted_operation, data, True, params)
+
+        return self.fitted_operation, predict_train
+
     def predict(self, fitted_operation, data: InputData, is_fit_pipeline_stage: bool,
                 params: Union[str, dict, None] = None, output_mode: str = 'default'):
         """
@@ -98,6 +143,7 @@ class Operation:
         :param output_mode: string with information about output of operation,
         for example, is the operation predict probabilities or class labels
         """
+        data = self._to_supported_features_format(data)
         is_main_target = data.supplementary_data.is_main_target
         data_flow_length = data.supplementary_data.data_flow_length
         self._init(data.task, output_mode=output_mode, params=params)
@@ -107,6 +153,9 @@ class Operation:
             predict_data=data,
             is_fit_pipeline_stage=is_fit_pipeline_stage)
         prediction = self.assign_tabular_column_types(prediction, output_mode)
+        if data_type_is_table(prediction):
+            # Float outputs are kept in the precision of the source features
+            prediction.predict = as_float_precision(prediction.predict, data.supplementary_data.precision)
 
         if is_main_target is False:
             prediction.supplementary_data.is_main_target = is_main_target
@@ -115,6 +164,32 @@ class Operation:
         prediction.supplementary_data.was_preprocessed = True
         return prediction
 
+    def compile_predict(self, fitted_operation, task: Task, params: Union[str, dict, None] = None,
+                        output_mode: str = 'default') -> Callable[[np.ndarray], np.ndarray]:
+        """
+        This method is used for obtaining the function which predicts with the fitted operation
+        on the dense features table directly, without InputData and OutputData construction.
+        The function uses its own evaluation strategy, so it isn't affected by the next fits and predicts
+
+        :param fitted_operation: trained operation object
+        :param task: task of the data for prediction
+        :param params: hyperparameters for operation
+        :param output_mode: string with information about output of operation
+        :return: function from the features table to the predicted table
+        :raises NotImplementedError: if the evaluation strategy of the operation can't predict on tables
+        """
+        eval_strategy = self._new_eval_strategy(task, params)
+        eval_strategy.output_mode = output_mode
+        return eval_strategy.compile_predict(fitted_operation)
+
+    def _to_supported_features_format(self, data: InputData) -> InputData:
+        """ Convert sparse features table into dense one if the operation is not tagged as supporting
+        sparse input. Data isn't changed inplace, because the sparse table can be used by other nodes """
+        if sparse.issparse(data.features) and 'sparse' not in (self.metadata.tags or []):
+            data = copy(data)
+            data.features = data.features.toarray()
+        return data
+
     @staticmethod
     @abstractmethod
     def assign_tabular_column_types(output_data: OutputData, output_mode: str) -> OutputData:
@@ -110,7 +110,7 @@ class PipelineAdapter(BaseOptimizationAdapter[Pipeline, Node]):
 
     def _adapt(self, adaptee: Pipeline) -> OptGraph:
         """ Convert Pipeline class into OptGraph class """
-        source_pipeline = deepcopy(adaptee)
+        source_pipeline = adaptee.operator.clone()
 
         # Apply recursive transformation since root
         for node in source_pipeline.nodes:
@@ -122,7 +122,7 @@ class PipelineAdapter(BaseOptimizationAdapter[Pipeline, Node]):
     def _restore(self, opt_graph: OptGraph, metadata: Optional[Dict[str, Any]] = None) -> Pipeline:
         """ Convert OptGraph class into Pipeline class """
         metadata = metadata or {}
-        source_graph = deepcopy(opt_graph)
+        source_graph = opt_graph.clone()
 
         # Inverse transformation since root node
         for node in source_graph.nodes:
@@ -0,0 +1,88 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from fedot.core.optimisers.graph import OptGraph
+
+NodeCostKey = Tuple[str, Tuple[str, ...]]
+
+
+class EvaluationCostModel:
+    """
+    Online model of the evaluation time of graphs. Time of the node is predicted as the mean fit time of
+    the nodes with the same operation and the same operations of parents (they define the data the operation
+    is fitted on), or as the mean time of the operation if such combination wasn't evaluated yet.
+    Time of the graph evaluation is a linear function of the sum of the nodes times: the slope accounts
+    for prediction and validation folds, the intercept - for the data preparation and other overheads.
+    The function is fitted by least squares with exponentially decaying weights of old observations.
+
+    :param decay: multiplier of weights of previous observations at every update
+    """
+
+    def __init__(self, decay: float = 0.95):
+        self.decay = decay
+        # Sums of fit times and numbers of fits
+        self._node_costs: Dict[NodeCostKey, List[float]] = {}
+        self._operation_costs: Dict[str, List[float]] = {}
+        # Weighted sums of 1, x, y, x^2 and x*y for the least squares, where x is nodes time, y is evaluation time
+        self._sums = np.zeros(5)
+
+    @property
+    def is_fitted(self) -> bool:
+        return self._sums[0] > 0
+
+    @staticmethod
+    def nodes_keys(graph: OptGraph) -> List[NodeCostKey]:
+        return [(str(node), tuple(sorted(str(parent) for parent in node.nodes_from or [])))
+                for node in graph.nodes]
+
+    def update(self, nodes_fit_times: Iterable[Tuple[NodeCostKey, float]], evaluation_time: float):
+        """
+        Updates the model with the observed evaluation
+
+        :param nodes_fit_times: keys of the nodes (see nodes_keys) with their fit times in seconds
+        :param evaluation_time: time of the whole graph evaluation in seconds
+        """
+        nodes_time = 0.
+        for key, fit_time in nodes_fit_times:
+            for costs in [self._node_costs.setdefault(key, [0., 0]), self._operation_costs.setdefault(key[0], [0., 0])]:
+                costs[0] += fit_time
+                costs[1] += 1
+            nodes_time += fit_time
+        self._sums = self.decay * self._sums + np.array([1., nodes_time, evaluation_time,
+                                                         nodes_time ** 2, nodes_time * evaluation_time])
+
+    def predict(self, graph: OptGraph) -> Optional[float]:
+        """
+        Predicts the evaluation time of the graph
+
+        :param graph: graph to predict evaluation time for
+        :return: time in seconds or None if there are no observations for some operations of the graph
+        """
+        if not self.is_fitted:
+            return None
+        nodes_time = 0.
+        for key in self.nodes_keys(graph):
+            costs = self._node_costs.get(key) or self._operation_costs.get(key[0])
+            if costs is None:
+                return None
+            nodes_time += costs[0] / costs[1]
+        intercept, slope = self._linear_coefficients()
+        return intercept + slope * nodes_time
+
+    def _linear_coefficients(self) -> Tuple[float, float]:
+        weight, x_sum, y_sum, xx_sum, xy_sum = self._sums
+        x_variance = xx_sum * weight - x_sum ** 2
+        slope = (xy_sum * weight - x_sum * y_sum) / x_variance if x_variance > 1e-12 * weight ** 2 else 0.
+        if slope <= 0:
+            # Evaluation time doesn't grow with the nodes time (or there is no variance of it yet),
+            # so the mean ratio of times is used
+            slope = y_sum / x_sum if x_sum > 0 else 0.
+            return 0., slope
+        return (y_sum - slope * x_sum) / weight, slope
+
+    @staticmethod
+    def relative_error(predicted: Iterable[float], actual: Iterable[float]) -> float:
+        """ Mean absolute error of the predicted times relative to the actual ones """
+        predicted, actual = np.asarray(predicted, dtype=float), np.asarray(actual, dtype=float)
+        return float(np.mean(np.abs(predicted - actual) / np.maximum(actual, 1e-3)))
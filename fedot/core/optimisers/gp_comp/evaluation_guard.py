@@ -0,0 +1,230 @@
+import multiprocessing
+import os
+import threading
+import time
+import timeit
+from collections import deque
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+try:
+    import resource
+except ImportError:
+    # Resource limits are available only on Unix systems
+    resource = None
+
+from fedot.core.log import Log, default_log
+
+# Exit code of the worker that exceeded the memory limit
+MEMORY_LIMIT_EXIT_CODE = 75
+
+
+class GuardedEvaluationPool:
+    """
+    Pool of worker processes that evaluates items with limits of time and memory for every evaluation.
+    Wall-clock time of the evaluation is controlled by the pool, resident memory of the worker is polled
+    by the worker itself. Memory is measured relative to the started worker, so the memory inherited
+    from the parent process and the imported modules aren't counted. In addition, address space
+    of the worker is limited with ``resource.setrlimit`` to stop single huge allocations between the polls.
+    The worker that violates the limits is killed (even if it is stuck in the native code) and replaced
+    with the new one, so the rest of items are evaluated. Errors raised by the evaluations stop only them.
+
+    :param func: function to evaluate items with, it is called in the worker processes
+    :param n_workers: number of worker processes
+    :param time_limit: wall-clock time limit of one evaluation in seconds, None means no limit
+    :param memory_limit: limit of the resident memory used by the evaluations in megabytes, None means no limit
+    :param poll_interval: interval of the memory polling in seconds
+    :param log: optional Log object
+    """
+
+    def __init__(self, func: Callable[[Any], Any], n_workers: int = 1,
+                 time_limit: Optional[float] = None, memory_limit: Optional[float] = None,
+                 poll_interval: float = 0.1, log: Optional[Log] = None):
+        self.func = func
+        self.n_workers = max(1, n_workers)
+        self.time_limit = time_limit
+        self.memory_limit = memory_limit
+        self.poll_interval = poll_interval
+        self.log = log or default_log(__name__)
+
+    def imap_unordered(self, items: Iterable[Any]) -> Iterator[Tuple[Any, Any, Optional[str]]]:
+        """
+        Evaluates items in the worker processes
+
+        :param items: items to evaluate, they must be picklable
+        :return: iterator over the tuples of the item, the result of its evaluation (None if the evaluation
+        was stopped or failed) and the reason of the stop (None if the evaluation is completed) in order of completion
+        """
+        pending = deque(items)
+        workers = [_Worker(self) for _ in range(min(self.n_workers, len(pending)))]
+        try:
+            while pending or any(worker.task is not None for worker in workers):
+                for worker in workers:
+                    if worker.task is None and pending:
+                        worker.submit(pending.popleft(), self.time_limit)
+
+                busy_workers = [worker for worker in workers if worker.task is not None]
+                deadlines = [worker.deadline for worker in busy_workers if worker.deadline is not None]
+                timeout = max(0., min(deadlines) - timeit.default_timer()) if deadlines else None
+                wait([connection for worker in busy_workers
+                      for connection in (worker.results, worker.process.sentinel)], timeout)
+
+                for worker_id, worker in enumerate(workers):
+                    if worker.task is None:
+                        continue
+                    item = worker.task
+                    received = worker.receive() if worker.results.poll() else None
+                    if received is not None:
+                        result, error = received
+                        if error is not None:
+                            reason = f'evaluation raised {type(error).__name__}: {error}'
+                            self.log.warn('Evaluation is stopped: %s', reason)
+                            yield item, None, reason
+                        else:
+                            yield item, result, None
+                        continue
+                    reason = worker.violation()
+                    if reason is not None:
+                        worker.kill()
+                        workers[worker_id] = _Worker(self)
+                        self.log.warn('Evaluation is stopped: %s', reason)
+                        yield item, None, reason
+        finally:
+            for worker in workers:
+                worker.close()
+
+
+class _Worker:
+    """ Process that evaluates submitted items one by one """
+
+    def __init__(self, pool: GuardedEvaluationPool):
+        self.time_limit = pool.time_limit
+        self.memory_limit = pool.memory_limit
+        self.task = None
+        self.deadline = None
+        self.is_ready = False
+
+        worker_tasks, self.tasks = multiprocessing.Pipe(duplex=False)
+        self.results, worker_results = multiprocessing.Pipe(duplex=False)
+        self.process = multiprocessing.Process(target=_worker_loop, daemon=True,
+                                               args=(pool.func, worker_tasks, worker_results,
+                                                     pool.memory_limit, pool.poll_interval))
+        self.process.start()
+        # Ends of the pipes used by the worker are closed to detect its death
+        worker_tasks.close()
+        worker_results.close()
+
+    def submit(self, item: Any, time_limit: Optional[float]):
+        self.task = item
+        if not self.is_ready:
+            # Start of the worker (e.g. imports in the spawned process) isn't included in the evaluation time
+            try:
+                self.is_ready = self.results.recv()
+            except EOFError:
+                self.process.join()
+        self.deadline = timeit.default_timer() + time_limit if time_limit is not None else None
+        if self.is_ready:
+            self.tasks.send(item)
+
+    def receive(self) -> Optional[Tuple[Any, Optional[BaseException]]]:
+        """ Returns the result of the evaluation with the error or None if the worker died without the result """
+        try:
+            received = self.results.recv()
+        except EOFError:
+            self.process.join()
+            return None
+        self.task, self.deadline = None, None
+        return received
+
+    def violation(self) -> Optional[str]:
+        """ Returns the reason to stop the evaluation or None if the worker can continue it """
+        if not self.process.is_alive():
+            exit_code = self.process.exitcode
+            if exit_code == MEMORY_LIMIT_EXIT_CODE:
+                return f'resident memory exceeded the limit of {self.memory_limit} MB'
+            return f'worker process was terminated with exit code {exit_code}'
+        if self.deadline is not None and timeit.default_timer() > self.deadline:
+            return f'evaluation time exceeded the limit of {self.time_limit:.1f} s'
+        return None
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.close()
+
+    def close(self):
+        if self.process.is_alive():
+            try:
+                self.tasks.send(None)
+            except (BrokenPipeError, OSError):
+                self.process.kill()
+            self.process.join()
+        self.tasks.close()
+        self.results.close()
+
+
+def _worker_loop(func: Callable[[Any], Any], tasks: Connection, results: Connection,
+                 memory_limit: Optional[float], poll_interval: float):
+    if memory_limit is not None:
+        _limit_memory(memory_limit * 2 ** 20, poll_interval)
+    # Worker is ready to evaluate
+    results.send(True)
+    while True:
+        item = tasks.recv()
+        if item is None:
+            break
+        try:
+            results.send((func(item), None))
+        except MemoryError:
+            # The allocation exceeded the limit of the address space
+            os._exit(MEMORY_LIMIT_EXIT_CODE)
+        except Exception as ex:
+            results.send((None, ex))
+
+
+def _limit_memory(memory_limit: float, poll_interval: float):
+    if resource is not None and _virtual_memory() is not None:
+        # Address space includes the reserved but unused memory (thread stacks, allocator arenas),
+        # so it is limited with the margin and the resident memory is controlled by polling
+        address_space_limit = int(_virtual_memory() + 2 * memory_limit)
+        _, hard_limit = resource.getrlimit(resource.RLIMIT_AS)
+        if hard_limit != resource.RLIM_INFINITY:
+            address_space_limit = min(address_space_limit, hard_limit)
+        resource.setrlimit(resource.RLIMIT_AS, (address_space_limit, hard_limit))
+
+    initial_memory = _resident_memory()
+
+    def poll_memory():
+        while initial_memory is not None:
+            if _resident_memory() - initial_memory > memory_limit:
+                os._exit(MEMORY_LIMIT_EXIT_CODE)
+            time.sleep(poll_interval)
+
+    threading.Thread(target=poll_memory, daemon=True).start()
+
+
+def _memory_pages() -> Optional[Dict[str, int]]:
+    try:
+        with open('/proc/self/statm') as statm:
+            virtual_pages, resident_pages = map(int, statm.read().split()[:2])
+    except OSError:
+        return None
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    return {'virtual': virtual_pages * page_size, 'resident': resident_pages * page_size}
+
+
+def _virtual_memory() -> Optional[int]:
+    pages = _memory_pages()
+    return pages['virtual'] if pages else None
+
+
+def _resident_memory() -> Optional[int]:
+    """ Current resident memory of the process in bytes (peak one if the current isn't available) """
+    pages = _memory_pages()
+    if pages:
+        return pages['resident']
+    if resource is not None:
+        # Peak resident memory is in kilobytes on Linux and in bytes on macOS
+        peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak_memory if os.uname().sysname == 'Darwin' else peak_memory * 1024
+    return None
@@ -97,7 +97,8 @@ class GenerationKeeper(ImprovementWatcher):
 
     def append(self, population: PopulationT):
         previous_archive_fitness = self._archive_fitness()
-        self.archive.update(population)
+        # Individuals penalised with invalid fitness (e.g. by the guarded evaluation) can't be the best ones
+        self.archive.update([ind for ind in population if ind.fitness.valid])
         self._update_improvements(previous_archive_fitness)
 
     def _archive_fitness(self) -> Dict[MetricsEnum, Sequence[float]]:
@@ -1,9 +1,9 @@
 import warnings
-from copy import deepcopy
 from random import choice, randint
 from typing import Any, List, Optional, Tuple
 
 from fedot.core.composer.constraint import constraint_function
+from fedot.core.dag.graph_operator import clone_nodes
 from fedot.core.optimisers.graph import OptGraph, OptNode
 from fedot.core.utils import DEFAULT_PARAMS_STUB
 
@@ -94,7 +94,7 @@ def equivalent_subtree(graph_first: Any, graph_second: Any) -> List[Tuple[Any, A
 
 def replace_subtrees(graph_first: Any, graph_second: Any, node_from_first: Any, node_from_second: Any,
                      layer_in_first: int, layer_in_second: int, max_depth: int):
-    node_from_graph_first_copy = deepcopy(node_from_first)
+    node_from_graph_first_copy = clone_nodes([node_from_first])[0]
 
     summary_depth = layer_in_first + node_from_second.distance_to_primary_level
     if summary_depth <= max_depth and summary_depth != 0:
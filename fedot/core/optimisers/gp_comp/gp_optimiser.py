@@ -14,7 +14,7 @@ from fedot.core.optimisers.gp_comp.gp_operators import (
     num_of_parents_in_crossover,
     random_graph
 )
-from fedot.core.optimisers.gp_comp.individual import Individual
+from fedot.core.optimisers.gp_comp.individual import Individual, graph_structural_hash
 from fedot.core.optimisers.gp_comp.operators.crossover import CrossoverTypesEnum, crossover
 from fedot.core.optimisers.gp_comp.operators.evaluation import EvaluationDispatcher
 from fedot.core.optimisers.gp_comp.operators.inheritance import GeneticSchemeTypesEnum, inheritance
@@ -149,6 +149,8 @@ class EvoGraphOptimiser(GraphOptimiser):
         initial_req.mutation_prob = 1
 
         randomized_pop = []
+        # Structural hashes of the graphs in the population to suppress duplicated ones
+        population_hashes = {graph_structural_hash(ind.graph) for ind in individuals}
         n_iter = pop_size * 10
         while n_iter > 0:
             initial_individual = np.random.choice(individuals)
@@ -158,8 +160,9 @@ class EvoGraphOptimiser(GraphOptimiser):
                                ind=initial_individual,
                                requirements=initial_req,
                                max_depth=self.max_depth, log=self.log)
-            if new_ind not in randomized_pop:
-                # to suppress duplicated
+            new_ind_hash = graph_structural_hash(new_ind.graph)
+            if new_ind_hash not in population_hashes:
+                population_hashes.add(new_ind_hash)
                 randomized_pop.append(new_ind)
 
             if len(randomized_pop) == pop_size - len(individuals):
@@ -186,6 +189,8 @@ class EvoGraphOptimiser(GraphOptimiser):
                                     timer=self.timer,
                                     n_jobs=self.requirements.n_jobs,
                                     collect_intermediate_metrics=self.requirements.collect_intermediate_metric,
+                                    evaluation_time_limit=self.requirements.max_graph_evaluation_time,
+                                    evaluation_memory_limit=self.requirements.max_graph_evaluation_memory,
                                     log=self.log)
 
     def optimise(self, objective_evaluator: ObjectiveEvaluate,
@@ -210,10 +215,11 @@ class EvoGraphOptimiser(GraphOptimiser):
             self.log_info_about_best()
 
             while not self.stop_optimisation():
-                self.log.info(f'Generation num: {self.generations.generation_num}')
-                self.log.info(f'max_depth: {self.max_depth}, no improvements: {self.generations.stagnation_duration}')
+                self.log.info('Generation num: %s', self.generations.generation_num)
+                self.log.info('max_depth: %s, no improvements: %s',
+                              self.max_depth, self.generations.stagnation_duration)
                 pop_size = self._pop_size.next(pop_size)
-                self.log.info(f'Next pop size: {pop_size}')
+                self.log.info('Next pop size: %s', pop_size)
 
                 # TODO: subst to mutation params
                 if self.parameters.with_auto_depth_configuration and self.generations.generation_num > 0:
@@ -257,7 +263,7 @@ class EvoGraphOptimiser(GraphOptimiser):
                 self.population = new_population
 
                 on_next_iteration_callback(self.population, self.generations.best_individuals)
-                self.log.info(f'spent time: {round(t.minutes_from_start, 1)} min')
+                self.log.info('spent time: %.1f min', t.minutes_from_start)
                 self.log_info_about_best()
 
                 clean_operators_history(self.population)
@@ -327,9 +333,8 @@ class EvoGraphOptimiser(GraphOptimiser):
                 pop.append(Individual(graph))
 
             if iter_number > MAX_NUM_OF_GENERATED_INDS:
-                self.log.debug(
-                    f'More than {MAX_NUM_OF_GENERATED_INDS} generated in population making function. '
-                    f'Process is stopped')
+                self.log.debug('More than %s generated in population making function. Process is stopped',
+                               MAX_NUM_OF_GENERATED_INDS)
                 break
 
         return pop
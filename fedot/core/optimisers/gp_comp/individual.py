@@ -1,3 +1,5 @@
+import hashlib
+from copy import deepcopy
 from dataclasses import dataclass
 from typing import List, Any, Dict, Optional, Union
 from uuid import uuid4
@@ -22,6 +24,67 @@ class Individual:
         return self.uid == other.uid
 
 
+class IndividualRecord(Individual):
+    """
+    Lightweight record of the individual kept in the optimisation history instead of the full one.
+    The graph is replaced by its structural hash, names of its nodes and its depth,
+    the fitness and the ancestry (parent operators with records of parents) are kept.
+
+    :param uid: uid of the recorded individual
+    :param graph_hash: structural hash of the graph
+    :param nodes: names of the graph nodes
+    :param depth: depth of the graph
+    :param fitness: fitness of the individual
+    :param parent_operators: operators the individual was obtained by
+    :param metadata: metadata of the individual
+    """
+
+    def __init__(self, uid: str, graph_hash: str, nodes: List[str], depth: int,
+                 fitness: Optional[Fitness] = None,
+                 parent_operators: Optional[List['ParentOperator']] = None,
+                 metadata: Optional[Dict[str, Any]] = None):
+        super().__init__(graph=None, parent_operators=parent_operators, metadata=metadata)
+        self.uid = uid
+        self.graph_hash = graph_hash
+        self.nodes = nodes
+        self.depth = depth
+        self.fitness = fitness if fitness is not None else null_fitness()
+
+    @staticmethod
+    def from_individual(individual: Individual,
+                        records_by_uid: Optional[Dict[str, 'IndividualRecord']] = None) -> 'IndividualRecord':
+        """
+        Makes the record of the individual. Parents of the individual are replaced by their records
+
+        :param individual: individual to record
+        :param records_by_uid: already made records, which are reused for the parents,
+        new records are added to it
+        """
+        if isinstance(individual, IndividualRecord):
+            return individual
+        records_by_uid = records_by_uid if records_by_uid is not None else {}
+        parent_operators = [
+            ParentOperator(operator_name=operator.operator_name, operator_type=operator.operator_type,
+                           parent_individuals=[records_by_uid.get(parent.uid) or
+                                               IndividualRecord.from_individual(parent, records_by_uid)
+                                               for parent in operator.parent_individuals if parent is not None],
+                           uid=operator.uid)
+            for operator in individual.parent_operators]
+        record = IndividualRecord(uid=individual.uid, graph_hash=graph_structural_hash(individual.graph),
+                                  nodes=[str(node) for node in individual.graph.nodes],
+                                  depth=individual.graph.depth, fitness=deepcopy(individual.fitness),
+                                  parent_operators=parent_operators, metadata=deepcopy(individual.metadata))
+        records_by_uid[individual.uid] = record
+        return record
+
+
+def graph_structural_hash(graph: OptGraph) -> str:
+    """ Hash of the graph structure and parameters of nodes """
+    roots = graph.root_node if isinstance(graph.root_node, list) else [graph.root_node]
+    description = '|'.join(sorted(root.descriptive_id for root in roots))
+    return hashlib.blake2b(description.encode(), digest_size=16).hexdigest()
+
+
 @dataclass
 class ParentOperator:
     operator_name: str
@@ -44,8 +44,8 @@ def crossover(types: List[Union[CrossoverTypesEnum, Callable]],
                     new_inds = []
 
                     is_custom_operator = isinstance(ind_first, OptGraph)
-                    input_obj_first = deepcopy(ind_first.graph)
-                    input_obj_second = deepcopy(ind_second.graph)
+                    input_obj_first = ind_first.graph.clone()
+                    input_obj_second = ind_second.graph.clone()
                     if is_custom_operator:
                         input_obj_first = params.adapter.restore(input_obj_first)
                         input_obj_second = params.adapter.restore(input_obj_second)
@@ -81,7 +81,7 @@ def crossover(types: List[Union[CrossoverTypesEnum, Callable]],
             log.debug('Number of crossover attempts exceeded. '
                       'Please check composer requirements for correctness.')
     except Exception as ex:
-        log.error(f'Crossover ex: {ex}')
+        log.error('Crossover ex: %s', ex)
 
     ind_first_copy = deepcopy(ind_first)
     ind_second_copy = deepcopy(ind_second)
@@ -2,13 +2,19 @@ import gc
 import multiprocessing
 import timeit
 from contextlib import closing
+from datetime import timedelta
 from random import choice
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
 
 from fedot.core.dag.graph import Graph
 from fedot.core.log import Log, default_log
 from fedot.core.optimisers.adapters import BaseOptimizationAdapter
+from fedot.core.optimisers.fitness import null_fitness
+from fedot.core.optimisers.gp_comp.evaluation_cost import EvaluationCostModel
+from fedot.core.optimisers.gp_comp.evaluation_guard import GuardedEvaluationPool
 from fedot.core.optimisers.graph import OptGraph
 from fedot.core.optimisers.gp_comp.operators.operator import *
 from fedot.core.optimisers.timer import Timer, get_forever_timer
@@ -22,6 +28,14 @@ class EvaluationDispatcher(Operator[PopulationT]):
     - Handle evaluation policy (e.g. sequential, parallel, async) and dispatch evaluation.
     - Delegate Fitness computation to ObjectiveEvaluate for each individual in the population.
     - Save additional metadata related to evaluation process (e.g. computation time)
+    - Predict evaluation time of individuals to dispatch the longest ones first and to skip the ones
+    that can't be evaluated in the remaining time
+    - Isolate evaluations in the worker processes if the limits of time or memory of one evaluation are set:
+    the individual violating the limits gets null fitness with the reason in its metadata
+
+    :param evaluation_time_limit: wall-clock time limit of the evaluation of one individual
+    :param evaluation_memory_limit: limit of the resident memory (in megabytes) of the process
+    evaluating one individual
     """
     def __init__(self,
                  objective_eval: ObjectiveEvaluate,
@@ -29,10 +43,16 @@ class EvaluationDispatcher(Operator[PopulationT]):
                  timer: Timer = None,
                  log: Log = None,
                  n_jobs: int = 1,
-                 collect_intermediate_metrics: bool = False):
+                 collect_intermediate_metrics: bool = False,
+                 cost_model: Optional[EvaluationCostModel] = None,
+                 evaluation_time_limit: Optional[timedelta] = None,
+                 evaluation_memory_limit: Optional[float] = None):
         self._objective_eval = objective_eval
         self._graph_adapter = graph_adapter
         self._collect_intermediate_metrics = collect_intermediate_metrics
+        self.cost_model = cost_model or EvaluationCostModel()
+        self.evaluation_time_limit = evaluation_time_limit
+        self.evaluation_memory_limit = evaluation_memory_limit
 
         self.timer = timer or get_forever_timer()
         self.logger = log or default_log('Population evaluation')
@@ -44,23 +64,35 @@ class EvaluationDispatcher(Operator[PopulationT]):
         self._remote_compute_cache(reversed_population)
         evaluated_population = self.evaluate_dispatch(reversed_population)
         self._reset_eval_cache()
-        if not evaluated_population and reversed_population:
+        if not any(ind.fitness.valid for ind in evaluated_population) and reversed_population:
             raise AttributeError('Too many fitness evaluation errors. Composing stopped.')
         return evaluated_population
 
     def evaluate_dispatch(self, individuals: PopulationT) -> PopulationT:
         n_jobs = determine_n_jobs(self._n_jobs, self.logger)
 
-        if n_jobs == 1:
-            mapped_evals = map(self.evaluate_single, individuals)
+        predicted_times = {ind.uid: self.cost_model.predict(ind.graph) for ind in individuals}
+        individuals_to_evaluate = self._skip_exceeding_timeout(individuals, predicted_times)
+        if n_jobs > 1:
+            # The longest evaluations are dispatched first for the better load of workers,
+            # individuals without prediction are considered as the longest ones
+            individuals_to_evaluate = sorted(individuals_to_evaluate, reverse=True,
+                                             key=lambda ind: _none_as_inf(predicted_times[ind.uid]))
+        is_guarded = self.evaluation_time_limit is not None or self.evaluation_memory_limit is not None
+        if is_guarded:
+            mapped_evals = self._evaluate_guarded(individuals_to_evaluate, n_jobs)
+        elif n_jobs == 1:
+            mapped_evals = list(map(self.evaluate_single, individuals_to_evaluate))
         else:
             with closing(multiprocessing.Pool(n_jobs)) as pool:
-                mapped_evals = list(pool.imap_unordered(self.evaluate_single, individuals))
+                mapped_evals = list(pool.imap_unordered(self.evaluate_single, individuals_to_evaluate))
+        self._update_cost_model(mapped_evals, predicted_times)
 
         # If there were no successful evals then try once again getting at least one,
-        #  even if time limit was reached
+        #  even if time limit was reached. The guarded evaluation isn't repeated without the limits,
+        #  since the failed evaluation can exhaust the memory or hang the main process
         successful_evals = list(filter(None, mapped_evals))
-        if not successful_evals:
+        if not any(ind.fitness.valid for ind in successful_evals) and not is_guarded:
             single = self.evaluate_single(choice(individuals), with_time_limit=False)
             if single:
                 successful_evals = [single]
@@ -83,8 +115,57 @@ class EvaluationDispatcher(Operator[PopulationT]):
 
         end_time = timeit.default_timer()
         ind.metadata['computation_time_in_seconds'] = end_time - start_time
+        # Nodes of the custom graphs don't measure their fit time
+        ind.metadata['nodes_fit_time_in_seconds'] = [getattr(node, 'fit_time_in_seconds', 0.)
+                                                     for node in adapted_graph.nodes]
         return ind if ind.fitness.valid else None
 
+    def _evaluate_guarded(self, individuals: PopulationT, n_jobs: int) -> List[Optional[Individual]]:
+        time_limit = self.evaluation_time_limit.total_seconds() if self.evaluation_time_limit is not None else None
+        pool = GuardedEvaluationPool(self.evaluate_single, n_jobs, time_limit=time_limit,
+                                     memory_limit=self.evaluation_memory_limit, log=self.logger)
+        mapped_evals = []
+        for ind, evaluated_ind, failure_reason in pool.imap_unordered(individuals):
+            if failure_reason is not None:
+                # Penalised individual is kept, so the reason of the failure remains in the history
+                ind.fitness = null_fitness()
+                ind.metadata['evaluation_failure'] = failure_reason
+                evaluated_ind = ind
+            mapped_evals.append(evaluated_ind)
+        return mapped_evals
+
+    def _skip_exceeding_timeout(self, individuals: PopulationT, predicted_times: Dict[str, Optional[float]]):
+        """ Excludes individuals with the predicted evaluation time exceeding the remaining time """
+        if self.timer.timeout is None:
+            return individuals
+        remaining_seconds = (self.timer.timeout - self.timer.spent_time).total_seconds()
+        individuals_to_evaluate = [ind for ind in individuals
+                                   if _none_as_inf(predicted_times[ind.uid], 0.) <= remaining_seconds]
+        if len(individuals_to_evaluate) < len(individuals):
+            self.logger.info('%s individuals are skipped: predicted evaluation time exceeds the remaining %.1f s',
+                             len(individuals) - len(individuals_to_evaluate), remaining_seconds)
+        return individuals_to_evaluate
+
+    def _update_cost_model(self, evaluated: Sequence[Optional[Individual]],
+                           predicted_times: Dict[str, Optional[float]]):
+        predicted, actual = [], []
+        for ind in filter(None, evaluated):
+            if not ind.fitness.valid:
+                # Evaluation of the penalised individual was stopped, its time isn't measured
+                continue
+            actual_time = ind.metadata['computation_time_in_seconds']
+            predicted_time = predicted_times.get(ind.uid)
+            self.logger.debug('Evaluation time of %s: predicted %s s, actual %.3f s',
+                              ind.uid, predicted_time, actual_time)
+            if predicted_time is not None:
+                predicted.append(predicted_time)
+                actual.append(actual_time)
+            self.cost_model.update(zip(self.cost_model.nodes_keys(ind.graph),
+                                       ind.metadata['nodes_fit_time_in_seconds']), actual_time)
+        if predicted:
+            self.logger.info('Mean relative error of predicted evaluation time: %.2f',
+                             self.cost_model.relative_error(predicted, actual))
+
     def _cleanup_memory(self, graph: Graph):
         self._objective_eval.cleanup(graph)
         gc.collect()
@@ -106,10 +187,14 @@ def determine_n_jobs(n_jobs=-1, logger=None):
     if n_jobs > multiprocessing.cpu_count() or n_jobs == -1:
         n_jobs = multiprocessing.cpu_count()
     if logger:
-        logger.info(f"Number of used CPU's: {n_jobs}")
+        logger.info("Number of used CPU's: %s", n_jobs)
     return n_jobs
 
 
+def _none_as_inf(value: Optional[float], default: float = np.inf) -> float:
+    return default if value is None else value
+
+
 def _restrict_n_jobs_in_nodes(graph: OptGraph):
     """ Function to prevent memory overflow due to many processes running in time"""
     for node in graph.nodes:
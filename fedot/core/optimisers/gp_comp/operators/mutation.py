@@ -120,7 +120,7 @@ def mutation(types: List[Union[MutationTypesEnum, Callable]], params: 'GraphGene
     mutation_prob = requirements.mutation_prob
 
     for _ in range(MAX_NUM_OF_ATTEMPTS):
-        new_graph = deepcopy(ind.graph)
+        new_graph = ind.graph.clone()
         num_mut = max(int(round(np.random.lognormal(0, sigma=0.5))), 1)
 
         new_graph, mutation_names = _adapt_and_apply_mutations(new_graph=new_graph, mutation_prob=mutation_prob,
@@ -176,7 +176,7 @@ def simple_mutation(graph: Any, requirements, **kwargs) -> Any:
 
 
 def single_edge_mutation(graph: Any, max_depth, *args, **kwargs):
-    old_graph = deepcopy(graph)
+    old_graph = graph.clone()
 
     for _ in range(MAX_NUM_OF_ATTEMPTS):
         if len(graph.nodes) < 2 or graph.depth > max_depth:
@@ -1,7 +1,7 @@
-from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Callable, List, Optional
 
 from fedot.core.composer.constraint import constraint_function
+from fedot.core.dag.graph_operator import clone_nodes
 from fedot.core.optimisers.gp_comp.individual import Individual, ParentOperator
 from fedot.core.optimisers.gp_comp.operators.evaluation import EvaluationDispatcher
 from fedot.core.optimisers.graph import OptGraph
@@ -36,7 +36,7 @@ def decremental_regularization(population: List[Individual],
     prev_nodes_ids = []
     for ind in population:
         ind_subtrees = [node for node in ind.graph.nodes if node != ind.graph.root_node]
-        subtrees = [OptGraph(deepcopy(node.ordered_subnodes_hierarchy())) for node in ind_subtrees if
+        subtrees = [OptGraph(clone_nodes(node.ordered_subnodes_hierarchy())) for node in ind_subtrees if
                     is_fitted_subtree(node, prev_nodes_ids)]
         additional_inds += subtrees
         prev_nodes_ids += [subtree.root_node.descriptive_id for subtree in subtrees]
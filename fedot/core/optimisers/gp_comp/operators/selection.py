@@ -20,7 +20,9 @@ class SelectionTypesEnum(Enum):
 def selection(types: List[SelectionTypesEnum], population: List[Individual], pop_size: int,
               params: 'GraphGenerationParams') -> List[Any]:
     """
-    Selection of individuals based on specified type of selection
+    Selection of individuals based on specified type of selection.
+    Individuals with invalid fitness (e.g. penalised by the guarded evaluation) are selected
+    only if there are no individuals with valid fitness
     :param types: The set of selection types
     :param population: A list of individuals to select from.
     :param pop_size: The number of individuals to select.
@@ -34,7 +36,8 @@ def selection(types: List[SelectionTypesEnum], population: List[Individual], pop
 
     selection_type = choice(types)
     if selection_type in selection_by_type:
-        selected = selection_by_type[selection_type](population, pop_size)
+        valid_population = [ind for ind in population if ind.fitness.valid]
+        selected = selection_by_type[selection_type](valid_population or population, pop_size)
         return selected
     else:
         raise ValueError(f'Required selection not found: {selection_type}')
@@ -46,30 +49,34 @@ def individuals_selection(types: List[SelectionTypesEnum], individuals: List[Any
         chosen = individuals
     else:
         chosen = []
+        chosen_uids = set()
         remaining_individuals = individuals
         individuals_pool_size = len(individuals)
         n_iter = 0
         while len(chosen) < pop_size and n_iter < pop_size * 10 and remaining_individuals:
             individual = selection(types, remaining_individuals, pop_size=1, params=graph_params)[0]
-            if individual.uid not in (c.uid for c in chosen):
+            if individual.uid not in chosen_uids:
                 chosen.append(individual)
+                chosen_uids.add(individual.uid)
                 if pop_size <= individuals_pool_size:
-                    remaining_individuals.remove(individual)
+                    _remove_by_identity(remaining_individuals, individual)
             n_iter += 1
     return chosen
 
 
 def random_selection(individuals: List[Any], pop_size: int) -> List[int]:
+    if pop_size > 0 and not individuals:
+        return []
+    if pop_size > 0 and len(individuals) <= 1:
+        return [individuals[0]] * pop_size
     chosen = []
+    chosen_uids = set()
     n_iter = 0
     while len(chosen) < pop_size and n_iter < pop_size * 10:
-        if not individuals:
-            return []
-        if len(individuals) <= 1:
-            return [individuals[0]] * pop_size
         individual = choice(individuals)
-        if individual.uid not in (c.uid for c in chosen):
+        if individual.uid not in chosen_uids:
             chosen.append(individual)
+            chosen_uids.add(individual.uid)
     return chosen
 
 
@@ -78,13 +85,15 @@ def tournament_selection(individuals: List[Any], pop_size: int, fraction: float
     min_group_size = 2 if len(individuals) > 1 else 1
     group_size = max(group_size, min_group_size)
     chosen = []
+    chosen_uids = set()
     n_iter = 0
 
     while len(chosen) < pop_size and n_iter < pop_size * 10:
         group = random_selection(individuals, group_size)
         best = min(group, key=lambda ind: ind.fitness)
-        if best.uid not in (c.uid for c in chosen):
+        if best.uid not in chosen_uids:
             chosen.append(best)
+            chosen_uids.add(best.uid)
         n_iter += 1
 
     return chosen
@@ -98,3 +107,10 @@ def nsga2_selection(individuals: List[Any], pop_size: int) -> List[Any]:
 def spea2_selection(individuals: List[Any], pop_size: int) -> List[Any]:
     chosen = tools.selSPEA2(individuals, pop_size)
     return chosen
+
+
+def _remove_by_identity(individuals: List[Any], individual: Any):
+    """ Removes the individual from the list without the comparisons of individuals """
+    # Search of the same object is performed without calls of Individual.__eq__
+    index = next(i for i, ind in enumerate(individuals) if ind is individual)
+    del individuals[index]
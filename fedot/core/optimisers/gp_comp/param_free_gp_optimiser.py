@@ -72,10 +72,11 @@ class EvoGraphParameterFreeOptimiser(EvoGraphOptimiser):
             self.log_info_about_best()
 
             while not self.stop_optimisation():
-                self.log.info(f'Generation num: {self.generations.generation_num}')
-                self.log.info(f'max_depth: {self.max_depth}, no improvements: {self.generations.stagnation_duration}')
+                self.log.info('Generation num: %s', self.generations.generation_num)
+                self.log.info('max_depth: %s, no improvements: %s',
+                              self.max_depth, self.generations.stagnation_duration)
                 pop_size = self._pop_size.next(pop_size)
-                self.log.info(f'Next pop size: {pop_size}')
+                self.log.info('Next pop size: %s', pop_size)
 
                 # TODO: subst to mutation params
                 if self.parameters.with_auto_depth_configuration and self.generations.generation_num > 0:
@@ -128,7 +129,7 @@ class EvoGraphParameterFreeOptimiser(EvoGraphOptimiser):
                     self.operators_prob_update()
 
                 on_next_iteration_callback(self.population, self.generations.best_individuals)
-                self.log.info(f'spent time: {round(t.minutes_from_start, 1)} min')
+                self.log.info('spent time: %.1f min', t.minutes_from_start)
                 self.log_info_about_best()
 
                 clean_operators_history(self.population)
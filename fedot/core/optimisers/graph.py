@@ -157,6 +157,12 @@ class OptGraph:
         """
         self.operator.delete_subtree(self._node_adapter.restore(subroot))
 
+    def clone(self) -> 'OptGraph':
+        """
+        Copy of the graph structure and contents of nodes that shares the rest of attributes with the original
+        """
+        return self.operator.clone()
+
     def show(self, path: str = None):
         GraphVisualiser().visualise(self, path)
 
@@ -53,15 +53,16 @@ class PipelineObjectiveEvaluate(ObjectiveEvaluate[Pipeline]):
         #  when adapting and restoring it to/from OptGraph.
         graph.log = self._log
 
-        graph_id = graph.root_node.descriptive_id
-        self._log.debug(f'Pipeline {graph_id} fit started')
+        # Identifier of the graph is constructed only for the recorded messages
+        self._log.debug(lambda: f'Pipeline {graph.root_node.descriptive_id} fit started')
 
         folds_metrics = []
         for fold_id, (train_data, test_data) in enumerate(self._data_producer()):
             try:
                 prepared_pipeline = self.prepare_graph(graph, train_data, fold_id)
             except Exception as ex:
-                self._log.warn(f'Continuing after pipeline fit error <{ex}> for graph: {graph_id}')
+                self._log.warn('Continuing after pipeline fit error <%s> for graph: %s',
+                               ex, graph.root_node.descriptive_id)
                 continue
 
             evaluated_fitness = self._objective(prepared_pipeline,
@@ -70,12 +71,14 @@ class PipelineObjectiveEvaluate(ObjectiveEvaluate[Pipeline]):
             if evaluated_fitness.valid:
                 folds_metrics.append(evaluated_fitness.values)
             else:
-                self._log.warn(f'Continuing after objective evaluation error for graph: {graph_id}')
+                self._log.warn('Continuing after objective evaluation error for graph: %s',
+                               graph.root_node.descriptive_id)
                 continue
 
         if folds_metrics:
             folds_metrics = tuple(np.mean(folds_metrics, axis=0))  # averages for each metric over folds
-            self._log.debug(f'Pipeline {graph_id} with evaluated metrics: {folds_metrics}')
+            self._log.debug(lambda: f'Pipeline {graph.root_node.descriptive_id} '
+                                    f'with evaluated metrics: {folds_metrics}')
         else:
             folds_metrics = None
         return to_fitness(folds_metrics, self._objective.is_multi_objective)
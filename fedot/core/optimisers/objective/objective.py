@@ -28,7 +28,7 @@ class Objective:
                 metric_value = metric_func(graph, **kwargs)
                 evaluated_metrics.append(metric_value)
             except Exception as ex:
-                self._log.error(f'Objective evaluation error for graph {graph} on metric {metric}: {ex}')
+                self._log.error('Objective evaluation error for graph %s on metric %s: %s', graph, metric, ex)
                 return null_fitness()  # fail right away
         return to_fitness(evaluated_metrics, self.is_multi_objective)
 
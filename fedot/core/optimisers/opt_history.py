@@ -4,11 +4,11 @@ import json
 import os
 import shutil
 import warnings
-from copy import deepcopy
-from typing import Any, List, Optional, Union, Sequence
+from copy import copy, deepcopy
+from typing import Any, Dict, List, Optional, Sequence, Set, Union
 
 from fedot.core.optimisers.adapters import PipelineAdapter
-from fedot.core.optimisers.gp_comp.individual import Individual
+from fedot.core.optimisers.gp_comp.individual import Individual, IndividualRecord, ParentOperator
 from fedot.core.serializers import Serializer
 from fedot.core.optimisers.objective import Objective
 from fedot.core.visualisation.opt_viz import PipelineEvolutionVisualiser, PlotTypesEnum
@@ -21,21 +21,92 @@ from fedot.core.utils import default_fedot_data_dir
 class OptHistory:
     """
     Contain history, convert Pipeline to PipelineTemplate, save history to csv
+
+    :param objective: objective of the optimisation
+    :param save_folder: folder for the history saving
+    :param full_generations_number: number of the last generations kept with full graphs.
+    Older individuals are replaced with lightweight records (see IndividualRecord), except
+    the members of the current archive. If None, all individuals are kept with full graphs
     """
 
-    def __init__(self, objective: Objective = None, save_folder: Optional[str] = None):
+    def __init__(self, objective: Objective = None, save_folder: Optional[str] = None,
+                 full_generations_number: Optional[int] = None):
+        if full_generations_number is not None and full_generations_number < 1:
+            raise ValueError(f'Number of the generations kept with full graphs must be positive, '
+                             f'got {full_generations_number}')
         self._objective = objective or Objective([])
         self.individuals: List[List[Individual]] = []
         self.archive_history: List[List[Individual]] = []
         self.save_folder: Optional[str] = save_folder
+        self.full_generations_number = full_generations_number
+        # Records of the individuals and indices of the old generations with individuals kept with full graphs
+        # are the state of the retention policy, they are not serialized
+        self._records_by_uid: Dict[str, IndividualRecord] = {}
+        self._partially_compressed_generations: Set[int] = set()
 
     def add_to_history(self, individuals: List[Individual]):
-        new_inds = deepcopy(individuals)
+        new_inds = self._copy_individuals(individuals)
         self.individuals.append(new_inds)
+        archive_uids = {ind.uid for ind in self.archive_history[-1]} if self.archive_history else set()
+        self._compress_old_generations(self.individuals, self._partially_compressed_generations, archive_uids)
 
     def add_to_archive_history(self, individuals: List[Individual]):
-        new_inds = deepcopy(individuals)
+        new_inds = self._copy_individuals(individuals)
         self.archive_history.append(new_inds)
+        self._compress_old_generations(self.archive_history, set())
+
+    def _copy_individuals(self, individuals: List[Individual]) -> List[Individual]:
+        """ Copies the individuals for the history. With the retention policy the parents of the copies
+        are replaced with their records, so the copies don't drag the full graphs of the ancestry along """
+        if self.full_generations_number is None:
+            return deepcopy(individuals)
+        copied_individuals = []
+        for individual in individuals:
+            copied_individual = copy(individual)
+            copied_individual.graph = deepcopy(individual.graph)
+            copied_individual.fitness = deepcopy(individual.fitness)
+            copied_individual.metadata = deepcopy(individual.metadata)
+            copied_individual.parent_operators = [
+                ParentOperator(operator_name=operator.operator_name, operator_type=operator.operator_type,
+                               parent_individuals=[self._record(parent) for parent in operator.parent_individuals
+                                                   if parent is not None],
+                               uid=operator.uid)
+                for operator in individual.parent_operators]
+            copied_individuals.append(copied_individual)
+        return copied_individuals
+
+    def _record(self, individual: Individual) -> IndividualRecord:
+        return self._records_by_uid.get(individual.uid) or \
+            IndividualRecord.from_individual(individual, self._records_by_uid)
+
+    def _restore_retention_state(self):
+        """ Restores the state of the retention policy from the generations, e.g. after the deserialization """
+        self._records_by_uid = {ind.uid: ind for generation in self.individuals + self.archive_history
+                                for ind in generation if isinstance(ind, IndividualRecord)}
+        self._partially_compressed_generations = set()
+        if self.full_generations_number is not None:
+            self._partially_compressed_generations = {
+                generation_num for generation_num in range(len(self.individuals) - self.full_generations_number)
+                if any(not isinstance(ind, IndividualRecord) for ind in self.individuals[generation_num])}
+
+    def _compress_old_generations(self, generations: List[List[Individual]], partially_compressed: Set[int],
+                                  kept_uids: Set[str] = frozenset()):
+        """ Replaces individuals of the generation which has just become older than the last full_generations_number
+        with their records, except the individuals with kept_uids. Only the generations in partially_compressed
+        (with the individuals kept before) are checked again, they are updated in place """
+        if self.full_generations_number is None:
+            return
+        expired_generation_num = len(generations) - self.full_generations_number - 1
+        if expired_generation_num < 0:
+            return
+        for generation_num in sorted(partially_compressed | {expired_generation_num}):
+            generations[generation_num] = [ind if ind.uid in kept_uids or isinstance(ind, IndividualRecord)
+                                           else self._record(ind)
+                                           for ind in generations[generation_num]]
+            if any(not isinstance(ind, IndividualRecord) for ind in generations[generation_num]):
+                partially_compressed.add(generation_num)
+            else:
+                partially_compressed.discard(generation_num)
 
     def write_composer_history_to_csv(self, file='history.csv'):
         history_dir = self._get_save_path()
@@ -47,11 +118,13 @@ class OptHistory:
         adapter = PipelineAdapter()
         for gen_num, gen_inds in enumerate(self.individuals):
             for ind_num, ind in enumerate(gen_inds):
-                ind_pipeline_template = adapter.restore_as_template(ind.graph, ind.metadata)
-                row = [
-                    idx, gen_num, ind.fitness.values,
-                    len(ind_pipeline_template.operation_templates), ind_pipeline_template.depth, ind.metadata
-                ]
+                if isinstance(ind, IndividualRecord):
+                    operations_number, depth = len(ind.nodes), ind.depth
+                else:
+                    ind_pipeline_template = adapter.restore_as_template(ind.graph, ind.metadata)
+                    operations_number = len(ind_pipeline_template.operation_templates)
+                    depth = ind_pipeline_template.depth
+                row = [idx, gen_num, ind.fitness.values, operations_number, depth, ind.metadata]
                 self._add_history_to_csv(file, row)
                 idx += 1
 
@@ -212,12 +285,20 @@ class OptHistory:
 
     @property
     def historical_pipelines(self):
+        """Templates of pipelines of the individuals kept with full graphs"""
         adapter = PipelineAdapter()
         return [
             adapter.restore_as_template(ind.graph, ind.metadata)
             for ind in list(itertools.chain(*self.individuals))
+            if not isinstance(ind, IndividualRecord)
         ]
 
+    @property
+    def historical_pipelines_quality(self):
+        """Quality of the individuals kept with full graphs in the order of historical_pipelines"""
+        return [quality for quality, ind in zip(self.all_historical_quality, itertools.chain(*self.individuals))
+                if not isinstance(ind, IndividualRecord)]
+
     def _get_save_path(self):
         if self.save_folder is not None:
             if os.path.sep in self.save_folder:
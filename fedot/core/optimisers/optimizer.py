@@ -23,17 +23,21 @@ class GraphOptimiserParameters:
         :param depth_increase_step: the step of depth increase in automated depth configuration
         :param multi_objective: flag used for of algorithm type definition (multi-objective if true or single-objective
         if false). Value is defined in ComposerBuilder. Default False.
+        :param history_full_generations: number of the last generations kept in the history with full graphs,
+        older individuals are kept as lightweight records. If None, all individuals are kept with full graphs.
     """
 
     def __init__(self,
                  with_auto_depth_configuration: bool = False, depth_increase_step: int = 3,
                  multi_objective: bool = False, history_folder: str = None,
-                 stopping_after_n_generation: int = 10):
+                 stopping_after_n_generation: int = 10,
+                 history_full_generations: Optional[int] = None):
         self.with_auto_depth_configuration = with_auto_depth_configuration
         self.depth_increase_step = depth_increase_step
         self.multi_objective = multi_objective
         self.history_folder = history_folder
         self.stopping_after_n_generation = stopping_after_n_generation
+        self.history_full_generations = history_full_generations
 
 
 class GraphOptimiser:
@@ -75,7 +79,7 @@ class GraphOptimiser:
         if initial_graph and not isinstance(initial_graph, Sequence):
             initial_graph = [initial_graph]
         self.initial_graph = initial_graph
-        self.history = OptHistory(objective, parameters.history_folder)
+        self.history = OptHistory(objective, parameters.history_folder, parameters.history_full_generations)
         self.history.clean_results()
 
     @property
@@ -0,0 +1,156 @@
+import json
+import mmap
+import os
+import pickle
+import struct
+import sys
+from io import BytesIO
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+ARTIFACT_MAGIC = b'FEDOTART'
+ARTIFACT_VERSION = 1
+# Out-of-band buffers of the pickle protocol 5 are available since Python 3.8
+ARTIFACTS_SUPPORTED = sys.version_info >= (3, 8)
+
+# Out-of-band buffers are aligned to the cache line size in the file (and therefore in the mapped memory)
+BUFFER_ALIGNMENT = 64
+# Smaller arrays are kept inside the pickle stream, mapping them does not pay off
+MIN_MAPPED_BUFFER_BYTES = 1024
+
+_PREAMBLE = struct.Struct('<8sIQ')
+
+
+def _aligned(offset: int, alignment: int = BUFFER_ALIGNMENT) -> int:
+    return (offset + alignment - 1) // alignment * alignment
+
+
+def _check_artifacts_supported():
+    if not ARTIFACTS_SUPPORTED:
+        raise EnvironmentError('Binary pipeline artifacts require pickle protocol 5 (Python 3.8+)')
+
+
+class _ContiguousArraysPickler(pickle.Pickler):
+    """ Pickler which makes large non-contiguous arrays contiguous, so they can be stored out-of-band """
+
+    def __init__(self, file, min_mapped_bytes: int, **kwargs):
+        super().__init__(file, **kwargs)
+        self.min_mapped_bytes = min_mapped_bytes
+
+    def reducer_override(self, obj):
+        if (type(obj) is np.ndarray and obj.nbytes >= self.min_mapped_bytes and not obj.dtype.hasobject and
+                not obj.flags.c_contiguous and not obj.flags.f_contiguous):
+            return np.ascontiguousarray(obj).__reduce_ex__(5)
+        return NotImplemented
+
+
+class PipelineArtifactWriter:
+    """
+    Single-file binary container for a fitted pipeline.
+
+    The file consists of a fixed preamble (magic, version, header length), a JSON header
+    with the pipeline structure and the index of stored objects, and an aligned data section.
+    Objects are pickled with protocol 5, so large contiguous numpy arrays inside them
+    (linear weights, PCA components, etc.) are stored out-of-band as raw aligned buffers
+    which can be memory-mapped on load and shared between processes.
+
+    :param min_mapped_bytes: minimal size of array buffer to store it out-of-band
+    """
+
+    def __init__(self, min_mapped_bytes: int = MIN_MAPPED_BUFFER_BYTES):
+        _check_artifacts_supported()
+        self.min_mapped_bytes = min_mapped_bytes
+        self._chunks: List[Tuple[int, Any]] = []
+        self._objects: Dict[str, dict] = {}
+        self._data_size = 0
+
+    def add_object(self, name: str, obj: Any):
+        """ Pickle object and register its stream and out-of-band buffers in the data section """
+        buffers = []
+
+        def buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+            # Returning True keeps the buffer in-band
+            if buffer.raw().nbytes < self.min_mapped_bytes:
+                return True
+            buffers.append(buffer)
+            return False
+
+        stream = BytesIO()
+        _ContiguousArraysPickler(stream, self.min_mapped_bytes,
+                                 protocol=5, buffer_callback=buffer_callback).dump(obj)
+        buffers_index = [self._append_chunk(buffer.raw()) for buffer in buffers]
+        stream_offset, stream_length = self._append_chunk(stream.getbuffer())
+        self._objects[name] = {'offset': stream_offset, 'length': stream_length, 'buffers': buffers_index}
+
+    def _append_chunk(self, data: memoryview) -> Tuple[int, int]:
+        offset = _aligned(self._data_size)
+        self._chunks.append((offset, data))
+        self._data_size = offset + data.nbytes
+        return offset, data.nbytes
+
+    def write(self, path: str, structure: dict):
+        header = json.dumps({'pipeline': structure, 'objects': self._objects}).encode('utf-8')
+        data_start = _aligned(_PREAMBLE.size + len(header))
+
+        with open(path, 'wb') as file:
+            file.write(_PREAMBLE.pack(ARTIFACT_MAGIC, ARTIFACT_VERSION, len(header)))
+            file.write(header)
+            for offset, data in self._chunks:
+                file.seek(data_start + offset)
+                file.write(data)
+            # Trailing padding is not written, the size of the file is fixed explicitly
+            file.truncate(data_start + self._data_size)
+
+
+class PipelineArtifactReader:
+    """
+    Reader for files created by :class:`PipelineArtifactWriter`.
+
+    :param path: path to the artifact file
+    :param mmap_arrays: if True, the data section is memory-mapped in read-only mode and the
+    restored arrays are views into the shared mapping, otherwise it is read into private memory
+    """
+
+    def __init__(self, path: str, mmap_arrays: bool = True):
+        _check_artifacts_supported()
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f'The path to load a pipeline artifact is not correct: {os.path.abspath(path)}.')
+
+        with open(path, 'rb') as file:
+            magic, version, header_length = _PREAMBLE.unpack(file.read(_PREAMBLE.size))
+            if magic != ARTIFACT_MAGIC:
+                raise ValueError(f'File {path} is not a FEDOT pipeline artifact')
+            if version > ARTIFACT_VERSION:
+                raise ValueError(f'Unsupported pipeline artifact version {version}')
+            header = json.loads(file.read(header_length).decode('utf-8'))
+
+            self._data_start = _aligned(_PREAMBLE.size + header_length)
+            if mmap_arrays:
+                self._data = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+            else:
+                file.seek(0)
+                self._data = memoryview(bytearray(file.read()))
+
+        self.structure: dict = header['pipeline']
+        self._objects: Dict[str, dict] = header['objects']
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._objects
+
+    @property
+    def object_names(self) -> List[str]:
+        return list(self._objects)
+
+    def load_object(self, name: str) -> Optional[Any]:
+        """ Restore the object. Its large arrays are zero-copy views into the data section """
+        if name not in self._objects:
+            return None
+        description = self._objects[name]
+        buffers = [self._chunk(offset, length) for offset, length in description['buffers']]
+        stream = self._chunk(description['offset'], description['length'])
+        return pickle.loads(stream, buffers=buffers)
+
+    def _chunk(self, offset: int, length: int) -> memoryview:
+        start = self._data_start + offset
+        return self._data[start:start + length]
@@ -0,0 +1,151 @@
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+
+import numpy as np
+
+from fedot.core.data.array_utilities import as_float_precision, atleast_2d
+from fedot.core.data.data import InputData
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+from fedot.preprocessing.structure import DEFAULT_SOURCE_NAME
+
+if TYPE_CHECKING:
+    from fedot.core.pipelines.node import Node
+    from fedot.core.pipelines.pipeline import Pipeline
+
+SUPPORTED_TASK_TYPES = (TaskTypesEnum.classification, TaskTypesEnum.regression)
+
+
+class InferencePlan:
+    """
+    Flat plan of the inference of the fitted pipeline on numerical tables. The nodes are ordered
+    topologically once, their operations are resolved into functions on tables and the obligatory
+    preprocessing of the pipeline is folded into array operations, so the prediction neither copies
+    the data deeply nor constructs InputData and OutputData on every step.
+    Predictions are the same as the ones of the 'predict' method of the pipeline. Tables with gaps or
+    infinite values are predicted by the pipeline itself, because their imputation depends on the table.
+
+    :param pipeline: fitted pipeline for classification or regression on tabular data
+    :param task: task of the data for prediction
+    :param output_mode: desired form of output of the pipeline (see Pipeline.predict)
+    :param precision: float precision of the data for prediction ('float32' or 'float64'), None to keep it
+    """
+
+    def __init__(self, pipeline: 'Pipeline', task: Task, output_mode: str = 'default',
+                 precision: Optional[str] = None):
+        if not pipeline.is_fitted:
+            raise ValueError('Pipeline is not fitted yet')
+        if task.task_type not in SUPPORTED_TASK_TYPES:
+            raise ValueError(f'Inference plan is not supported for {task.task_type} task')
+        if precision not in (None, 'float32', 'float64'):
+            raise ValueError(f'Precision {precision} is not supported, use "float32" or "float64"')
+
+        self.pipeline = pipeline
+        self.task = task
+        self.output_mode = output_mode
+        self.precision = precision
+
+        self._relevant_features_ids, self._int_features_ids, self._int_table = \
+            self._compile_preprocessing()
+        # Functions of nodes in topological order with the positions of their parents in it
+        self._steps: List[Tuple[Callable[[np.ndarray], np.ndarray], List[int]]] = []
+        self._root_node = pipeline.root_node
+        self._compile_node(self._root_node, steps_positions={})
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        """
+        Predict with the pipeline on the numerical features table
+
+        :param features: features table (one-dimensional array is treated as the single feature column)
+        :return: prediction of the pipeline as 'predict' field of the output of Pipeline.predict
+        """
+        features = np.asarray(features)
+        if features.ndim < 2:
+            features = features.reshape((-1, 1))
+        if features.dtype.kind not in 'biuf' or not np.isfinite(features).all():
+            return self._predict_by_pipeline(features)
+
+        outputs = []
+        table = self._preprocess(features)
+        for predict, parents_positions in self._steps:
+            if not parents_positions:
+                step_input = table
+            elif len(parents_positions) == 1:
+                step_input = atleast_2d(outputs[parents_positions[0]])
+            else:
+                step_input = np.concatenate([atleast_2d(outputs[position]) for position in parents_positions],
+                                            axis=-1)
+            outputs.append(as_float_precision(predict(step_input), self.precision))
+
+        prediction = outputs[-1]
+        if self.output_mode == 'labels':
+            prediction = self.pipeline.preprocessor.apply_inverse_target_encoding(prediction)
+        return prediction
+
+    def _compile_preprocessing(self) -> Tuple[Optional[List[int]], List[int], bool]:
+        """ Folds the obligatory preprocessing for predict into the selection of relevant features
+        and the conversion of integer features """
+        preprocessor = self.pipeline.preprocessor
+        types_corrector = preprocessor.types_correctors.get(DEFAULT_SOURCE_NAME)
+        if types_corrector is None or types_corrector.features_types is None:
+            raise ValueError('Preprocessing of the pipeline is not fitted on the single table')
+
+        features_types = types_corrector.features_types
+        binary_processor = preprocessor.binary_categorical_processors[DEFAULT_SOURCE_NAME]
+        has_categorical_preprocessing = any('str' in type_name for type_name in features_types) or \
+            types_corrector.numerical_into_str or types_corrector.categorical_into_float or \
+            types_corrector.string_columns_transformation_failed or \
+            'removed' in types_corrector.features_converted_columns.values() or \
+            binary_processor.binary_ids_to_convert or DEFAULT_SOURCE_NAME in preprocessor.features_encoders
+        if has_categorical_preprocessing:
+            raise ValueError('Inference plan is supported only for pipelines fitted on numerical features')
+
+        relevant_features_ids = preprocessor.ids_relevant_features.get(DEFAULT_SOURCE_NAME) or None
+        int_features_ids = [column_id for column_id, type_name in enumerate(features_types) if 'int' in type_name]
+        # Table of integer columns only stays integer after preprocessing, otherwise it is float one
+        int_table = len(int_features_ids) == len(features_types)
+        return relevant_features_ids, int_features_ids, int_table
+
+    def _compile_node(self, node: 'Node', steps_positions: dict) -> int:
+        """ Adds the steps of the node and its parents into the plan (once for a node)
+        and returns the position of the node step """
+        if id(node) in steps_positions:
+            return steps_positions[id(node)]
+        if getattr(node, 'direct_set', False):
+            raise ValueError(f'Inference plan is not supported for the data set directly to node {node}')
+
+        # Parents are ordered as in the merge of their outputs by the pipeline
+        parents = sorted(node.nodes_from or [], key=lambda parent: parent.descriptive_id)
+        parents_positions = [self._compile_node(parent, steps_positions) for parent in parents]
+
+        output_mode = self.output_mode if node is self._root_node else 'default'
+        try:
+            predict = node.operation.compile_predict(node.fitted_operation, self.task,
+                                                     params=node.content['params'], output_mode=output_mode)
+        except NotImplementedError as ex:
+            raise ValueError(f'Inference plan is not supported for the operation {node.operation}') from ex
+
+        self._steps.append((predict, parents_positions))
+        steps_positions[id(node)] = len(self._steps) - 1
+        return steps_positions[id(node)]
+
+    def _preprocess(self, features: np.ndarray) -> np.ndarray:
+        """ Obligatory preprocessing of the numerical table without gaps as in the pipeline """
+        features = as_float_precision(features, self.precision)
+        if self._relevant_features_ids is not None:
+            features = features[:, self._relevant_features_ids]
+
+        if self._int_table:
+            table = features.astype(int)
+        elif self._int_features_ids:
+            table = features.astype(float)
+            table[:, self._int_features_ids] = np.trunc(table[:, self._int_features_ids])
+        else:
+            table = np.asarray(features, dtype=float)
+        return as_float_precision(table, self.precision)
+
+    def _predict_by_pipeline(self, features: np.ndarray) -> np.ndarray:
+        input_data = InputData(idx=np.arange(len(features)), features=features, target=None,
+                               task=self.task, data_type=DataTypesEnum.table)
+        if self.precision is not None:
+            input_data.precision = self.precision
+        return self.pipeline.predict(input_data, output_mode=self.output_mode).predict
@@ -67,6 +67,8 @@ class Node(GraphNode):
         self.log = log or default_log(__name__)
         self._fitted_operation = None
         self.rating = None
+        # Prediction of the node on the current chunk of data during incremental fit
+        self.chunk_predict = None
 
     def _process_content_init(self, passed_content: dict) -> Operation:
         """ Updating content in the node """
@@ -186,6 +188,20 @@ class Node(GraphNode):
             self.update_params()
         return operation_predict
 
+    def partial_fit(self, input_data: InputData) -> OutputData:
+        """
+        Run incremental training process in the node on the chunk of data
+
+        :param input_data: chunk of data used for operation training
+        """
+        with Timer(log=self.log) as t:
+            self.fitted_operation, operation_predict = \
+                self.operation.partial_fit(params=self.content['params'], data=input_data,
+                                           fitted_operation=self.fitted_operation)
+            self.fit_time_in_seconds = round(t.seconds_from_start, 3)
+        self.chunk_predict = operation_predict
+        return operation_predict
+
     def predict(self, input_data: InputData, output_mode: str = 'default') -> OutputData:
         """
         Run prediction process in the node
@@ -263,7 +279,7 @@ class PrimaryNode(Node):
 
         :param input_data: data used for operation training
         """
-        self.log.ext_debug(f'Trying to fit primary node with operation: {self.operation}')
+        self.log.ext_debug('Trying to fit primary node with operation: %s', self.operation)
 
         if self.direct_set:
             input_data = self.node_data
@@ -271,6 +287,23 @@ class PrimaryNode(Node):
             self.node_data = input_data
         return super().fit(input_data)
 
+    def partial_fit(self, input_data: InputData, **kwargs) -> OutputData:
+        """
+        Incremental fit of the operation located in the primary node on the chunk of data
+
+        :param input_data: chunk of data used for operation training
+        """
+        if self.chunk_predict is not None:
+            # The node has been already trained on the chunk as a parent of another node
+            return self.chunk_predict
+        self.log.ext_debug('Trying to fit primary node incrementally with operation: %s', self.operation)
+
+        if self.direct_set:
+            input_data = self.node_data
+        else:
+            self.node_data = input_data
+        return super().partial_fit(input_data)
+
     def unfit(self):
         self.fitted_operation = None
         if hasattr(self, 'node_data'):
@@ -284,7 +317,7 @@ class PrimaryNode(Node):
         :param input_data: data used for prediction
         :param output_mode: desired output for operations (e.g. labels, probs, full_probs)
         """
-        self.log.ext_debug(f'Predict in primary node by operation: {self.operation}')
+        self.log.ext_debug('Predict in primary node by operation: %s', self.operation)
 
         if self.direct_set:
             input_data = self.node_data
@@ -333,12 +366,27 @@ class SecondaryNode(Node):
 
         :param input_data: data used for operation training
         """
-        self.log.ext_debug(f'Trying to fit secondary node with operation: {self.operation}')
+        self.log.ext_debug('Trying to fit secondary node with operation: %s', self.operation)
 
         secondary_input = self._input_from_parents(input_data=input_data, parent_operation='fit')
 
         return super().fit(input_data=secondary_input)
 
+    def partial_fit(self, input_data: InputData, **kwargs) -> OutputData:
+        """
+        Incremental fit of the operation located in the secondary node on the chunk of data
+
+        :param input_data: chunk of data used for operation training
+        """
+        if self.chunk_predict is not None:
+            # The node has been already trained on the chunk as a parent of another node
+            return self.chunk_predict
+        self.log.ext_debug('Trying to fit secondary node incrementally with operation: %s', self.operation)
+
+        secondary_input = self._input_from_parents(input_data=input_data, parent_operation='partial_fit')
+
+        return super().partial_fit(input_data=secondary_input)
+
     def predict(self, input_data: InputData, output_mode: str = 'default') -> OutputData:
         """
         Predict using the operation located in the secondary node
@@ -346,7 +394,7 @@ class SecondaryNode(Node):
         :param input_data: data used for prediction
         :param output_mode: desired output for operations (e.g. labels, probs, full_probs)
         """
-        self.log.ext_debug(f'Obtain prediction in secondary node with operation: {self.operation}')
+        self.log.ext_debug('Obtain prediction in secondary node with operation: %s', self.operation)
 
         secondary_input = self._input_from_parents(input_data=input_data,
                                                    parent_operation='predict')
@@ -358,7 +406,7 @@ class SecondaryNode(Node):
         if len(self.nodes_from) == 0:
             raise ValueError('No parent nodes found')
 
-        self.log.ext_debug(f'Fit all parent nodes in secondary node with operation: {self.operation}')
+        self.log.ext_debug('Fit all parent nodes in secondary node with operation: %s', self.operation)
 
         parent_nodes = self._nodes_from_with_fixed_order()
 
@@ -388,7 +436,7 @@ def _combine_parents(parent_nodes: List[Node],
     :param parent_nodes: list of parent nodes, from which predictions will
     be combined
     :param input_data: input data from pipeline abstraction (source input data)
-    :param parent_operation: name of parent operation (fit or predict)
+    :param parent_operation: name of parent operation (fit, partial_fit or predict)
     :return parent_results: list with OutputData from parent nodes
     :return target: target for final pipeline prediction
     """
@@ -404,6 +452,9 @@ def _combine_parents(parent_nodes: List[Node],
         elif parent_operation == 'fit':
             prediction = parent.fit(input_data=input_data)
             parent_results.append(prediction)
+        elif parent_operation == 'partial_fit':
+            prediction = parent.partial_fit(input_data=input_data)
+            parent_results.append(prediction)
         else:
             raise NotImplementedError()
 
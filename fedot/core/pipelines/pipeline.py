@@ -14,10 +14,11 @@ from fedot.core.log import Log, default_log
 from fedot.core.operations.data_operation import DataOperation
 from fedot.core.operations.model import Model
 from fedot.core.optimisers.timer import Timer
+from fedot.core.pipelines.inference_plan import InferencePlan
 from fedot.core.pipelines.node import Node, PrimaryNode, SecondaryNode
 from fedot.core.pipelines.template import PipelineTemplate
 from fedot.core.pipelines.tuning.unified import PipelineTuner
-from fedot.core.repository.tasks import TaskTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
 from fedot.preprocessing.preprocessing import DataPreprocessor, update_indices_for_time_series
 
 ERROR_PREFIX = 'Invalid pipeline configuration:'
@@ -167,10 +168,58 @@ class Pipeline(Graph):
                                                         time=time_constraint)
         return train_predicted
 
+    def partial_fit(self, input_data: InputData) -> OutputData:
+        """
+        Run incremental training process in all nodes in pipeline on the chunk of data.
+        It allows to train the pipeline on the data which doesn't fit into memory
+        chunk by chunk (e.g. obtained with InputData.from_csv_chunks).
+        All the operations in pipeline must be tagged as 'incremental',
+        the preprocessing is fitted on the first chunk
+
+        :param input_data: chunk of data used for operation training
+        :return: prediction on the chunk
+        """
+        not_incremental_operations = [str(node) for node in self.nodes if 'incremental' not in (node.tags or [])]
+        if not_incremental_operations:
+            raise ValueError(f'Operations {not_incremental_operations} do not support incremental fit')
+
+        is_first_chunk = not self.is_fitted
+        if is_first_chunk:
+            self.unfit(mode='all', unfit_preprocessor=True)
+
+        # Make copy of the input data to avoid performing inplace operations
+        copied_input_data = deepcopy(input_data)
+        copied_input_data = self.preprocessor.obligatory_prepare_for_partial_fit(copied_input_data)
+        if is_first_chunk:
+            copied_input_data = self.preprocessor.optional_prepare_for_fit(pipeline=self, data=copied_input_data)
+        else:
+            copied_input_data = self.preprocessor.optional_prepare_for_predict(pipeline=self,
+                                                                               data=copied_input_data)
+        copied_input_data = self.preprocessor.convert_indexes_for_fit(pipeline=self, data=copied_input_data)
+
+        copied_input_data = self._assign_data_to_nodes(copied_input_data)
+
+        try:
+            train_predicted = self.root_node.partial_fit(input_data=copied_input_data)
+        finally:
+            # Predictions on the chunk are not needed for the next chunks
+            for node in self.nodes:
+                node.chunk_predict = None
+        return train_predicted
+
     @property
     def is_fitted(self):
         return all(node.fitted_operation is not None for node in self.nodes)
 
+    def clone(self) -> 'Pipeline':
+        """
+        Unfitted copy of the pipeline structure with operations and their params
+        (operations objects are shared with the original pipeline)
+        """
+        pipeline = super().clone()
+        pipeline.unfit()
+        return pipeline
+
     def unfit(self, mode='all', unfit_preprocessor: bool = True):
         """
         Remove fitted operations for all nodes.
@@ -228,6 +277,20 @@ class Pipeline(Graph):
             result.predict = self.preprocessor.apply_inverse_target_encoding(result.predict)
         return result
 
+    def compile_inference_plan(self, task: Task, output_mode: str = 'default',
+                               precision: Optional[str] = None) -> InferencePlan:
+        """
+        Compile the fitted pipeline into the flat plan for the low-latency prediction on numerical tables
+        (e.g. for the online scoring of single rows or small batches).
+        Predictions of the plan are the same as the ones of the 'predict' method.
+
+        :param task: task of the data for prediction
+        :param output_mode: desired form of output of the plan (see 'predict')
+        :param precision: float precision of the data for prediction ('float32' or 'float64'), None to keep it
+        :return: plan with 'predict' method from the features table to the prediction
+        """
+        return InferencePlan(self, task, output_mode, precision)
+
     def fine_tune_all_nodes(self, loss_function: Callable,
                             loss_params: dict = None,
                             input_data: Union[InputData, MultiModalData] = None,
@@ -282,6 +345,30 @@ class Pipeline(Graph):
         self.template = PipelineTemplate(self, self.log)
         self.template.import_pipeline(source, dict_fitted_operations)
 
+    def save_artifact(self, path: str) -> str:
+        """
+        Save the pipeline with fitted operations and preprocessor into a single binary file.
+        Large arrays of fitted operations are stored in the aligned section of the file
+        allowing to memory-map them on load. Requires Python 3.8+.
+
+        :param path: path to the file
+        :return: absolute path to the saved file
+        """
+        self.template = PipelineTemplate(self, self.log)
+        return self.template.export_pipeline_artifact(path, root_node=self.root_node)
+
+    def load_artifact(self, path: str, mmap_arrays: bool = True):
+        """
+        Load the pipeline from the binary file created by 'save_artifact'.
+
+        :param path: path to the file
+        :param mmap_arrays: if True, large arrays of fitted operations are read-only views into
+        the memory-mapped file, so the processes loading the same artifact share them
+        """
+        self.nodes = []
+        self.template = PipelineTemplate(self, self.log)
+        self.template.import_pipeline_artifact(path, mmap_arrays)
+
     def __eq__(self, other) -> bool:
         return self.root_node.descriptive_id == other.root_node.descriptive_id
 
@@ -12,6 +12,7 @@ import numpy as np
 from fedot.core.log import Log, default_log
 from fedot.core.operations.atomized_template import AtomizedModelTemplate
 from fedot.core.operations.operation_template import OperationTemplate, check_existing_path
+from fedot.core.pipelines.artifact import PipelineArtifactReader, PipelineArtifactWriter
 from fedot.core.pipelines.node import Node, PrimaryNode, SecondaryNode
 from fedot.core.utilities.data_structures import ensure_wrapped_in_sequence
 from fedot.core.utils import default_fedot_data_dir
@@ -139,6 +140,34 @@ class PipelineTemplate:
 
         return json_data, dict_fitted_operations
 
+    def export_pipeline_artifact(self, path: str, root_node: Node = None) -> str:
+        """
+        Save the pipeline into a single binary file. Large numpy arrays of the fitted
+        operations and the preprocessor are stored in an aligned section which can be memory-mapped on load.
+        :param path: path to the file to save
+        :param root_node: root node of exported pipeline
+        :return: absolute path to the saved file
+        """
+        for operation in self.operation_templates:
+            if isinstance(operation, AtomizedModelTemplate) or 'h2o' in operation.operation_type:
+                message = f'Operation {operation.operation_type} cannot be saved into a binary artifact'
+                self.log.error(message)
+                raise TypeError(message)
+
+        pipeline_template_dict = self.convert_to_dict(root_node)
+        writer = PipelineArtifactWriter()
+        for operation in self.operation_templates:
+            if operation.fitted_operation:
+                writer.add_object(f'operation_{operation.operation_id}', operation.fitted_operation)
+        if self.data_preprocessor is not None:
+            writer.add_object('preprocessing', self.data_preprocessor)
+
+        absolute_path = os.path.abspath(path)
+        check_existing_path(os.path.dirname(absolute_path))
+        writer.write(absolute_path, json.loads(json.dumps(pipeline_template_dict, cls=NumpyIntEncoder)))
+        self.log.debug(f'The pipeline artifact saved in the path: {absolute_path}.')
+        return absolute_path
+
     def convert_to_dict(self, root_node: Node = None) -> dict:
         """ Generate pipeline description in a form of dictionary """
 
@@ -218,6 +247,26 @@ class PipelineTemplate:
         self.convert_to_pipeline(self.link_to_empty_pipeline, path, dict_fitted_operations)
         self.depth = self.link_to_empty_pipeline.depth
 
+    def import_pipeline_artifact(self, path: str, mmap_arrays: bool = True):
+        """
+        Load the pipeline from the binary file created by 'export_pipeline_artifact'.
+        :param path: path to the file
+        :param mmap_arrays: if True, arrays of fitted operations are read-only views into
+        the memory-mapped file shared between all processes loading the same artifact
+        """
+        reader = PipelineArtifactReader(path, mmap_arrays)
+        self.log.debug(f'The pipeline artifact was imported from the path: {path}.')
+
+        self._extract_operations(reader.structure, None)
+        dict_fitted_operations = None
+        if reader.object_names:
+            dict_fitted_operations = {f'operation_{operation.operation_id}':
+                                      reader.load_object(f'operation_{operation.operation_id}')
+                                      for operation in self.operation_templates}
+            dict_fitted_operations['preprocessing'] = reader.load_object('preprocessing')
+        self.convert_to_pipeline(self.link_to_empty_pipeline, None, dict_fitted_operations)
+        self.depth = self.link_to_empty_pipeline.depth
+
     def _check_path_correct(self, path: str):
         absolute_path = os.path.abspath(path)
         name_of_file = os.path.basename(absolute_path)
@@ -262,9 +311,15 @@ class PipelineTemplate:
                 restored_data_preprocessor = joblib.load(path_to_preprocessor)
                 pipeline.preprocessor = restored_data_preprocessor
         elif dict_fitted_operations is not None and 'preprocessing' in dict_fitted_operations:
+            preprocessor = dict_fitted_operations['preprocessing']
+            if not _is_serialized(preprocessor):
+                # Preprocessor was already restored (e.g. from the binary artifact)
+                if preprocessor is not None:
+                    pipeline.preprocessor = preprocessor
+                return
             tmp_path = os.path.join(default_fedot_data_dir(), 'preprocessing.tmp')
             with open(tmp_path, 'wb') as f:
-                f.write(BytesIO(dict_fitted_operations['preprocessing']).getbuffer())
+                f.write(BytesIO(preprocessor).getbuffer())
             pipeline.preprocessor = joblib.load(tmp_path)
             os.remove(tmp_path)
 
@@ -319,7 +374,9 @@ class PipelineTemplate:
                 self.log.error(message)
                 raise TypeError(message)
             else:
-                fitted_operation = joblib.load(dict_fitted_operations[f'operation_{operation_object.operation_id}'])
+                fitted_operation = dict_fitted_operations[f'operation_{operation_object.operation_id}']
+                if _is_serialized(fitted_operation):
+                    fitted_operation = joblib.load(fitted_operation)
 
         operation_object.fitted_operation = fitted_operation
         node.fitted_operation = fitted_operation
@@ -355,6 +412,11 @@ def _is_nested_path(path):
     return path.find('nested') == -1
 
 
+def _is_serialized(fitted_object) -> bool:
+    """ Check if the object is a dump of fitted operation (or path to it) rather than the operation itself """
+    return isinstance(fitted_object, (str, bytes, bytearray, BytesIO))
+
+
 def extract_subtree_root(root_operation_id: int, pipeline_template: PipelineTemplate):
     root_node = [operation_template for operation_template in pipeline_template.operation_templates
                  if operation_template.operation_id == root_operation_id][0]
@@ -1,13 +1,14 @@
 from copy import copy
-from typing import Union
+from typing import Dict, Optional, Sequence, Union
 
 import numpy as np
 
 from fedot.core.data.data import InputData, OutputData
+from fedot.core.data.merge.data_merger import DataMerger
 from fedot.core.data.multi_modal import MultiModalData
 from fedot.core.operations.evaluation.operation_implementations.data_operations.ts_transformations import ts_to_table
 from fedot.core.repository.dataset_types import DataTypesEnum
-from fedot.core.repository.tasks import TaskTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
 
 
 def out_of_sample_ts_forecast(pipeline, input_data: InputData,
@@ -78,6 +79,93 @@ def out_of_sample_ts_forecast(pipeline, input_data: InputData,
     return final_forecast
 
 
+def out_of_sample_ts_forecast_batch(pipeline, time_series: Union[np.array, Sequence[np.array]],
+                                    task: Task, horizon: int = None) -> np.array:
+    """
+    Method allows to make out-of-sample forecast for a batch of time series with the same
+    fitted pipeline. Results are the same as the results of 'out_of_sample_ts_forecast'
+    applied to each time series separately.
+
+    If all primary nodes of the pipeline are lagged transformations and the rest of the nodes
+    process tables, each forecasting step is performed for the whole batch at once: the lagged
+    windows of all time series are stacked into one table. Otherwise, the time series are
+    forecasted one by one.
+
+    :param pipeline: fitted Pipeline for making time series forecasting
+    :param time_series: 2d array with time series in rows or sequence of time series with different lengths
+    :param task: time series forecasting task
+    :param horizon: forecasting horizon
+    :return final_forecast: 2d array with forecasts, one row for each time series
+    """
+    exception_if_not_ts_task(task)
+    scope_len = task.task_params.forecast_length
+    horizon = horizon or scope_len
+    number_of_iterations = _calculate_number_of_steps(scope_len, horizon)
+
+    time_series = [np.ravel(ts) for ts in time_series]
+    window_sizes = _lagged_window_sizes(pipeline)
+    history_len = max(window_sizes.values()) if window_sizes else None
+    if history_len is None or any(len(ts) < history_len + scope_len for ts in time_series):
+        # The pipeline can not be applied to the batch (or window sizes would be corrected for
+        # too short time series), so forecast time series one by one
+        final_forecast = np.empty((len(time_series), horizon))
+        for ts_id, ts in enumerate(time_series):
+            final_forecast[ts_id] = out_of_sample_ts_forecast(pipeline, _update_input(ts, scope_len, task), horizon)
+        return final_forecast
+
+    # Only the last part of each time series is required for the lagged transformation
+    buffer = np.empty((len(time_series), history_len + number_of_iterations * scope_len))
+    for ts_id, ts in enumerate(time_series):
+        buffer[ts_id, :history_len] = ts[-history_len:]
+
+    # Make forecast iteratively moving throw the horizon, predicted parts are written into the buffer
+    for iteration in range(number_of_iterations):
+        end_of_history = history_len + iteration * scope_len
+        iter_predict = _batch_node_predict(pipeline.root_node, buffer[:, :end_of_history], window_sizes, task, {})
+        buffer[:, end_of_history:end_of_history + scope_len] = iter_predict.reshape((len(time_series), -1))
+
+    return buffer[:, history_len:history_len + horizon]
+
+
+def _lagged_window_sizes(pipeline) -> Optional[Dict[int, int]]:
+    """ Returns window sizes of the lagged primary nodes (by node ids) if the pipeline
+    forecasts time series only by their last values. Otherwise, returns None """
+    window_sizes = {}
+    for node in pipeline.nodes:
+        if not node.nodes_from:
+            if node.operation.operation_type != 'lagged' or node.fitted_operation is None:
+                return None
+            window_sizes[id(node)] = node.fitted_operation.window_size
+        elif DataTypesEnum.table not in node.operation.metadata.input_types:
+            return None
+    return window_sizes
+
+
+def _batch_node_predict(node, history: np.array, window_sizes: Dict[int, int], task: Task,
+                        outputs: Dict[int, OutputData]) -> np.array:
+    """ Recursively obtains prediction of the node for the batch of time series,
+    each row of the lagged tables corresponds to the time series """
+    if id(node) in outputs:
+        return outputs[id(node)].predict
+
+    if not node.nodes_from:
+        window_size = window_sizes[id(node)]
+        output = OutputData(idx=np.arange(len(history)), features=history,
+                            predict=history[:, -window_size:], task=task, data_type=DataTypesEnum.table)
+        output.supplementary_data.column_types = {'features': [str(float)] * window_size}
+    else:
+        parent_nodes = node._nodes_from_with_fixed_order()
+        for parent in parent_nodes:
+            _batch_node_predict(parent, history, window_sizes, task, outputs)
+        batch_input = DataMerger.get([outputs[id(parent)] for parent in parent_nodes], log=node.log).merge()
+        batch_input.supplementary_data.previous_operations = [parent.operation.operation_type
+                                                              for parent in parent_nodes]
+        output = node.operation.predict(fitted_operation=node.fitted_operation, params=node.content['params'],
+                                        data=batch_input, is_fit_pipeline_stage=False)
+    outputs[id(node)] = output
+    return output.predict
+
+
 def in_sample_ts_forecast(pipeline, input_data: Union[InputData, MultiModalData],
                           horizon: int = None) -> np.array:
     """
@@ -100,6 +188,12 @@ def in_sample_ts_forecast(pipeline, input_data: Union[InputData, MultiModalData]
     # Is there need to fit on supplemented time-series
     force_refit = is_force_refit_needed(pipeline)
 
+    if isinstance(input_data, InputData) and not force_refit:
+        # Fitted lagged pipelines forecast from all the origins at once
+        final_forecast = _in_sample_ts_forecast_batch(pipeline, input_data, horizon)
+        if final_forecast is not None:
+            return final_forecast
+
     if isinstance(input_data, InputData):
         time_series = np.array(input_data.features)
         pre_history_ts = time_series[:-horizon]
@@ -180,6 +274,43 @@ def in_sample_ts_forecast(pipeline, input_data: Union[InputData, MultiModalData]
     return final_forecast
 
 
+def _in_sample_ts_forecast_batch(pipeline, input_data: InputData, horizon: int) -> Optional[np.array]:
+    """
+    Makes in-sample forecast from all the forecasting origins in one batched pass. Pre-histories
+    for the origins are rows of the strided view of the time series, so they are not copied.
+    Returns None if the pipeline can not forecast the time series only by its last values.
+
+    :param pipeline: fitted Pipeline without operations which require refit
+    :param input_data: data for prediction
+    :param horizon: forecasting horizon
+    :return final_forecast: array with forecast
+    """
+    time_series = np.asarray(input_data.features)
+    window_sizes = _lagged_window_sizes(pipeline)
+    if window_sizes is None or time_series.ndim != 1:
+        return None
+
+    history_len = max(window_sizes.values())
+    source_len = len(time_series) - horizon
+    scope_len = input_data.task.task_params.forecast_length
+    if source_len < history_len + scope_len:
+        # Window sizes are corrected for too short time series
+        return None
+    number_of_iterations = _calculate_number_of_steps(scope_len, horizon)
+
+    # Row with number i contains last history_len elements before the forecasting origin with number i
+    first_history = time_series[source_len - history_len:]
+    element_stride = first_history.strides[0]
+    histories = np.lib.stride_tricks.as_strided(first_history,
+                                                shape=(number_of_iterations, history_len),
+                                                strides=(scope_len * element_stride, element_stride),
+                                                writeable=False)
+
+    final_forecast = _batch_node_predict(pipeline.root_node, histories, window_sizes, input_data.task, {})
+    final_forecast = np.ravel(final_forecast.reshape((number_of_iterations, -1)))
+    return final_forecast[:horizon]
+
+
 def fitted_values(source_input: InputData, train_predicted: OutputData, horizon_step: int = None) -> OutputData:
     """ The method converts a multidimensional lagged array into an
     one-dimensional array - time series based on predicted values for training sample
@@ -6,6 +6,7 @@ from hyperopt import fmin, space_eval, tpe
 
 from fedot.core.log import Log
 from fedot.core.pipelines.tuning.search_space import SearchSpace, convert_params
+from fedot.core.pipelines.tuning.trials_store import TuningTrialsStore
 from fedot.core.pipelines.tuning.tuner_interface import HyperoptTuner, _greater_is_better
 
 
@@ -19,13 +20,15 @@ class SequentialTuner(HyperoptTuner):
                  timeout: timedelta = timedelta(minutes=5),
                  inverse_node_order=False, log: Optional[Log] = None,
                  search_space: ClassVar = SearchSpace(),
-                 algo: Callable = tpe.suggest):
+                 algo: Callable = tpe.suggest,
+                 trials_store: Optional[TuningTrialsStore] = None):
         super().__init__(pipeline=pipeline, task=task,
                          iterations=iterations, early_stopping_rounds=early_stopping_rounds,
                          timeout=timeout,
                          log=log,
                          search_space=search_space,
-                         algo=algo)
+                         algo=algo,
+                         trials_store=trials_store)
         self.inverse_node_order = inverse_node_order
 
     def tune_pipeline(self, input_data, loss_function, loss_params=None,
@@ -149,18 +152,25 @@ class SequentialTuner(HyperoptTuner):
 
         :return : updated pipeline with tuned parameters in particular node
         """
-        best_parameters = fmin(partial(self._objective,
-                                       pipeline=self.pipeline,
-                                       node_id=node_id,
-                                       data=data,
-                                       loss_function=loss_function,
-                                       loss_params=loss_params),
-                               node_params,
-                               algo=self.algo,
-                               max_evals=iterations_per_node,
-                               early_stop_fn=self.early_stop_fn,
-                               timeout=seconds_per_node)
-
+        trials = self.load_trials(node_params)
+        seeded_trials_number = len(trials)
+        fmin(partial(self._objective,
+                     pipeline=self.pipeline,
+                     node_id=node_id,
+                     data=data,
+                     loss_function=loss_function,
+                     loss_params=loss_params),
+             node_params,
+             algo=self.algo,
+             max_evals=len(trials) + iterations_per_node,
+             trials=trials,
+             early_stop_fn=self.early_stop_fn,
+             timeout=seconds_per_node)
+        self.save_trials(node_params, trials)
+
+        best_parameters = self.best_new_trial(trials, seeded_trials_number)
+        if best_parameters is None:
+            return self.pipeline
         best_parameters = space_eval(space=node_params,
                                      hp_assignment=best_parameters)
 
@@ -0,0 +1,130 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence, TYPE_CHECKING, Union
+
+import numpy as np
+import pandas as pd
+from hyperopt import STATUS_OK, Trials
+from hyperopt.base import JOB_STATE_DONE
+
+from fedot.core.data.data import InputData
+from fedot.core.data.multi_modal import MultiModalData
+from fedot.core.utils import default_fedot_data_dir
+
+if TYPE_CHECKING:
+    from fedot.core.pipelines.pipeline import Pipeline
+
+# Record of the evaluated trial: values of the hyperparameters in the hyperopt format and loss
+TrialRecord = Dict[str, Any]
+
+
+class TuningTrialsStore:
+    """
+    Local store of the trials evaluated during hyperparameters tuning. Trials are kept in the json files
+    keyed by the structural hash of the pipeline (operations and edges without hyperparameters),
+    so they can be used to warm-start the tuning of the same pipeline structure on the updated data.
+    Also the store keeps the metric of the initial pipeline for the fingerprint of the validation setup
+    (data, hyperparameters of the pipeline, loss and validation parameters) to skip the redundant refit.
+
+    :param path: folder of the store, by default it is in the FEDOT data folder
+    :param max_trials: max number of the best trials kept for the pipeline structure
+    """
+
+    def __init__(self, path: Optional[str] = None, max_trials: int = 500):
+        self.path = path or os.path.join(default_fedot_data_dir(), 'tuning_trials')
+        self.max_trials = max_trials
+        os.makedirs(self.path, exist_ok=True)
+
+    def load_trials(self, pipeline: 'Pipeline', labels: Iterable[str]) -> List[TrialRecord]:
+        """ Returns the records of trials evaluated for the pipeline structure in the search space
+        with the given labels of hyperparameters """
+        return self._load(pipeline).get('trials', {}).get(_space_key(labels), [])
+
+    def save_trials(self, pipeline: 'Pipeline', labels: Iterable[str], trials: Sequence[TrialRecord]):
+        """ Saves the records of trials for the pipeline structure and the search space keeping the best of them """
+        content = self._load(pipeline)
+        content.setdefault('trials', {})[_space_key(labels)] = \
+            sorted(trials, key=lambda record: record['loss'])[:self.max_trials]
+        self._save(pipeline, content)
+
+    def load_init_metric(self, pipeline: 'Pipeline', fingerprint: str) -> Optional[float]:
+        """ Returns the metric of the initial pipeline if it was evaluated with the same fingerprint """
+        init_check = self._load(pipeline).get('init_check', {})
+        return init_check.get('metric') if init_check.get('fingerprint') == fingerprint else None
+
+    def save_init_metric(self, pipeline: 'Pipeline', fingerprint: str, metric: float):
+        content = self._load(pipeline)
+        content['init_check'] = {'fingerprint': fingerprint, 'metric': metric}
+        self._save(pipeline, content)
+
+    def _file_path(self, pipeline: 'Pipeline') -> str:
+        return os.path.join(self.path, f'{pipeline_structural_hash(pipeline)}.json')
+
+    def _load(self, pipeline: 'Pipeline') -> dict:
+        file_path = self._file_path(pipeline)
+        if not os.path.exists(file_path):
+            return {}
+        with open(file_path, 'r') as file:
+            return json.load(file)
+
+    def _save(self, pipeline: 'Pipeline', content: dict):
+        with open(self._file_path(pipeline), 'w') as file:
+            json.dump(content, file)
+
+
+def pipeline_structural_hash(pipeline: 'Pipeline') -> str:
+    """ Hash of the operations and edges of the pipeline in the order of its nodes
+    (labels of hyperparameters in the search space are defined by that order) """
+    nodes = pipeline.nodes
+    description = '|'.join(f'{node.operation.operation_type}<'
+                           f'{",".join(str(nodes.index(parent)) for parent in node.nodes_from or [])}'
+                           for node in nodes)
+    return hashlib.blake2b(description.encode(), digest_size=16).hexdigest()
+
+
+def data_fingerprint(data: Union[InputData, MultiModalData], *setup: Any) -> str:
+    """ Hash of the content of the data and of the additional setup values """
+    data_hash = hashlib.blake2b(digest_size=16)
+    for input_data in (data.values() if isinstance(data, MultiModalData) else [data]):
+        data_hash.update(str((input_data.task.task_type, input_data.data_type)).encode())
+        for array in [input_data.idx, input_data.features, input_data.target]:
+            if array is not None:
+                array = np.asarray(array)
+                data_hash.update(str(array.shape).encode())
+                data_hash.update(pd.util.hash_array(np.ravel(array)).tobytes())
+    data_hash.update(repr(setup).encode())
+    return data_hash.hexdigest()
+
+
+def trials_to_records(trials: Trials) -> List[TrialRecord]:
+    """ Converts successfully evaluated hyperopt trials to the serializable records """
+    return [{'vals': {label: [_to_builtin(value) for value in values]
+                      for label, values in trial['misc']['vals'].items()},
+             'loss': float(trial['result']['loss'])}
+            for trial in trials.trials if trial['result'].get('status') == STATUS_OK]
+
+
+def records_to_trials(records: Sequence[TrialRecord]) -> Trials:
+    """ Creates hyperopt trials with the evaluated records to continue the optimization from them """
+    trials = Trials()
+    tids = trials.new_trial_ids(len(records))
+    miscs = [{'tid': tid, 'cmd': ('domain_attachment', 'FMinIter_Domain'), 'workdir': None,
+              'idxs': {label: [tid] * len(values) for label, values in record['vals'].items()},
+              'vals': record['vals']}
+             for tid, record in zip(tids, records)]
+    results = [{'loss': record['loss'], 'status': STATUS_OK} for record in records]
+    docs = trials.new_trial_docs(tids, [None] * len(records), results, miscs)
+    for doc in docs:
+        doc['state'] = JOB_STATE_DONE
+    trials.insert_trial_docs(docs)
+    trials.refresh()
+    return trials
+
+
+def _space_key(labels: Iterable[str]) -> str:
+    return '|'.join(sorted(labels))
+
+
+def _to_builtin(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
@@ -4,13 +4,17 @@ from hyperopt.early_stop import no_progress_loss
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from datetime import timedelta
-from typing import Callable, ClassVar, Optional
+from typing import Callable, ClassVar, List, Optional
 
 import numpy as np
+from hyperopt import STATUS_OK, Trials
+from hyperopt.base import Domain
 
 from fedot.core.data.data import data_type_is_ts
 from fedot.core.log import Log, default_log
 from fedot.core.pipelines.tuning.search_space import SearchSpace
+from fedot.core.pipelines.tuning.trials_store import TuningTrialsStore, data_fingerprint, records_to_trials, \
+    trials_to_records
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import TaskTypesEnum
 from fedot.core.validation.tune.simple import fit_predict_one_fold
@@ -30,6 +34,8 @@ class HyperoptTuner(ABC):
     :attribute iterations: max number of iterations
     :attribute search_space: SearchSpace instance
     :attribute algo: algorithm for hyperparameters optimization with signature similar to hyperopt.tse.suggest
+    :attribute trials_store: store of the previously evaluated trials to warm-start the optimization from them
+    and of the initial metric to skip its evaluation on the same data
     """
 
     def __init__(self, pipeline, task,
@@ -37,7 +43,8 @@ class HyperoptTuner(ABC):
                  timeout: timedelta = timedelta(minutes=5),
                  log: Optional[Log] = None,
                  search_space: ClassVar = SearchSpace(),
-                 algo: Callable = None):
+                 algo: Callable = None,
+                 trials_store: Optional[TuningTrialsStore] = None):
         self.pipeline = pipeline
         self.task = task
         self.iterations = iterations
@@ -52,6 +59,7 @@ class HyperoptTuner(ABC):
         self.validation_blocks = None
         self.search_space = search_space
         self.algo = algo
+        self.trials_store = trials_store
 
         self.log = log or default_log(__name__)
 
@@ -116,10 +124,64 @@ class HyperoptTuner(ABC):
         # Train pipeline
         self.init_pipeline = deepcopy(self.pipeline)
 
+        fingerprint = None
+        if self.trials_store is not None:
+            fingerprint = data_fingerprint(data, self.pipeline.root_node.descriptive_id,
+                                           getattr(loss_function, '__name__', str(loss_function)), loss_params,
+                                           self.cv_folds, self.validation_blocks)
+            self.init_metric = self.trials_store.load_init_metric(self.pipeline, fingerprint)
+            if self.init_metric is not None:
+                # Initial pipeline is fitted only if it is returned by final_check
+                self.log.info('Initial metric is obtained from the trials store for the same data')
+                return
+
         self.init_metric = self.get_metric_value(data=data,
                                                  pipeline=self.init_pipeline,
                                                  loss_function=loss_function,
                                                  loss_params=loss_params)
+        if self.trials_store is not None:
+            self.trials_store.save_init_metric(self.pipeline, fingerprint, self.init_metric)
+
+    def load_trials(self, space: dict) -> Trials:
+        """
+        Method creates hyperopt trials with the trials previously evaluated in the search space
+
+        :param space: search space of the optimization
+        """
+        if self.trials_store is None:
+            return Trials()
+        records = self.trials_store.load_trials(self.pipeline, _space_labels(space))
+        if records:
+            self.log.info(f'Optimization is warm-started from {len(records)} previously evaluated trials')
+        return records_to_trials(records)
+
+    @staticmethod
+    def best_new_trial(trials: Trials, seeded_trials_number: int) -> Optional[dict]:
+        """
+        Method returns hyperopt assignment of the best trial evaluated in this optimization.
+        Trials loaded from the store aren't considered, since their losses were obtained on the previous data
+
+        :param trials: trials of the optimization
+        :param seeded_trials_number: number of the trials loaded from the store
+
+        :return: assignment of the hyperparameters or None if there are no successfully evaluated new trials
+        """
+        new_trials = [trial for trial in trials.trials[seeded_trials_number:]
+                      if trial['result'].get('status') == STATUS_OK]
+        if not new_trials:
+            return None
+        best_trial = min(new_trials, key=lambda trial: trial['result']['loss'])
+        return {label: values[0] for label, values in best_trial['misc']['vals'].items() if values}
+
+    def save_trials(self, space: dict, trials: Trials):
+        """
+        Method saves the evaluated trials to the trials store
+
+        :param space: search space of the optimization
+        :param trials: trials of the optimization
+        """
+        if self.trials_store is not None:
+            self.trials_store.save_trials(self.pipeline, _space_labels(space), trials_to_records(trials))
 
     def final_check(self, data, tuned_pipeline, loss_function, loss_params):
         """
@@ -152,7 +214,7 @@ class HyperoptTuner(ABC):
             init_metric = -1 * (self.init_metric - deviation)
             if self.obtained_metric is None:
                 self.log.info(f'{prefix_init_phrase} is None. Initial metric is {init_metric:.3f}')
-                return self.init_pipeline
+                return self._fitted_init_pipeline(data, loss_function, loss_params)
 
             self.obtained_metric *= -1
             if self.obtained_metric >= init_metric:
@@ -162,13 +224,13 @@ class HyperoptTuner(ABC):
             else:
                 self.log.info(f'{prefix_init_phrase} {self.obtained_metric:.3f} '
                               f'smaller than initial (- 5% deviation) {init_metric:.3f}')
-                return self.init_pipeline
+                return self._fitted_init_pipeline(data, loss_function, loss_params)
         else:
             # Minimization
             init_metric = self.init_metric + deviation
             if self.obtained_metric is None:
                 self.log.info(f'{prefix_init_phrase} is None. Initial metric is {init_metric:.3f}')
-                return self.init_pipeline
+                return self._fitted_init_pipeline(data, loss_function, loss_params)
             elif self.obtained_metric <= init_metric:
                 self.log.info(f'{prefix_tuned_phrase} {self.obtained_metric:.3f} equal or '
                               f'smaller than initial (+ 5% deviation) {init_metric:.3f}')
@@ -176,7 +238,14 @@ class HyperoptTuner(ABC):
             else:
                 self.log.info(f'{prefix_init_phrase} {self.obtained_metric:.3f} '
                               f'bigger than initial (+ 5% deviation) {init_metric:.3f}')
-                return self.init_pipeline
+                return self._fitted_init_pipeline(data, loss_function, loss_params)
+
+    def _fitted_init_pipeline(self, data, loss_function, loss_params):
+        """ Initial pipeline isn't fitted in init_check if its metric is loaded from the trials store """
+        if not self.init_pipeline.is_fitted:
+            self.get_metric_value(data=data, pipeline=self.init_pipeline,
+                                  loss_function=loss_function, loss_params=loss_params)
+        return self.init_pipeline
 
     @staticmethod
     def _one_fold_validation(data, pipeline):
@@ -220,6 +289,11 @@ class HyperoptTuner(ABC):
             return MAX_METRIC_VALUE
 
 
+def _space_labels(space: dict) -> List[str]:
+    """ Labels of the hyperparameters in the search space """
+    return list(Domain(lambda _: None, space).params)
+
+
 def _create_multi_target_prediction(target):
     """ Function creates an array of shape (target len, num classes)
     with classes probabilities from target values
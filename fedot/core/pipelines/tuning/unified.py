@@ -6,6 +6,7 @@ from hyperopt import fmin, space_eval, tpe
 
 from fedot.core.log import Log
 from fedot.core.pipelines.tuning.search_space import SearchSpace, convert_params
+from fedot.core.pipelines.tuning.trials_store import TuningTrialsStore
 from fedot.core.pipelines.tuning.tuner_interface import HyperoptTuner, _greater_is_better
 
 
@@ -19,13 +20,15 @@ class PipelineTuner(HyperoptTuner):
                  timeout: timedelta = timedelta(minutes=5),
                  log: Optional[Log] = None,
                  search_space: ClassVar = SearchSpace(),
-                 algo: Callable = tpe.suggest):
+                 algo: Callable = tpe.suggest,
+                 trials_store: Optional[TuningTrialsStore] = None):
         super().__init__(pipeline=pipeline, task=task,
                          iterations=iterations, early_stopping_rounds=early_stopping_rounds,
                          timeout=timeout,
                          log=log,
                          search_space=search_space,
-                         algo=algo)
+                         algo=algo,
+                         trials_store=trials_store)
 
     def tune_pipeline(self, input_data, loss_function, loss_params=None,
                       cv_folds: int = None, validation_blocks: int = None):
@@ -44,21 +47,28 @@ class PipelineTuner(HyperoptTuner):
         # Check source metrics for data
         self.init_check(input_data, loss_function, loss_params)
 
-        best = fmin(partial(self._objective,
-                            pipeline=self.pipeline,
-                            data=input_data,
-                            loss_function=loss_function,
-                            loss_params=loss_params),
-                    parameters_dict,
-                    algo=self.algo,
-                    max_evals=self.iterations,
-                    early_stop_fn=self.early_stop_fn,
-                    timeout=self.max_seconds)
-
-        best = space_eval(space=parameters_dict, hp_assignment=best)
-
-        tuned_pipeline = self.set_arg_pipeline(pipeline=self.pipeline,
-                                               parameters=best)
+        trials = self.load_trials(parameters_dict)
+        seeded_trials_number = len(trials)
+        fmin(partial(self._objective,
+                     pipeline=self.pipeline,
+                     data=input_data,
+                     loss_function=loss_function,
+                     loss_params=loss_params),
+             parameters_dict,
+             algo=self.algo,
+             max_evals=len(trials) + self.iterations,
+             trials=trials,
+             early_stop_fn=self.early_stop_fn,
+             timeout=self.max_seconds)
+        self.save_trials(parameters_dict, trials)
+
+        best = self.best_new_trial(trials, seeded_trials_number)
+        if best is None:
+            tuned_pipeline = self.pipeline
+        else:
+            best = space_eval(space=parameters_dict, hp_assignment=best)
+            tuned_pipeline = self.set_arg_pipeline(pipeline=self.pipeline,
+                                                   parameters=best)
 
         # Validation is the optimization do well
         final_pipeline = self.final_check(data=input_data,
@@ -76,6 +76,8 @@ class OperationTypesRepository:
         self._repo = []
         self.default_tags = []
         if operation_type == 'all':
+            # Repositories can share the same initialized operations, they are added once
+            added_operations = set()
             for op_type in OperationTypesRepository.__repository_dict__.keys():
                 self.repository_name.append(OperationTypesRepository.__repository_dict__[op_type]['file'])
                 operations = OperationTypesRepository.__repository_dict__[op_type]['initialized_repo']
@@ -83,7 +85,8 @@ class OperationTypesRepository:
 
                 if operations is not None:
                     for operation in operations:
-                        if operation not in self._repo:
+                        if id(operation) not in added_operations:
+                            added_operations.add(id(operation))
                             self._repo.append(operation)
 
         else:
@@ -7,7 +7,7 @@ from fedot.core.optimisers.opt_history import OptHistory
 if TYPE_CHECKING:
     from fedot.core.optimisers.gp_comp.individual import Individual
 
-from . import any_from_json
+from . import any_from_json, any_to_json
 
 
 def _convert_parent_individuals(individuals: List[List['Individual']]) -> List[List['Individual']]:
@@ -22,8 +22,17 @@ def _convert_parent_individuals(individuals: List[List['Individual']]) -> List[L
     return individuals
 
 
+def opt_history_to_json(obj: OptHistory) -> Dict[str, Any]:
+    serialized_history = any_to_json(obj)
+    # State of the retention policy is restored from the generations on load
+    del serialized_history['_records_by_uid']
+    del serialized_history['_partially_compressed_generations']
+    return serialized_history
+
+
 def opt_history_from_json(cls: Type[OptHistory], json_obj: Dict[str, Any]) -> OptHistory:
     deserialized = any_from_json(cls, json_obj)
     deserialized.individuals = _convert_parent_individuals(deserialized.individuals)
     deserialized.archive_history = _convert_parent_individuals(deserialized.archive_history)
+    deserialized._restore_retention_state()
     return deserialized
@@ -148,7 +148,15 @@ def _table_data_by_index(index, values: InputData):
 
 def _ts_data_by_index(train_ids, test_ids, data):
     """ Allow to get time series data by indexes of elements """
-    features = data.features[train_ids]
-    target = data.target[test_ids]
+    features = data.features[_as_slice(train_ids)]
+    target = data.target[_as_slice(test_ids)]
 
     return features, target
+
+
+def _as_slice(ids: np.array):
+    """ Convert sorted indices of the continuous part of the time series into the slice
+    to obtain a view instead of a copy. Other indices are returned as is """
+    if len(ids) > 0 and ids[-1] - ids[0] + 1 == len(ids):
+        return slice(ids[0], ids[-1] + 1)
+    return ids
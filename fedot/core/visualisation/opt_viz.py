@@ -106,9 +106,10 @@ class PipelineEvolutionVisualiser:
     def visualise_history(self, history):
         try:
             self._clean(with_gif=True)
-            all_historical_fitness = history.all_historical_quality
-            self._visualise_pipelines(history.historical_pipelines, all_historical_fitness)
-            self._visualise_convergence(all_historical_fitness)
+            # Individuals replaced with records have no graphs, so their fitness is skipped too
+            historical_fitness = history.historical_pipelines_quality
+            self._visualise_pipelines(history.historical_pipelines, historical_fitness)
+            self._visualise_convergence(historical_fitness)
             self._merge_images()
             self._combine_gifs()
             self._clean()
@@ -306,7 +307,8 @@ class PipelineEvolutionVisualiser:
         for gen_num, gen in enumerate(history.individuals):
             for ind in gen:
                 uid_counts[ind.uid] = uid_counts.get(ind.uid, -1) + 1
-                for node in ind.graph.nodes:
+                # Records of old individuals keep only names of the nodes
+                for node in (ind.nodes if ind.graph is None else ind.graph.nodes):
                     history_data['generation'].append(gen_num)
                     history_data['individual'].append('_'.join([ind.uid, str(uid_counts[ind.uid])]))
                     fitness = ind.fitness
@@ -5,10 +5,12 @@ import numpy as np
 import pandas as pd
 from sklearn.preprocessing import LabelEncoder
 
+from fedot.core.data.array_utilities import as_float_precision
 from fedot.core.data.data import InputData, OutputData, data_type_is_table, data_type_is_ts
 from fedot.core.data.data_preprocessing import (
     data_has_categorical_features,
     data_has_missing_values,
+    features_profile,
     find_categorical_columns,
     replace_inf_with_nans
 )
@@ -130,6 +132,23 @@ class DataPreprocessor:
         self.mark_as_preprocessed(data)
         return data
 
+    def obligatory_prepare_for_partial_fit(self, data: InputData) -> InputData:
+        """
+        Perform obligatory preprocessing of the chunk of data for pipeline incremental fit.
+        Preprocessing is fitted on the first chunk and applied to the next ones
+        as for predict with removing rows with nans in the target and target encoding
+        """
+        if not self.types_correctors:
+            # The first chunk
+            return self.obligatory_prepare_for_fit(data)
+
+        was_preprocessed = data.supplementary_data.was_preprocessed
+        data = self.obligatory_prepare_for_predict(data)
+        if not was_preprocessed and data_type_is_table(data) and data.target is not None:
+            data = self._drop_rows_with_nan_in_target(data)
+            data.target = self._apply_target_encoding(data, DEFAULT_SOURCE_NAME)
+        return data
+
     def optional_prepare_for_fit(self, pipeline, data: Union[InputData, MultiModalData]):
         """ Launch preprocessing operations if it is necessary for pipeline fitting
 
@@ -203,6 +222,7 @@ class DataPreprocessor:
             # Process categorical features
             self.binary_categorical_processors[source_name].fit(data)
             data = self.binary_categorical_processors[source_name].transform(data)
+            self._apply_precision(data)
 
         return data
 
@@ -226,6 +246,7 @@ class DataPreprocessor:
             data = self.binary_categorical_processors[source_name].transform(data)
 
             self._apply_categorical_encoding(data, source_name)
+            self._apply_precision(data)
         return data
 
     def _prepare_optional_for_fit(self, pipeline, data: InputData, source_name: str):
@@ -246,6 +267,7 @@ class DataPreprocessor:
                                                                          source_name=source_name)
             if has_encoder is False:
                 self.one_hot_encoding_for_fit(data, source_name)
+        self._apply_precision(data)
 
     def _prepare_optional_for_predict(self, pipeline, data: InputData, source_name: str):
         """ Perform optional preprocessing for predict stage """
@@ -255,6 +277,7 @@ class DataPreprocessor:
             data = self.apply_imputation(data)
 
         self._apply_categorical_encoding(data, source_name)
+        self._apply_precision(data)
 
     def _find_features_full_of_nans(self, data: InputData, source_name: str):
         """ Find features with more than ALLOWED_NAN_PERCENT nan's
@@ -262,19 +285,10 @@ class DataPreprocessor:
         :param data: data to find columns with nan values
         :param source_name: name of data source node
         """
-        # Initialize empty lists to fill it with indices
-        self.ids_relevant_features.update({source_name: []})
-        self.ids_incorrect_features.update({source_name: []})
-
-        features = data.features
-        n_samples, n_columns = features.shape
-
-        for i in range(n_columns):
-            feature = features[:, i]
-            if np.sum(pd.isna(feature)) / n_samples < ALLOWED_NAN_PERCENT:
-                self.ids_relevant_features[source_name].append(i)
-            else:
-                self.ids_incorrect_features[source_name].append(i)
+        n_samples = data.features.shape[0]
+        is_relevant = features_profile(data).nan_counts / n_samples < ALLOWED_NAN_PERCENT
+        self.ids_relevant_features[source_name] = np.flatnonzero(is_relevant).tolist()
+        self.ids_incorrect_features[source_name] = np.flatnonzero(~is_relevant).tolist()
 
     @staticmethod
     def _drop_rows_with_nan_in_target(data: InputData):
@@ -398,6 +412,12 @@ class DataPreprocessor:
 
             data.supplementary_data = encoder_output.supplementary_data
 
+    @staticmethod
+    def _apply_precision(data: InputData):
+        """ Cast float features table into the precision of the data (if it is set) """
+        if data_type_is_table(data):
+            data.features = as_float_precision(data.features, data.supplementary_data.precision)
+
     def _train_target_encoder(self, data: InputData, source_name: str):
         """ Convert string categorical target into integer column using LabelEncoder """
         categorical_ids, non_categorical_ids = find_categorical_columns(data.target,
@@ -0,0 +1,408 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import get_context
+from queue import Empty, Queue
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from fedot.core.data.data import InputData
+from fedot.core.log import Log, default_log
+from fedot.core.pipelines.artifact import ARTIFACT_MAGIC
+from fedot.core.pipelines.inference_plan import InferencePlan
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task
+
+# Number of the last requests used for the latency percentiles
+LATENCY_WINDOW = 10000
+
+
+@dataclass
+class ServedPipeline:
+    """ Saved pipeline served by the prediction server
+
+    :param path: path to the JSON file saved by the 'save' method of the pipeline
+    or to the file saved by its 'save_artifact' method
+    :param task: task of the data for prediction
+    """
+    path: str
+    task: Task
+
+
+def load_pipeline(path: str) -> Pipeline:
+    """ Load the pipeline saved by 'save' or 'save_artifact' method, the format is defined by the file content """
+    pipeline = Pipeline()
+    with open(path, 'rb') as file:
+        is_artifact = file.read(len(ARTIFACT_MAGIC)) == ARTIFACT_MAGIC
+    if is_artifact:
+        pipeline.load_artifact(path)
+    else:
+        pipeline.load(path)
+    return pipeline
+
+
+# Pipelines and their compiled inference plans loaded once into the worker process
+_worker_pipelines: Dict[str, Tuple[Pipeline, Task]] = {}
+_worker_plans: Dict[Tuple[str, str], Optional[InferencePlan]] = {}
+# Error of the pipelines loading is raised on requests to the worker (the pool restarts failed initializers)
+_worker_init_errors: List[Exception] = []
+
+
+def _init_worker(served_pipelines: Dict[str, ServedPipeline]):
+    try:
+        for name, served_pipeline in served_pipelines.items():
+            _worker_pipelines[name] = (load_pipeline(served_pipeline.path), served_pipeline.task)
+            _worker_plan(name, 'default')
+    except Exception as ex:
+        _worker_init_errors.append(ex)
+
+
+def _check_worker():
+    if _worker_init_errors:
+        raise RuntimeError(f'Pipelines are not loaded by the worker: {_worker_init_errors[0]}')
+
+
+def _worker_plan(name: str, output_mode: str) -> Optional[InferencePlan]:
+    """ Compiled inference plan of the pipeline or None if the pipeline can't be compiled """
+    if (name, output_mode) not in _worker_plans:
+        pipeline, task = _worker_pipelines[name]
+        try:
+            _worker_plans[(name, output_mode)] = pipeline.compile_inference_plan(task, output_mode)
+        except ValueError:
+            _worker_plans[(name, output_mode)] = None
+    return _worker_plans[(name, output_mode)]
+
+
+def _predict_in_worker(name: str, features: np.ndarray, output_mode: str) -> np.ndarray:
+    _check_worker()
+    plan = _worker_plan(name, output_mode)
+    if plan is not None:
+        return plan.predict(features)
+    pipeline, task = _worker_pipelines[name]
+    input_data = InputData(idx=np.arange(len(features)), features=features, target=None,
+                           task=task, data_type=DataTypesEnum.table)
+    return pipeline.predict(input_data, output_mode=output_mode).predict
+
+
+class PredictionServer:
+    """
+    Local HTTP server for the prediction with saved pipelines. The pipelines are loaded once into
+    the pool of warm worker processes started with the server. Concurrent requests to the same pipeline
+    are combined into micro-batches: the batch is collected while all workers are busy, but not longer than
+    'max_batch_delay' after the first request of the batch, and predicted by the single call in the worker.
+
+    Endpoints:
+        POST /predict/<name> with JSON {"features": [[...], ...], "output_mode": "default"} -> {"predict": [...]}
+        GET /stats -> JSON with the latency and throughput counters
+
+    :param pipelines: served pipelines by names used in the requests
+    :param host: host to listen on
+    :param port: port to listen on (0 to choose any free port)
+    :param workers_number: number of worker processes
+    :param max_batch_size: maximal number of rows in the batch
+    :param max_batch_delay: maximal time in seconds to wait for the next requests of the batch
+    :param predict_timeout: maximal time in seconds to wait for the prediction of the request
+    (e.g. the batch is never predicted if the worker process dies)
+    :param log: Log object to record messages
+    """
+
+    def __init__(self, pipelines: Dict[str, ServedPipeline], host: str = '127.0.0.1', port: int = 0,
+                 workers_number: int = 1, max_batch_size: int = 1000, max_batch_delay: float = 0.002,
+                 predict_timeout: float = 60., log: Optional[Log] = None):
+        self.pipelines = pipelines
+        self.host = host
+        self.port = port
+        self.workers_number = workers_number
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay = max_batch_delay
+        self.predict_timeout = predict_timeout
+        self.log = log or default_log(__name__)
+
+        self._pool = None
+        self._http_server = None
+        self._free_workers = threading.Semaphore(workers_number)
+        self._batchers: Dict[Tuple[str, str, int], '_MicroBatcher'] = {}
+        self._batchers_lock = threading.Lock()
+        self._stats = _ServerStats()
+
+    @property
+    def url(self) -> str:
+        host, port = self._http_server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'PredictionServer':
+        """ Start the worker processes with loaded pipelines and the HTTP server in the background thread """
+        missing_paths = [served.path for served in self.pipelines.values() if not os.path.isfile(served.path)]
+        if missing_paths:
+            raise FileNotFoundError(f'Saved pipelines are not found: {missing_paths}')
+
+        self._pool = get_context('spawn').Pool(self.workers_number, initializer=_init_worker,
+                                               initargs=(self.pipelines,))
+        try:
+            self._pool.apply(_check_worker)
+        except RuntimeError:
+            self.stop()
+            raise
+        self._http_server = _PredictionHTTPServer((self.host, self.port), self)
+        threading.Thread(target=self._http_server.serve_forever, daemon=True).start()
+        self._stats.reset()
+        self.log.info(f'Prediction server is started at {self.url}')
+        return self
+
+    def stop(self):
+        """ Stop the HTTP server and the worker processes """
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+        with self._batchers_lock:
+            for batcher in self._batchers.values():
+                batcher.stop()
+            self._batchers = {}
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+        self._http_server, self._pool = None, None
+
+    def __enter__(self) -> 'PredictionServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def predict(self, name: str, features: np.ndarray, output_mode: str = 'default') -> np.ndarray:
+        """
+        Predict with the served pipeline on the rows of features in the batch with the concurrent requests
+
+        :param name: name of the served pipeline
+        :param features: table with rows to predict (one-dimensional array is the single row)
+        :param output_mode: desired form of output (see Pipeline.predict)
+        :return: predictions for the rows
+        """
+        if name not in self.pipelines:
+            raise KeyError(f'Pipeline {name} is not served')
+        features = np.asarray(features)
+        if features.ndim == 1:
+            features = features.reshape((1, -1))
+        if features.ndim != 2 or features.size == 0:
+            raise ValueError('Features must be the non-empty table of rows')
+
+        start_time = time.perf_counter()
+        try:
+            prediction = self._batcher(name, output_mode, features.shape[1]).submit(features) \
+                .result(timeout=self.predict_timeout)
+        except Exception:
+            self._stats.add_error()
+            raise
+        self._stats.add_request(len(features), time.perf_counter() - start_time)
+        return prediction
+
+    def stats(self) -> dict:
+        """ Latency and throughput counters of the server """
+        return self._stats.as_dict()
+
+    def _batcher(self, name: str, output_mode: str, columns_number: int) -> '_MicroBatcher':
+        # Only requests with the same number of columns can be predicted in the single batch
+        key = (name, output_mode, columns_number)
+        with self._batchers_lock:
+            if key not in self._batchers:
+                self._batchers[key] = _MicroBatcher(self, name, output_mode)
+            return self._batchers[key]
+
+
+class _MicroBatcher:
+    """ Collects the requests to the pipeline into batches and predicts them in the worker processes """
+
+    def __init__(self, server: PredictionServer, name: str, output_mode: str):
+        self.server = server
+        self.name = name
+        self.output_mode = output_mode
+        self._requests = Queue()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def submit(self, features: np.ndarray) -> Future:
+        future = Future()
+        self._requests.put((features, future))
+        return future
+
+    def stop(self):
+        self._requests.put(None)
+
+    def _run(self):
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+            batch_deadline = time.perf_counter() + self.server.max_batch_delay
+            # Requests are collected into the batch while all workers are busy
+            self.server._free_workers.acquire()
+            batch = [request]
+            rows_number = len(request[0])
+            while rows_number < self.server.max_batch_size:
+                try:
+                    request = self._requests.get(timeout=max(batch_deadline - time.perf_counter(), 0))
+                except Empty:
+                    break
+                if request is None:
+                    self._requests.put(None)
+                    break
+                batch.append(request)
+                rows_number += len(request[0])
+            self._predict(batch)
+
+    def _predict(self, batch: List[Tuple[np.ndarray, Future]]):
+        features = np.concatenate([features for features, _ in batch])
+        rows_numbers = [len(features) for features, _ in batch]
+
+        # The worker is released once: by the result, by the error or by the timeout
+        # (callbacks of the task are never called if the worker process dies)
+        finish_lock = threading.Lock()
+        is_finished = False
+
+        def finish() -> bool:
+            nonlocal is_finished
+            with finish_lock:
+                if is_finished:
+                    return False
+                is_finished = True
+            timer.cancel()
+            self.server._free_workers.release()
+            return True
+
+        def set_results(prediction: np.ndarray):
+            if not finish():
+                return
+            self.server._stats.add_batch()
+            if len(prediction) != len(features):
+                _set_exception(batch, ValueError('Prediction of the pipeline is not aligned with the rows'))
+                return
+            for (_, future), request_prediction in zip(batch, np.split(prediction, np.cumsum(rows_numbers)[:-1])):
+                future.set_result(request_prediction)
+
+        def set_error(ex: BaseException):
+            if finish():
+                _set_exception(batch, ex)
+
+        timer = threading.Timer(self.server.predict_timeout,
+                                lambda: set_error(TimeoutError('Batch is not predicted by the worker in time')))
+        timer.daemon = True
+        timer.start()
+        try:
+            self.server._pool.apply_async(_predict_in_worker, (self.name, features, self.output_mode),
+                                          callback=set_results, error_callback=set_error)
+        except Exception as ex:
+            set_error(ex)
+
+
+def _set_exception(batch: List[Tuple[np.ndarray, Future]], ex: BaseException):
+    for _, future in batch:
+        future.set_exception(ex)
+
+
+class _ServerStats:
+    """ Thread-safe counters of the requests predicted by the server """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.start_time = time.perf_counter()
+            self.requests_number = 0
+            self.rows_number = 0
+            self.batches_number = 0
+            self.errors_number = 0
+            self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def add_request(self, rows_number: int, latency: float):
+        with self._lock:
+            self.requests_number += 1
+            self.rows_number += rows_number
+            self.latencies.append(latency)
+
+    def add_batch(self):
+        with self._lock:
+            self.batches_number += 1
+
+    def add_error(self):
+        with self._lock:
+            self.errors_number += 1
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            uptime = time.perf_counter() - self.start_time
+            latencies = np.array(self.latencies) * 1000
+            return {
+                'uptime_seconds': uptime,
+                'requests_number': self.requests_number,
+                'rows_number': self.rows_number,
+                'batches_number': self.batches_number,
+                'errors_number': self.errors_number,
+                'mean_batch_rows': self.rows_number / self.batches_number if self.batches_number else 0.,
+                'requests_per_second': self.requests_number / uptime,
+                'rows_per_second': self.rows_number / uptime,
+                'latency_p50_ms': float(np.percentile(latencies, 50)) if len(latencies) else None,
+                'latency_p99_ms': float(np.percentile(latencies, 99)) if len(latencies) else None
+            }
+
+
+class _PredictionHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, server_address: Tuple[str, int], prediction_server: PredictionServer):
+        self.prediction_server = prediction_server
+        super().__init__(server_address, _PredictionRequestHandler)
+
+
+class _PredictionRequestHandler(BaseHTTPRequestHandler):
+    # Connections are kept alive between the requests of the client
+    protocol_version = 'HTTP/1.1'
+    predict_prefix = '/predict/'
+
+    def do_GET(self):
+        if self.path == '/stats':
+            self._send_json(HTTPStatus.OK, self.server.prediction_server.stats())
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {'error': f'Unknown path {self.path}'})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        name = self.path[len(self.predict_prefix):]
+        if not self.path.startswith(self.predict_prefix) or name not in self.server.prediction_server.pipelines:
+            self._send_json(HTTPStatus.NOT_FOUND, {'error': f'Unknown path {self.path}'})
+            return
+        try:
+            request = json.loads(body)
+            features = np.array(request['features'])
+            output_mode = request.get('output_mode', 'default')
+        except (ValueError, KeyError, TypeError) as ex:
+            self._send_json(HTTPStatus.BAD_REQUEST, {'error': f'Incorrect request: {ex}'})
+            return
+
+        try:
+            prediction = self.server.prediction_server.predict(name, features, output_mode)
+        except ValueError as ex:
+            self._send_json(HTTPStatus.BAD_REQUEST, {'error': str(ex)})
+        except Exception as ex:
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {'error': f'Prediction failed: {ex}'})
+        else:
+            self._send_json(HTTPStatus.OK, {'predict': prediction.tolist()})
+
+    def _send_json(self, status: HTTPStatus, content: dict):
+        body = json.dumps(content).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        self.server.prediction_server.log.debug(f'{self.address_string()} {format % args}')
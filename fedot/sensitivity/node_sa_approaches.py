@@ -1,15 +1,20 @@
 import json
+import multiprocessing
 import random
 from abc import ABC, abstractmethod
+from contextlib import closing
 from copy import deepcopy
+from datetime import timedelta
+from functools import partial
 from os import makedirs
 from os.path import exists, join
-from typing import List, Optional, Type, Union
+from typing import Callable, Dict, List, Optional, Type, Union
 
 import matplotlib.pyplot as plt
 
-from fedot.core.data.data import InputData
+from fedot.core.data.data import InputData, OutputData
 from fedot.core.log import Log, default_log
+from fedot.core.optimisers.gp_comp.operators.evaluation import determine_n_jobs
 from fedot.core.pipelines.node import Node
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.pipelines.validation import validate
@@ -55,24 +60,64 @@ class NodeAnalysis:
         :return: dict with Node analysis result per approach
         """
 
-        results = dict()
-        for approach in self.approaches:
-            results[f'{approach.__name__}'] = \
-                approach(pipeline=pipeline,
-                         train_data=train_data,
-                         test_data=test_data,
-                         requirements=self.approaches_requirements,
-                         path_to_save=self.path_to_save).analyze(node=node)
+        return self.analyze_nodes(pipeline=pipeline, nodes=[node],
+                                  train_data=train_data, test_data=test_data,
+                                  is_save=is_save)[0]
 
-        # TODO remove conflict with requirements.is_save
-        if is_save:
-            self._save_results_to_json(node, pipeline, results)
+    def analyze_nodes(self, pipeline: Pipeline, nodes: List[Node],
+                      train_data: InputData, test_data: InputData,
+                      is_save: bool = False) -> List[dict]:
+        """
+        Method runs analysis of several nodes within defined approaches.
+        The modified pipelines of all the nodes and approaches are evaluated together,
+        so they can be processed concurrently (see SensitivityAnalysisRequirements.n_jobs)
 
-        node_sa_index = self._get_node_index(train_data, results)
-        if node_sa_index is not None:
-            node.rating = self._get_node_rating(node_sa_index)
+        :param pipeline: Pipeline containing the analyzed Nodes
+        :param nodes: Node objects to analyze in Pipeline
+        :param train_data: data used for Pipeline training
+        :param test_data: data used for Pipeline validation
+        :param is_save: whether the nodes analysis results are needed to ba saved
+        :return: list with dict of Node analysis result per approach for every node
+        """
 
-        return results
+        evaluator = PipelineSamplesEvaluator(train_data=train_data, test_data=test_data,
+                                             n_jobs=self.approaches_requirements.n_jobs, log=self.log)
+        approaches = [approach(pipeline=pipeline,
+                               train_data=train_data,
+                               test_data=test_data,
+                               requirements=self.approaches_requirements,
+                               path_to_save=self.path_to_save)
+                      for approach in self.approaches]
+
+        # Modifications are sampled in the same order as in the sequential analysis
+        experiments = [[(approach, approach.get_samples_to_evaluate(node=node)) for approach in approaches]
+                       for node in nodes]
+        all_samples = [sample for node_experiments in experiments
+                       for _, samples in node_experiments if samples is not None
+                       for sample in samples]
+        losses = iter(evaluator.evaluate(pipeline, all_samples))
+
+        nodes_results = []
+        for node, node_experiments in zip(nodes, experiments):
+            results = dict()
+            for approach, samples in node_experiments:
+                if samples is None:
+                    approach_result = approach.analyze(node=node)
+                else:
+                    samples_losses = [next(losses) for _ in samples]
+                    approach_result = approach.get_result(node, samples, samples_losses)
+                results[f'{type(approach).__name__}'] = approach_result
+
+            # TODO remove conflict with requirements.is_save
+            if is_save:
+                self._save_results_to_json(node, pipeline, results)
+
+            node_sa_index = self._get_node_index(train_data, results)
+            if node_sa_index is not None:
+                node.rating = self._get_node_rating(node_sa_index)
+            nodes_results.append(results)
+
+        return nodes_results
 
     @staticmethod
     def _get_node_index(train_data: InputData, results: dict):
@@ -135,13 +180,14 @@ class NodeAnalyzeApproach(ABC):
         self._pipeline = pipeline
         self._train_data = train_data
         self._test_data = test_data
-        self._origin_metric = None
         self._requirements = \
             SensitivityAnalysisRequirements() if requirements is None else requirements
 
         self._path_to_save = \
             join(default_fedot_data_dir(), 'sensitivity', 'nodes_sensitivity') if path_to_save is None else path_to_save
         self.log = default_log(__name__) if log is None else log
+        self._evaluator = PipelineSamplesEvaluator(train_data=train_data, test_data=test_data,
+                                                   n_jobs=self._requirements.n_jobs, log=self.log)
 
         if not exists(self._path_to_save):
             makedirs(self._path_to_save)
@@ -160,23 +206,131 @@ class NodeAnalyzeApproach(ABC):
         """Changes the pipeline according to the approach"""
         pass
 
-    def _compare_with_origin_by_metric(self, changed_pipeline: Pipeline) -> float:
-        metric = MetricByTask(self._train_data.task.task_type)
+    def get_samples_to_evaluate(self, node: Node, **kwargs) -> Optional[List[Pipeline]]:
+        """Returns the modified pipelines which metrics are required by the approach.
+        Such pipelines can be evaluated together with the samples of other nodes and approaches.
+
+        :param node: Node object to analyze
+        :return: modified pipelines or None if the approach evaluates the node only in analyze method
+        """
+        return None
+
+    def get_result(self, node: Node, samples: List[Pipeline],
+                   losses: List[float]) -> Union[List[dict], List[float]]:
+        """Creates the analysis result from the evaluated samples
+
+        :param node: Node object to analyze
+        :param samples: the pipelines returned by get_samples_to_evaluate
+        :param losses: the ratio of every sample score to origin score
+        :return: the ratios of the samples scores by default
+        """
+        return list(losses)
+
+    def _compare_with_origin_by_metric(self, changed_pipelines: List[Pipeline]) -> List[float]:
+        return self._evaluator.evaluate(self._pipeline, changed_pipelines)
+
+
+class PipelineSamplesEvaluator:
+    """
+    Evaluates the modified pipelines relative to the origin one.
+
+    The origin pipeline is fitted once and its fitted operations are stored by the structural
+    (descriptive) id of the nodes. The nodes of modified pipelines which are not affected by
+    the modification have the same structural id, so their fitted operations are reused
+    in the same way as with OperationsCache. Identical samples are evaluated once.
+    The samples are evaluated in the pool of processes if n_jobs > 1. Every sample is fitted
+    with the same cached state in any mode, so the results do not depend on the number of jobs.
+
+    :param train_data: data used for Pipeline training
+    :param test_data: data used for Pipeline validation
+    :param metric: function of reference data and prediction to evaluate the pipelines with.
+    Default: see MetricByTask
+    :param n_jobs: number of processes to evaluate the samples (-1 for use all cpu's)
+    :param timeout: time limit for fitting of every sample, the sample metric is None if it is exceeded
+    :param log: Log object to record messages
+    """
+
+    def __init__(self, train_data: InputData, test_data: InputData,
+                 metric: Optional[Callable[[InputData, OutputData], float]] = None,
+                 n_jobs: int = 1, timeout: Optional[timedelta] = None,
+                 log: Optional[Log] = None):
+        self._train_data = train_data
+        self._test_data = test_data
+        self._metric = MetricByTask(train_data.task.task_type).get_value if metric is None else metric
+        self._n_jobs = n_jobs
+        self._timeout = timeout
+        self.log = default_log(__name__) if log is None else log
+
+        self._origin_metric = None
+        self._fitted_operations: Dict[str, object] = {}
+        self._metrics: Dict[str, Optional[float]] = {}
+
+    def evaluate(self, pipeline: Pipeline, samples: List[Pipeline]) -> List[Optional[float]]:
+        """
+        :param pipeline: origin pipeline
+        :param samples: modified pipelines to evaluate
+        :return: the ratio of every modified pipeline score to origin score
+        """
+        metrics = self.get_metric_values(pipeline, samples)
+        return [metric / self._origin_metric if metric is not None else None
+                for metric in metrics]
+
+    def get_metric_values(self, pipeline: Pipeline, samples: List[Pipeline]) -> List[Optional[float]]:
+        """
+        :param pipeline: origin pipeline, it is fitted from scratch at the first call
+        :param samples: modified pipelines to evaluate
+        :return: the metric value of every modified pipeline
+        """
+        if not samples:
+            return []
+        if self._origin_metric is None:
+            self._origin_metric = _get_metric_value(pipeline, self._train_data, self._test_data,
+                                                    metric=self._metric, use_fitted=False)
+            self._fitted_operations = {node.descriptive_id: node.fitted_operation for node in pipeline.nodes}
+
+        samples_ids = [sample.root_node.descriptive_id for sample in samples]
+        # Identical samples (e.g. the same replacement of different nodes) are evaluated once
+        samples_to_evaluate = {}
+        for sample_id, sample in zip(samples_ids, samples):
+            if sample_id not in self._metrics and sample_id not in samples_to_evaluate:
+                self._load_fitted_operations(sample)
+                samples_to_evaluate[sample_id] = sample
+
+        metric_function = partial(_get_metric_value, train_data=self._train_data, test_data=self._test_data,
+                                  metric=self._metric, use_fitted=True, timeout=self._timeout)
+        n_jobs = min(determine_n_jobs(self._n_jobs), len(samples_to_evaluate))
+        if n_jobs > 1:
+            self.log.info(f'{len(samples_to_evaluate)} modified pipelines are evaluated in {n_jobs} processes')
+            with closing(multiprocessing.Pool(n_jobs)) as pool:
+                metrics = pool.map(metric_function, samples_to_evaluate.values())
+        else:
+            metrics = map(metric_function, samples_to_evaluate.values())
+        self._metrics.update(zip(samples_to_evaluate.keys(), metrics))
+
+        timed_out_number = sum(self._metrics[sample_id] is None for sample_id in samples_to_evaluate)
+        if timed_out_number:
+            self.log.message(f'Fitting time limit is exceeded for {timed_out_number} samples')
 
-        if not self._origin_metric:
-            self._origin_metric = self._get_metric_value(pipeline=self._pipeline, metric=metric)
+        return [self._metrics[sample_id] for sample_id in samples_ids]
 
-        changed_pipeline_metric = self._get_metric_value(pipeline=changed_pipeline, metric=metric)
+    def _load_fitted_operations(self, sample: Pipeline):
+        for node in sample.nodes:
+            node.fitted_operation = self._fitted_operations.get(node.descriptive_id)
+        # Preprocessing is fitted again as it depends on the structure of the whole pipeline
+        sample.unfit(mode='data_operations', unfit_preprocessor=True)
 
-        return changed_pipeline_metric / self._origin_metric
 
-    def _get_metric_value(self, pipeline: Pipeline, metric: MetricByTask) -> float:
-        pipeline.fit(self._train_data, use_fitted=False)
-        predicted = pipeline.predict(self._test_data)
-        metric_value = metric.get_value(true=self._test_data,
-                                        predicted=predicted)
+def _get_metric_value(pipeline: Pipeline, train_data: InputData, test_data: InputData,
+                      metric: Callable[[InputData, OutputData], float], use_fitted: bool,
+                      timeout: Optional[timedelta] = None) -> Optional[float]:
+    try:
+        pipeline.fit(train_data, use_fitted=use_fitted, time_constraint=timeout)
+    except TimeoutError:
+        return None
+    predicted = pipeline.predict(test_data)
+    metric_value = metric(test_data, predicted)
 
-        return metric_value
+    return metric_value
 
 
 class NodeDeletionAnalyze(NodeAnalyzeApproach):
@@ -190,18 +344,21 @@ class NodeDeletionAnalyze(NodeAnalyzeApproach):
         :param node: Node object to analyze
         :return: the ratio of modified pipeline score to origin score
         """
+        samples = self.get_samples_to_evaluate(node)
+        return self.get_result(node, samples, self._compare_with_origin_by_metric(samples))
+
+    def get_samples_to_evaluate(self, node: Node, **kwargs) -> List[Pipeline]:
         if node is self._pipeline.root_node:
             # TODO or warning?
-            return [1.0]
-        else:
-            shortened_pipeline = self.sample(node)
-            if shortened_pipeline:
-                loss = self._compare_with_origin_by_metric(shortened_pipeline)
-                del shortened_pipeline
-            else:
-                loss = 1
+            return []
+        shortened_pipeline = self.sample(node)
+        return [shortened_pipeline] if shortened_pipeline else []
 
-            return [loss]
+    def get_result(self, node: Node, samples: List[Pipeline],
+                   losses: List[float]) -> Union[List[dict], List[float]]:
+        if node is self._pipeline.root_node:
+            return [1.0]
+        return [losses[0]] if losses else [1]
 
     def sample(self, node: Node):
         """
@@ -242,20 +399,21 @@ class NodeReplaceOperationAnalyze(NodeAnalyzeApproach):
 
         :return: the ratio of modified pipeline score to origin score
         """
-        requirements: ReplacementAnalysisMetaParams = self._requirements.replacement_meta
-        node_id = self._pipeline.nodes.index(node)
-        samples = self.sample(node=node,
-                              nodes_to_replace_to=requirements.nodes_to_replace_to,
-                              number_of_random_operations=requirements.number_of_random_operations)
+        samples = self.get_samples_to_evaluate(node, **kwargs)
+        return self.get_result(node, samples, self._compare_with_origin_by_metric(samples))
 
-        loss_values = []
-        new_nodes_types = []
-        for sample_pipeline in samples:
-            loss_per_sample = self._compare_with_origin_by_metric(sample_pipeline)
-            loss_values.append(loss_per_sample)
+    def get_samples_to_evaluate(self, node: Node, **kwargs) -> List[Pipeline]:
+        requirements: ReplacementAnalysisMetaParams = self._requirements.replacement_meta
+        nodes_to_replace_to = kwargs.get('nodes_to_replace_to') or requirements.nodes_to_replace_to
+        return self.sample(node=node,
+                           nodes_to_replace_to=nodes_to_replace_to,
+                           number_of_random_operations=requirements.number_of_random_operations)
 
-            new_node = sample_pipeline.nodes[node_id]
-            new_nodes_types.append(new_node.operation.operation_type)
+    def get_result(self, node: Node, samples: List[Pipeline],
+                   losses: List[float]) -> Union[List[dict], List[float]]:
+        node_id = self._pipeline.nodes.index(node)
+        new_nodes_types = [sample_pipeline.nodes[node_id].operation.operation_type for sample_pipeline in samples]
+        loss_values = list(losses)
 
         if self._requirements.is_visualize:
             self._visualize(x_values=new_nodes_types,
@@ -286,8 +444,9 @@ class NodeReplaceOperationAnalyze(NodeAnalyzeApproach):
             sample_pipeline = deepcopy(self._pipeline)
             replaced_node_index = self._pipeline.nodes.index(node)
             replaced_node = sample_pipeline.nodes[replaced_node_index]
+            # The replacing node is copied as its parents are changed by the update
             sample_pipeline.update_node(old_node=replaced_node,
-                                        new_node=replacing_node)
+                                        new_node=deepcopy(replacing_node))
             samples.append(sample_pipeline)
 
         return samples
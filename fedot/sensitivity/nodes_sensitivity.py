@@ -64,13 +64,14 @@ class NodesAnalysis:
 
         nodes_results = dict()
         operation_types = []
-        for node in self.nodes_to_analyze:
-            node_result = NodeAnalysis(approaches=self.approaches,
-                                       approaches_requirements=self.requirements,
-                                       path_to_save=self.path_to_save). \
-                analyze(pipeline=self.pipeline, node=node,
-                        train_data=self.train_data,
-                        test_data=self.test_data)
+        # Modified pipelines of all the nodes are evaluated together to use the pool of processes
+        results = NodeAnalysis(approaches=self.approaches,
+                               approaches_requirements=self.requirements,
+                               path_to_save=self.path_to_save). \
+            analyze_nodes(pipeline=self.pipeline, nodes=self.nodes_to_analyze,
+                          train_data=self.train_data,
+                          test_data=self.test_data)
+        for node, node_result in zip(self.nodes_to_analyze, results):
             operation_types.append(node.operation.operation_type)
 
             nodes_results[f'id = {self.pipeline.nodes.index(node)}, ' \
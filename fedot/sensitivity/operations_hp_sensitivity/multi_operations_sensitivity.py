@@ -9,6 +9,7 @@ from fedot.core.data.data import InputData
 from fedot.core.log import Log, default_log
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.utils import default_fedot_data_dir
+from fedot.sensitivity.node_sa_approaches import PipelineSamplesEvaluator
 from fedot.sensitivity.operations_hp_sensitivity.problem import MultiOperationsProblem, Problem
 from fedot.sensitivity.operations_hp_sensitivity.sa_and_sample_methods \
     import analyze_method_by_name, sample_method_by_name
@@ -39,6 +40,8 @@ class MultiOperationsHPAnalyze:
         self.problem: Optional[Problem] = None
         requirements = SensitivityAnalysisRequirements() if requirements is None else requirements
         self.requirements: HyperparamsAnalysisMetaParams = requirements.hp_analysis_meta
+        self._n_jobs = requirements.n_jobs
+        self._sample_timeout = requirements.hp_sample_timeout
         self.analyze_method = analyze_method_by_name.get(self.requirements.analyze_method)
         self.sample_method = sample_method_by_name.get(self.requirements.sample_method)
 
@@ -54,9 +57,6 @@ class MultiOperationsHPAnalyze:
         Default: Sobol method with Saltelli sample algorithm
         :return: Main and total Sobol indices for every parameter per node.
         """
-        if not self._pipeline.is_fitted:
-            self._pipeline.fit(self._train_data)
-
         # create problem
         self.operation_types = [node.operation.operation_type for node in self._pipeline.nodes]
         self.problem = MultiOperationsProblem(self.operation_types)
@@ -95,18 +95,25 @@ class MultiOperationsHPAnalyze:
             copied_pipeline = deepcopy(self._pipeline)
             for node_id, params_per_node in enumerate(sample):
                 copied_pipeline.nodes[node_id].custom_params = params_per_node
-                sampled_pipelines.append(copied_pipeline)
+            sampled_pipelines.append(copied_pipeline)
 
         return sampled_pipelines
 
     def _get_response_matrix(self, samples: List[Pipeline]):
-        operation_response_matrix = []
-        for sampled_pipeline in samples:
-            sampled_pipeline.fit(self._train_data)
-            prediction = sampled_pipeline.predict(self._test_data)
-            mse_metric = MSE().metric(reference=self._test_data,
-                                      predicted=prediction)
-            operation_response_matrix.append(mse_metric)
+        """ Evaluates the samples. Identical samples are evaluated once and the nodes which
+        are not affected by the sampled hyperparameters are fitted only for the origin pipeline
+        (see PipelineSamplesEvaluator) """
+        evaluator = PipelineSamplesEvaluator(train_data=self._train_data, test_data=self._test_data,
+                                             metric=MSE.metric, n_jobs=self._n_jobs,
+                                             timeout=self._sample_timeout, log=self.log)
+        operation_response_matrix = evaluator.get_metric_values(self._pipeline, samples)
+
+        successful_responses = [response for response in operation_response_matrix if response is not None]
+        if len(successful_responses) < len(operation_response_matrix):
+            # Sobol analysis requires the response for every sample
+            worst_response = max(successful_responses) if successful_responses else np.nan
+            operation_response_matrix = [worst_response if response is None else response
+                                         for response in operation_response_matrix]
 
         return np.array(operation_response_matrix)
 
@@ -28,7 +28,7 @@ class OneOperationHPAnalyze(NodeAnalyzeApproach):
     def __init__(self, pipeline: Pipeline, train_data, test_data: InputData,
                  requirements: SensitivityAnalysisRequirements = None,
                  path_to_save=None, log: Optional[Log] = None):
-        super().__init__(pipeline, train_data, test_data, path_to_save)
+        super().__init__(pipeline, train_data, test_data, requirements, path_to_save)
 
         requirements = SensitivityAnalysisRequirements() if requirements is None else requirements
         self.requirements: HyperparamsAnalysisMetaParams = requirements.hp_analysis_meta
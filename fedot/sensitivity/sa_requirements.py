@@ -1,3 +1,4 @@
+from datetime import timedelta
 from typing import List, Optional
 
 from fedot.core.pipelines.node import Node
@@ -24,6 +25,10 @@ class SensitivityAnalysisRequirements:
     :param is_visualize: defines whether the SA visualization needs to be saved to .png files.
     :param is_save_results_to_json: defines whether the SA indices needs to be saved to .json file.
     :param metric: metric used for validation. Default: see MetricByTask
+    :param n_jobs: number of processes used to evaluate the modified pipelines concurrently \
+    (-1 for use all cpu's). Default: 1
+    :param hyperparams_sample_timeout: time limit for fitting of the pipeline with every hyperparameters sample.\
+    Samples exceeding it get the worst response. Default: no limit
     """
 
     def __init__(self,
@@ -34,15 +39,20 @@ class SensitivityAnalysisRequirements:
                  replacement_nodes_to_replace_to: Optional[List[Node]] = None,
                  replacement_number_of_random_operations: Optional[int] = None,
                  is_visualize: bool = True,
-                 is_save_results_to_json: bool = True):
+                 is_save_results_to_json: bool = True,
+                 n_jobs: int = 1,
+                 hyperparams_sample_timeout: Optional[timedelta] = None):
         self.metric = metric
         self.hp_analysis_meta = HyperparamsAnalysisMetaParams(hyperparams_analyze_method,
                                                               hyperparams_sample_method,
                                                               hyperparams_analysis_samples_size,
                                                               )
 
+        self.hp_sample_timeout = hyperparams_sample_timeout
+
         self.replacement_meta = ReplacementAnalysisMetaParams(replacement_nodes_to_replace_to,
                                                               replacement_number_of_random_operations)
 
         self.is_visualize = is_visualize
         self.is_save = is_save_results_to_json
+        self.n_jobs = n_jobs
@@ -1,11 +1,15 @@
+import hashlib
+import multiprocessing
+from contextlib import closing
 from copy import deepcopy
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 from scipy import interpolate
 
 from fedot.core.data.data import InputData
 from fedot.core.log import Log, default_log
+from fedot.core.optimisers.gp_comp.operators.evaluation import determine_n_jobs
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import Task, TaskTypesEnum, TsForecastingParams
 
@@ -76,34 +80,27 @@ class SimpleGapFiller:
         :return: array without gaps
         """
         output_data = np.array(input_data)
-
-        i_gaps = np.ravel(np.argwhere(output_data == self.gap_value))
-
-        # Iterately fill in the gaps in the time series
-        for gap_index in i_gaps:
-            # Indexes of known elements (updated at each iteration)
-            i_known = np.argwhere(output_data != self.gap_value)
-            i_known = np.ravel(i_known)
-
-            # Based on the indexes we calculate how far from the gap
-            # the known values are located
-            id_distances = np.abs(i_known - gap_index)
-
-            # Now we know the indices of the smallest values in the array,
-            # so sort indexes
-            sorted_idx = np.argsort(id_distances)
-            nearest_values = []
-            nearest_indices = []
-            for i in sorted_idx[:n_neighbors]:
-                time_index = i_known[i]
-                nearest_values.append(output_data[time_index])
-                nearest_indices.append(time_index)
-            nearest_values = np.array(nearest_values)
-            nearest_indices = np.array(nearest_indices)
-
-            local_coefs = np.polyfit(nearest_indices, nearest_values, degree)
-            est_value = np.polyval(local_coefs, gap_index)
-            output_data[gap_index] = est_value
+        gap_mask = output_data == self.gap_value
+        runs_starts, runs_ends = self._gap_runs(gap_mask)
+        known_ids = np.flatnonzero(~gap_mask)
+
+        # Gaps are filled one after another, so every element of the run
+        # is a separate step of filling
+        runs_lengths = runs_ends - runs_starts + 1
+        runs_levels = self._runs_levels(runs_starts, runs_ends, n_neighbors, runs_lengths)
+        gap_ids = np.flatnonzero(gap_mask)
+        gap_runs = np.repeat(np.arange(len(runs_starts)), runs_lengths)
+        gap_levels = runs_levels[gap_runs] + gap_ids - runs_starts[gap_runs]
+
+        # Elements of one level don't depend on each other and are filled at once
+        for level_ids in self._split_by_levels(gap_levels):
+            gap_index = gap_ids[level_ids]
+            nearest_indices, is_available = self._nearest_known_ids(gap_index, gap_index,
+                                                                    runs_ends[gap_runs[level_ids]],
+                                                                    known_ids, n_neighbors)
+            local_coefs = self._centered_polyfit(output_data, gap_index, nearest_indices, is_available, degree)
+            # Value of the polynomial in the center is the free coefficient
+            output_data[gap_index] = local_coefs[:, 0]
 
         return output_data
 
@@ -123,47 +120,29 @@ class SimpleGapFiller:
         :return: array without gaps
         """
         output_data = np.array(input_data)
-
-        # Gap indices
-        gap_list = np.ravel(np.argwhere(output_data == self.gap_value))
-        new_gap_list = self._parse_gap_ids(gap_list)
-
-        # Iterately fill in the gaps in the time series
-        for gap in new_gap_list:
-            # Find the center point of the gap
-            center_index = int((gap[0] + gap[-1]) / 2)
-
-            # Indexes of known elements (updated at each iteration)
-            i_known = np.argwhere(output_data != self.gap_value)
-            i_known = np.ravel(i_known)
-
-            # Based on the indexes we calculate how far from the gap
-            # the known values are located
-            id_distances = np.abs(i_known - center_index)
-
-            # Now we know the indices of the smallest values in the array,
-            # so sort indexes
-            sorted_idx = np.argsort(id_distances)
-
-            # Nearest known values to the gap
-            nearest_values = []
-            # And their indexes
-            nearest_indices = []
-            for i in sorted_idx[:n_neighbors]:
-                # Getting the index value for the series - output_data
-                time_index = i_known[i]
-                # Using this index, we get the value of each of the "neighbors"
-                nearest_values.append(output_data[time_index])
-                nearest_indices.append(time_index)
-            nearest_values = np.array(nearest_values)
-            nearest_indices = np.array(nearest_indices)
-
-            # Local approximation by an n-th degree polynomial
-            local_coefs = np.polyfit(nearest_indices, nearest_values, degree)
-
-            # Estimate our interval according to the selected coefficients
-            est_value = np.polyval(local_coefs, gap)
-            output_data[gap] = est_value
+        gap_mask = output_data == self.gap_value
+        runs_starts, runs_ends = self._gap_runs(gap_mask)
+        known_ids = np.flatnonzero(~gap_mask)
+
+        # Every interval of gaps is filled at one step
+        runs_levels = self._runs_levels(runs_starts, runs_ends, n_neighbors, np.ones_like(runs_starts))
+        for level_runs in self._split_by_levels(runs_levels):
+            gap_starts, gap_ends = runs_starts[level_runs], runs_ends[level_runs]
+            # Find the center points of the gaps
+            center_index = (gap_starts + gap_ends) // 2
+
+            nearest_indices, is_available = self._nearest_known_ids(center_index, gap_starts, gap_ends,
+                                                                    known_ids, n_neighbors)
+            # Local approximations by an n-th degree polynomial
+            local_coefs = self._centered_polyfit(output_data, center_index, nearest_indices, is_available, degree)
+
+            # Estimate intervals according to the selected coefficients
+            gap_lengths = gap_ends - gap_starts + 1
+            gap_runs = np.repeat(np.arange(len(gap_starts)), gap_lengths)
+            gap_index = np.arange(len(gap_runs)) + np.repeat(gap_starts - np.cumsum(gap_lengths) + gap_lengths,
+                                                             gap_lengths)
+            powers = (gap_index - center_index[gap_runs]).astype(float)[:, None] ** np.arange(degree + 1)
+            output_data[gap_index] = np.sum(local_coefs[gap_runs] * powers, axis=1)
 
         return output_data
 
@@ -174,25 +153,90 @@ class SimpleGapFiller:
         :param gap_list: array with indexes of gaps in array
         :return: a list with separated gaps in continuous intervals
         """
+        gap_list = np.asarray(gap_list)
+        return np.split(gap_list, np.flatnonzero(np.diff(gap_list) > 1) + 1)
 
-        new_gap_list = []
-        local_gaps = []
-        for index, gap in enumerate(gap_list):
-            if index == 0:
-                local_gaps.append(gap)
-            else:
-                prev_gap = gap_list[index - 1]
-                if gap - prev_gap > 1:
-                    # There is a "gap" between gaps
-                    new_gap_list.append(local_gaps)
-
-                    local_gaps = []
-                    local_gaps.append(gap)
-                else:
-                    local_gaps.append(gap)
-        new_gap_list.append(local_gaps)
-
-        return new_gap_list
+    @staticmethod
+    def _gap_runs(gap_mask: np.array) -> Tuple[np.array, np.array]:
+        """
+        Run-length encoding of the gaps
+
+        :param gap_mask: boolean mask of the gaps in array
+        :return: indices of the first and the last elements of continuous intervals of gaps
+        """
+        changes = np.diff(np.concatenate(([0], gap_mask.astype(np.int8), [0])))
+        return np.flatnonzero(changes == 1), np.flatnonzero(changes == -1) - 1
+
+    @staticmethod
+    def _runs_levels(runs_starts: np.array, runs_ends: np.array, n_neighbors: int,
+                     runs_steps: np.array) -> np.array:
+        """
+        Method defines the first step of filling of every interval of gaps.
+        The interval is filled after the previous one, if the previous one
+        can be among n_neighbors nearest left elements, otherwise the intervals are independent
+
+        :param runs_starts: indices of the first elements of intervals of gaps
+        :param runs_ends: indices of the last elements of intervals of gaps
+        :param n_neighbors: number of neighboring elements used for filling
+        :param runs_steps: number of filling steps for every interval
+        :return: number of filling steps before every interval
+        """
+        is_dependent = np.concatenate(([False], runs_starts[1:] - runs_ends[:-1] <= n_neighbors))
+        steps_before = np.cumsum(runs_steps) - runs_steps
+        chains_starts = np.maximum.accumulate(np.where(is_dependent, 0, np.arange(len(runs_starts))))
+        return steps_before - steps_before[chains_starts]
+
+    @staticmethod
+    def _split_by_levels(levels: np.array) -> List[np.array]:
+        """ Groups positions of the array by the values in ascending order of values """
+        order = np.argsort(levels, kind='stable')
+        return np.split(order, np.flatnonzero(np.diff(levels[order])) + 1)
+
+    @staticmethod
+    def _nearest_known_ids(points: np.array, left_borders: np.array, right_borders: np.array,
+                           known_ids: np.array, n_neighbors: int) -> Tuple[np.array, np.array]:
+        """
+        Method finds indices of nearest known elements for the points in gaps.
+        All elements to the left of the left border are already known (filled),
+        to the right of the right border only initially known elements can be used
+
+        :param points: indices of elements to find neighbors for
+        :param left_borders: indices of the first elements of the gaps with the points
+        :param right_borders: indices of the last elements of the gaps with the points
+        :param known_ids: indices of initially known elements
+        :param n_neighbors: number of nearest elements to find
+        :return: indices of nearest elements for every point and the mask of existing ones
+        """
+        shifts = np.arange(n_neighbors)
+        left_ids = left_borders[:, None] - 1 - shifts
+        right_positions = np.searchsorted(known_ids, right_borders)[:, None] + shifts
+        right_ids = known_ids[np.minimum(right_positions, len(known_ids) - 1)]
+
+        candidates = np.hstack((left_ids, right_ids))
+        is_available = np.hstack((left_ids >= 0, right_positions < len(known_ids)))
+        # Among equally distant elements the left one is preferred
+        order_key = 2 * np.abs(candidates - points[:, None]) + np.repeat([0, 1], n_neighbors)
+        order_key = np.where(is_available, order_key, np.iinfo(order_key.dtype).max)
+        nearest = np.argsort(order_key, axis=1, kind='stable')[:, :n_neighbors]
+        return np.take_along_axis(candidates, nearest, axis=1), np.take_along_axis(is_available, nearest, axis=1)
+
+    @staticmethod
+    def _centered_polyfit(output_data: np.array, centers: np.array, nearest_indices: np.array,
+                          is_available: np.array, degree: int) -> np.array:
+        """
+        Batched least-squares polynomial fits in coordinates centered at the given points
+
+        :param output_data: array with values of elements
+        :param centers: origins of the coordinates for every fit
+        :param nearest_indices: indices of the elements for every fit
+        :param is_available: mask of elements to use in the fits
+        :param degree: degree of polynomials
+        :return: coefficients of the polynomials in ascending order of powers
+        """
+        offsets = (nearest_indices - centers[:, None]).astype(float)
+        vandermonde = offsets[..., None] ** np.arange(degree + 1) * is_available[..., None]
+        values = output_data[nearest_indices] * is_available
+        return np.einsum('nij,nj->ni', np.linalg.pinv(vandermonde), values)
 
     def _fill_first_and_last_gaps(self, input_data: np.array, output_data: np.array):
         """ Eliminate gaps, which place first or last index in time series """
@@ -214,17 +258,33 @@ class ModelGapFiller(SimpleGapFiller):
     """
     Class used for filling in the gaps in time series
 
+    Gaps are filled from the beginning of the time series. The pipeline is trained on
+    the part of the time series with the values filled in the previous gaps, so the gaps form
+    the chains of dependencies. If max_train_length is defined, the gap depends only on
+    the previous gaps within this distance, and the gaps which do not depend on each other
+    are filled concurrently (if n_jobs > 1). Forecasts of the pipelines trained on identical
+    parts of time series are reused.
+
     :param gap_value: value, which mask gap elements in array
     :param pipeline: TsForecastingPipeline object for filling in the gaps
+    :param n_jobs: number of processes to fit the pipelines for independent gaps (-1 for use all cpu's)
+    :param max_train_length: maximal number of elements near the gap used to train the pipeline.
+    Default: all the elements to the left (for forward) or to the right (for inverse forecast) of the gap
     """
 
-    def __init__(self, gap_value, pipeline, log: Optional[Log] = None):
+    def __init__(self, gap_value, pipeline, log: Optional[Log] = None,
+                 n_jobs: int = 1, max_train_length: Optional[int] = None):
         super().__init__(gap_value, log)
         self.pipeline = pipeline
+        self.n_jobs = n_jobs
+        self.max_train_length = max_train_length
 
         # At least 6 elements needed to train pipeline with lagged transformation
         self.min_train_ts_length = 6
 
+        # Forecasts by the training part of time series and the length of the gap
+        self._forecasts: Dict[Tuple[bytes, int], np.array] = {}
+
     @series_has_gaps_check
     def forward_inverse_filling(self, input_data):
         """
@@ -240,26 +300,36 @@ class ModelGapFiller(SimpleGapFiller):
         gap_list = np.ravel(np.argwhere(output_data == self.gap_value))
         new_gap_list = self._parse_gap_ids(gap_list)
 
-        # Iterately fill in the gaps in the time series
-        for batch_index in range(len(new_gap_list)):
-
-            preds = []
-            weights = []
-            # Two predictions are generated for each gap - forward and backward
-            for direction_function in [self._forward, self._inverse]:
-                weights_list, predicted_list = direction_function(output_data,
-                                                                  batch_index,
-                                                                  new_gap_list)
-                weights.append(weights_list)
-                preds.append(predicted_list)
-
-            preds = np.array(preds)
-            weights = np.array(weights)
-            result = np.average(preds, axis=0, weights=weights)
-
-            gap = new_gap_list[batch_index]
-            # Replace gaps in an array with prediction values
-            output_data[gap] = result
+        self._forecasts = {}
+        with self._workers_pool() as pool:
+            # Inverse forecasts are based only on known values, so all of them are independent
+            inverse_requests = [self._inverse_forecast_request(output_data, batch_index, new_gap_list)
+                                for batch_index in range(len(new_gap_list))]
+            self._prefetch_forecasts(inverse_requests, pool)
+
+            # Iterately fill in the gaps in the time series
+            for batch_indices in self._gaps_dependency_levels(new_gap_list):
+                self._prefetch_forecasts([self._forward_forecast_request(output_data, new_gap_list[batch_index])
+                                          for batch_index in batch_indices], pool)
+                for batch_index in batch_indices:
+                    preds = []
+                    weights = []
+                    # Two predictions are generated for each gap - forward and backward
+                    for direction_function in [self._forward, self._inverse]:
+                        weights_list, predicted_list = direction_function(output_data,
+                                                                          batch_index,
+                                                                          new_gap_list)
+                        weights.append(weights_list)
+                        preds.append(predicted_list)
+
+                    preds = np.array(preds)
+                    weights = np.array(weights)
+                    result = np.average(preds, axis=0, weights=weights)
+
+                    gap = new_gap_list[batch_index]
+                    # Replace gaps in an array with prediction values
+                    output_data[gap] = result
+        self._forecasts = {}
 
         return output_data
 
@@ -278,21 +348,101 @@ class ModelGapFiller(SimpleGapFiller):
         gap_list = np.ravel(np.argwhere(output_data == self.gap_value))
         new_gap_list = self._parse_gap_ids(gap_list)
 
-        # Iterately fill in the gaps in the time series
-        for gap in new_gap_list:
-            # The entire time series is used for training until the gap
-            first_gap_element_id = gap[0]
-            timeseries_train_part = output_data[:first_gap_element_id]
+        self._forecasts = {}
+        with self._workers_pool() as pool:
+            # Iterately fill in the gaps in the time series
+            for batch_indices in self._gaps_dependency_levels(new_gap_list):
+                self._prefetch_forecasts([self._forward_forecast_request(output_data, new_gap_list[batch_index])
+                                          for batch_index in batch_indices], pool)
+                for batch_index in batch_indices:
+                    gap = new_gap_list[batch_index]
+                    # The time series before the gap is used for training
+                    timeseries_train_part = self._forward_train_part(output_data, gap)
+
+                    # Make forecast in the gap
+                    predicted = self.__forecast_in_gap(self.pipeline,
+                                                       timeseries_train_part,
+                                                       output_data, gap)
+
+                    # Replace gaps in an array with prediction values
+                    output_data[gap] = predicted
+        self._forecasts = {}
 
-            # Make forecast in the gap
-            predicted = self.__forecast_in_gap(self.pipeline,
-                                               timeseries_train_part,
-                                               output_data, gap)
-
-            # Replace gaps in an array with prediction values
-            output_data[gap] = predicted
         return output_data
 
+    def _gaps_dependency_levels(self, new_gap_list: list) -> List[List[int]]:
+        """
+        Splits gaps into groups, which can be filled independently. The gap depends on
+        the previous gaps placed in its forward training part, and the nearest one
+        is filled last among them, so the gap level is the level of the previous gap
+        increased by one or zero if the previous gap is out of the training part.
+
+        :param new_gap_list: array with nested lists of gap indexes
+        :return: indices of gaps in new_gap_list grouped by the order of filling
+        """
+        levels = np.zeros(len(new_gap_list), dtype=int)
+        for batch_index in range(1, len(new_gap_list)):
+            train_start = self._forward_train_start(new_gap_list[batch_index])
+            if new_gap_list[batch_index - 1][-1] >= train_start:
+                levels[batch_index] = levels[batch_index - 1] + 1
+        return [list(np.flatnonzero(levels == level)) for level in range(levels.max() + 1)]
+
+    def _forward_train_start(self, gap) -> int:
+        if self.max_train_length is None:
+            return 0
+        return max(0, gap[0] - self.max_train_length)
+
+    def _forward_train_part(self, output_data: np.array, gap) -> np.array:
+        return output_data[self._forward_train_start(gap):gap[0]]
+
+    def _inverse_train_part(self, output_data: np.array, batch_index: int, new_gap_list: list) -> np.array:
+        """ Known values to the right of the gap (not flipped) """
+        gap = new_gap_list[batch_index]
+        if batch_index == len(new_gap_list) - 1:
+            train_end = len(output_data)
+        else:
+            train_end = new_gap_list[batch_index + 1][0]
+        if self.max_train_length is not None:
+            train_end = min(train_end, gap[-1] + 1 + self.max_train_length)
+        return output_data[(gap[-1] + 1): train_end]
+
+    def _forward_forecast_request(self, output_data: np.array, gap) -> Optional[Tuple[np.array, int]]:
+        timeseries_train_part = self._forward_train_part(output_data, gap)
+        if len(timeseries_train_part) - len(gap) < self.min_train_ts_length:
+            return None
+        return timeseries_train_part, len(gap)
+
+    def _inverse_forecast_request(self, output_data: np.array, batch_index: int,
+                                  new_gap_list: list) -> Optional[Tuple[np.array, int]]:
+        gap = new_gap_list[batch_index]
+        timeseries_train_part = self._inverse_train_part(output_data, batch_index, new_gap_list)
+        is_last_gap = batch_index == len(new_gap_list) - 1
+        if (is_last_gap and len(timeseries_train_part) == 0) or (not is_last_gap and gap[0] == 0) or \
+                len(timeseries_train_part) - len(gap) < self.min_train_ts_length:
+            return None
+        return np.flip(timeseries_train_part), len(gap)
+
+    def _workers_pool(self):
+        n_jobs = determine_n_jobs(self.n_jobs)
+        return closing(multiprocessing.Pool(n_jobs)) if n_jobs > 1 else _NoPool()
+
+    def _prefetch_forecasts(self, requests: List[Optional[Tuple[np.array, int]]],
+                            pool: Optional['multiprocessing.pool.Pool']):
+        """ Fits the pipelines and makes forecasts for the independent gaps in the pool of processes """
+        requests_to_evaluate = {}
+        for request in requests:
+            if request is not None:
+                key = _forecast_key(*request)
+                if key not in self._forecasts:
+                    requests_to_evaluate[key] = request
+        if pool is None or len(requests_to_evaluate) < 2:
+            return
+
+        forecasts = pool.starmap(_pipeline_fit_predict,
+                                 [(self.pipeline, timeseries_train, len_gap)
+                                  for timeseries_train, len_gap in requests_to_evaluate.values()])
+        self._forecasts.update(zip(requests_to_evaluate.keys(), forecasts))
+
     def _forward(self, output_data, batch_index, new_gap_list):
         """
         The time series method makes a forward forecast based on the part
@@ -307,8 +457,7 @@ class ModelGapFiller(SimpleGapFiller):
         """
 
         gap = new_gap_list[batch_index]
-        first_gap_element_id = gap[0]
-        timeseries_train_part = output_data[:first_gap_element_id]
+        timeseries_train_part = self._forward_train_part(output_data, gap)
 
         # Adaptive prediction interval length
         len_gap = len(gap)
@@ -334,28 +483,27 @@ class ModelGapFiller(SimpleGapFiller):
         gap = new_gap_list[batch_index]
         # Adaptive prediction interval length
         len_gap = len(gap)
+        weights_list = np.arange(1, (len_gap + 1), 1)
 
         # If the interval with a gap is the last one in the array
         first_gap_element_id = gap[0]
-        latest_gap_element_id = gap[-1]
+        timeseries_train_part = self._inverse_train_part(output_data, batch_index, new_gap_list)
         if batch_index == len(new_gap_list) - 1:
-            timeseries_train_part = output_data[(latest_gap_element_id + 1):]
-
             if len(timeseries_train_part) == 0:
                 # Take last observed value as predicted
                 last_known_value = output_data[first_gap_element_id - 1]
-                return [last_known_value] * len_gap
+                return weights_list, [last_known_value] * len_gap
+
+            extended_part = output_data[(first_gap_element_id - 1):]
         else:
             next_gap = new_gap_list[batch_index + 1]
-            timeseries_train_part = output_data[(latest_gap_element_id + 1): next_gap[0]]
-
             # Take part with known values to the left from the gap
             extended_part = output_data[(first_gap_element_id - 1): next_gap[0]]
 
             if first_gap_element_id == 0:
                 # Gap in the first part of time series - take first observed value
                 first_known_value = timeseries_train_part[0]
-                return [first_known_value] * len_gap
+                return weights_list, [first_known_value] * len_gap
         timeseries_train_part = np.flip(timeseries_train_part)
 
         train_ts_len = len(timeseries_train_part) - len_gap
@@ -371,46 +519,22 @@ class ModelGapFiller(SimpleGapFiller):
                                                     len_gap)
 
             predicted = np.flip(predicted)
-        weights_list = np.arange(1, (len_gap + 1), 1)
         return weights_list, predicted
 
     def __pipeline_fit_predict(self, pipeline, timeseries_train: np.array, len_gap: int):
         """
         The method makes a prediction as a sequence of elements based on a
-        training sample. There are two main parts: fit model and predict.
+        training sample. The forecast is reused for the identical training samples.
 
         :param pipeline: pipeline for forecasting
         :param timeseries_train: part of the time series for training the model
         :param len_gap: number of elements in the gap
         :return: array without gaps
         """
-        pipeline_for_forecast = deepcopy(pipeline)
-
-        task = Task(TaskTypesEnum.ts_forecasting,
-                    TsForecastingParams(forecast_length=len_gap))
-
-        input_data = InputData(idx=np.arange(0, len(timeseries_train)),
-                               features=timeseries_train,
-                               target=timeseries_train,
-                               task=task,
-                               data_type=DataTypesEnum.ts)
-
-        # Making predictions for the missing part in the time series
-        pipeline_for_forecast.fit_from_scratch(input_data)
-
-        # "Test data" for making prediction for a specific length
-        start_forecast = len(timeseries_train)
-        end_forecast = start_forecast + len_gap
-        idx_test = np.arange(start_forecast, end_forecast)
-        test_data = InputData(idx=idx_test,
-                              features=timeseries_train,
-                              target=None,
-                              task=task,
-                              data_type=DataTypesEnum.ts)
-
-        predicted_values = pipeline_for_forecast.predict(test_data)
-        predicted_values = np.ravel(np.array(predicted_values.predict))
-        return predicted_values
+        key = _forecast_key(timeseries_train, len_gap)
+        if key not in self._forecasts:
+            self._forecasts[key] = _pipeline_fit_predict(pipeline, timeseries_train, len_gap)
+        return self._forecasts[key]
 
     def __forecast_in_gap(self, pipeline, timeseries_train_part, output_data, gap):
         """ Make forecast for desired part of time series with gap
@@ -424,11 +548,12 @@ class ModelGapFiller(SimpleGapFiller):
         train_ts_len = len(timeseries_train_part) - len(gap)
         if train_ts_len < self.min_train_ts_length:
             # Take part with gap [..., gap, gap, known_value]
-            gap_part = output_data[:gap[-1] + 2]
+            train_start = gap[0] - len(timeseries_train_part)
+            gap_part = output_data[train_start:gap[-1] + 2]
 
             # Use linear interpolation
             interpolated_part = self.linear_interpolation(gap_part)
-            predicted = interpolated_part[:-1]
+            predicted = interpolated_part[(gap[0] - train_start):(gap[-1] - train_start + 1)]
         else:
             # Pipeline for the task of filling in gaps
             predicted = self.__pipeline_fit_predict(pipeline,
@@ -436,3 +561,57 @@ class ModelGapFiller(SimpleGapFiller):
                                                     len(gap))
 
         return predicted
+
+
+class _NoPool:
+    """ Placeholder of the pool of processes for sequential filling """
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *args):
+        return False
+
+
+def _forecast_key(timeseries_train: np.array, len_gap: int) -> Tuple[bytes, int]:
+    timeseries_train = np.ascontiguousarray(timeseries_train)
+    return hashlib.blake2b(timeseries_train.tobytes(), digest_size=16).digest(), len_gap
+
+
+def _pipeline_fit_predict(pipeline, timeseries_train: np.array, len_gap: int) -> np.array:
+    """
+    Makes a prediction as a sequence of elements based on a training sample.
+    There are two main parts: fit model and predict.
+
+    :param pipeline: pipeline for forecasting
+    :param timeseries_train: part of the time series for training the model
+    :param len_gap: number of elements in the gap
+    :return: array without gaps
+    """
+    pipeline_for_forecast = deepcopy(pipeline)
+
+    task = Task(TaskTypesEnum.ts_forecasting,
+                TsForecastingParams(forecast_length=len_gap))
+
+    input_data = InputData(idx=np.arange(0, len(timeseries_train)),
+                           features=timeseries_train,
+                           target=timeseries_train,
+                           task=task,
+                           data_type=DataTypesEnum.ts)
+
+    # Making predictions for the missing part in the time series
+    pipeline_for_forecast.fit_from_scratch(input_data)
+
+    # "Test data" for making prediction for a specific length
+    start_forecast = len(timeseries_train)
+    end_forecast = start_forecast + len_gap
+    idx_test = np.arange(start_forecast, end_forecast)
+    test_data = InputData(idx=idx_test,
+                          features=timeseries_train,
+                          target=None,
+                          task=task,
+                          data_type=DataTypesEnum.ts)
+
+    predicted_values = pipeline_for_forecast.predict(test_data)
+    predicted_values = np.ravel(np.array(predicted_values.predict))
+    return predicted_values
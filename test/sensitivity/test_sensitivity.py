@@ -1,19 +1,28 @@
 import os
+from copy import deepcopy
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from cases.data.data_utils import get_scoring_case_data_paths
+from fedot.core.composer.metrics import MSE
 from fedot.core.data.data import InputData
 from fedot.core.data.data_split import train_test_data_setup
 from fedot.core.log import default_log
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.sensitivity.deletion_methods.multi_times_analysis import MultiTimesAnalyze
-from fedot.sensitivity.node_sa_approaches import NodeAnalysis, NodeDeletionAnalyze, NodeReplaceOperationAnalyze
+from fedot.sensitivity.node_sa_approaches import (
+    NodeAnalysis,
+    NodeDeletionAnalyze,
+    NodeReplaceOperationAnalyze,
+    PipelineSamplesEvaluator
+)
 from fedot.sensitivity.nodes_sensitivity import NodesAnalysis
 from fedot.sensitivity.operations_hp_sensitivity.multi_operations_sensitivity import MultiOperationsHPAnalyze
 from fedot.sensitivity.operations_hp_sensitivity.one_operation_sensitivity import OneOperationHPAnalyze
+from fedot.sensitivity.operations_hp_sensitivity.problem import MultiOperationsProblem
 from fedot.sensitivity.pipeline_sensitivity import PipelineAnalysis
 from fedot.sensitivity.pipeline_sensitivity_facade import PipelineSensitivityAnalysis
 from fedot.sensitivity.sa_requirements import SensitivityAnalysisRequirements
@@ -48,6 +57,16 @@ def get_pipeline():
     return pipeline
 
 
+def get_deterministic_pipeline():
+    scaling_node = PrimaryNode('scaling')
+    logit_node = SecondaryNode('logit', nodes_from=[scaling_node])
+    knn_node = PrimaryNode('knn')
+
+    final = SecondaryNode('logit', nodes_from=[logit_node, knn_node])
+
+    return Pipeline(final)
+
+
 def given_data():
     pipeline = get_pipeline()
     train_data, test_data = scoring_dataset()
@@ -93,6 +112,57 @@ def test_pipeline_structure_analyze_analyze():
     assert isinstance(result, dict)
 
 
+def test_pipeline_structure_analyze_parallel_equals_sequential():
+    # given
+    _, train_data, test_data, _, result_dir = given_data()
+    train_data, test_data = train_data.subset_range(0, 999), test_data.subset_range(0, 499)
+    results = []
+
+    # when
+    for n_jobs in [1, 2]:
+        pipeline = get_deterministic_pipeline()
+        primary_nodes = [node for node in pipeline.nodes if not node.nodes_from]
+        requirements = SensitivityAnalysisRequirements(replacement_nodes_to_replace_to=[PrimaryNode('lda'),
+                                                                                        PrimaryNode('knn')],
+                                                       is_visualize=False, is_save_results_to_json=False,
+                                                       n_jobs=n_jobs)
+        with patch('multiprocessing.cpu_count', return_value=2):
+            results.append(NodesAnalysis(pipeline=pipeline,
+                                         train_data=train_data,
+                                         test_data=test_data,
+                                         approaches=[NodeDeletionAnalyze, NodeReplaceOperationAnalyze],
+                                         requirements=requirements,
+                                         nodes_to_analyze=primary_nodes,
+                                         path_to_save=result_dir).analyze())
+
+    # then
+    sequential_result, parallel_result = results
+    assert len(sequential_result) == 2
+    assert sequential_result == parallel_result
+
+
+def test_samples_evaluator_reuses_unaffected_nodes():
+    # given
+    pipeline = get_deterministic_pipeline()
+    _, train_data, test_data, _, result_dir = given_data()
+    train_data, test_data = train_data.subset_range(0, 999), test_data.subset_range(0, 499)
+    scaling_node = pipeline.nodes[2]
+    shortened_pipeline = NodeDeletionAnalyze(pipeline=pipeline,
+                                             train_data=train_data,
+                                             test_data=test_data,
+                                             path_to_save=result_dir).sample(scaling_node)
+
+    # when
+    losses = PipelineSamplesEvaluator(train_data, test_data).evaluate(pipeline, [shortened_pipeline])
+
+    # then
+    knn_node = next(node for node in pipeline.nodes if node.operation.operation_type == 'knn')
+    shortened_knn_node = next(node for node in shortened_pipeline.nodes if node.operation.operation_type == 'knn')
+    assert len(losses) == 1
+    assert shortened_knn_node.fitted_operation is knn_node.fitted_operation
+    assert shortened_pipeline.root_node.fitted_operation is not pipeline.root_node.fitted_operation
+
+
 # ------------------------------------------------------------------------------
 # NodeAnalysis
 
@@ -262,6 +332,36 @@ def test_multi_operations_analyze_analyze(analyze_method):
     assert analyze_method.called
 
 
+def test_multi_operations_response_matrix_correct():
+    # given
+    scaling_node = PrimaryNode('scaling')
+    knn_node = SecondaryNode('knn', nodes_from=[scaling_node])
+    pipeline = Pipeline(SecondaryNode('logit', nodes_from=[knn_node]))
+    _, train_data, test_data, _, result_dir = given_data()
+    train_data, test_data = train_data.subset_range(0, 999), test_data.subset_range(0, 499)
+    requirements = SensitivityAnalysisRequirements(n_jobs=2)
+
+    analyzer = MultiOperationsHPAnalyze(pipeline=pipeline, train_data=train_data, test_data=test_data,
+                                        requirements=requirements, path_to_save=result_dir)
+    analyzer.problem = MultiOperationsProblem([node.operation.operation_type for node in pipeline.nodes])
+    samples = analyzer.sample(2)
+
+    # when
+    with patch('multiprocessing.cpu_count', return_value=2):
+        response_matrix = analyzer._get_response_matrix(samples)
+
+    # then
+    expected_response = []
+    for sample in samples:
+        sample = deepcopy(sample)
+        sample.fit(train_data)
+        expected_response.append(MSE.metric(test_data, sample.predict(test_data)))
+
+    # Sample per each Saltelli sequence point (2 * (2 * 3 params + 2))
+    assert len(samples) == 16
+    assert np.array_equal(response_matrix, np.array(expected_response))
+
+
 # ------------------------------------------------------------------------------
 # SA Facade
 
@@ -97,6 +97,32 @@ def test_node_children():
     assert children[0] is pipeline.nodes[1]
 
 
+def test_clone_copies_structure_and_shares_operations():
+    # given
+    pipeline = get_initial_pipeline()
+    pipeline.nodes[0].custom_params = {'n_neighbors': 3}
+    opt_graph = PipelineAdapter().adapt(pipeline)
+
+    for graph in [pipeline, opt_graph]:
+        # when
+        graph_clone = graph.clone()
+
+        # then
+        assert type(graph_clone) is type(graph)
+        assert graph_clone == graph == deepcopy(graph)
+        assert all(type(node_clone) is type(node) and node_clone.uid == node.uid and node_clone is not node
+                   for node, node_clone in zip(graph.nodes, graph_clone.nodes))
+
+        # when
+        graph_clone.nodes[0].content['params']['n_neighbors'] = 5
+        graph_clone.delete_node(graph_clone.nodes[1])
+
+        # then
+        assert graph_clone.length == graph.length - 1
+        assert graph.nodes[0].content['params'] == {'n_neighbors': 3}
+    assert pipeline.clone().nodes[0].operation is pipeline.nodes[0].operation
+
+
 # ------------------------------------------------------------------------------
 # Tests for distance_to_other method
 
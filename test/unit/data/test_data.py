@@ -8,7 +8,7 @@ from sklearn.datasets import load_iris
 
 from fedot.core.data.data import InputData, OutputData
 from fedot.core.data.multi_modal import MultiModalData
-from fedot.core.pipelines.node import PrimaryNode
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import Task, TaskTypesEnum
@@ -153,6 +153,18 @@ def test_multi_modal_data():
     assert np.array_equal(multi_modal.target, new_target)
 
 
+def test_data_from_csv_chunks_correct():
+    file_path = os.path.join(fedot_project_root(), 'test/data/simple_classification.csv')
+    data = InputData.from_csv(file_path)
+
+    chunks = list(InputData.from_csv_chunks(file_path, chunk_size=10))
+
+    assert [len(chunk.idx) for chunk in chunks] == [10, 10, len(data.idx) - 20]
+    assert np.array_equal(np.concatenate([chunk.idx for chunk in chunks]), data.idx)
+    assert np.array_equal(np.concatenate([chunk.features for chunk in chunks]), data.features)
+    assert np.array_equal(np.concatenate([chunk.target for chunk in chunks]), data.target)
+
+
 def test_target_data_from_csv_correct():
     """ Function tests two ways of processing target columns in "from_csv"
     method
@@ -238,3 +250,19 @@ def test_data_convert_dt_indexes_correct():
     assert np.all(train_data.supplementary_data.non_int_idx == old_train_data_idx)
     assert np.all(train_pred_data.supplementary_data.non_int_idx == old_train_pred_data_idx)
     assert np.all(test_data.supplementary_data.non_int_idx == old_test_data_idx)
+
+
+def test_table_data_float32_precision_kept_through_pipeline(data_setup):
+    data_setup.precision = 'float32'
+    assert data_setup.features.dtype == np.float32
+
+    scaled = Pipeline(PrimaryNode('scaling')).fit(data_setup)
+    pipeline = Pipeline(SecondaryNode('logit', nodes_from=[PrimaryNode('scaling')]))
+    pipeline.fit(data_setup)
+    predicted = pipeline.predict(data_setup, output_mode='full_probs')
+
+    assert scaled.predict.dtype == np.float32
+    assert predicted.predict.dtype == np.float32
+
+    with pytest.raises(ValueError):
+        data_setup.precision = 'float16'
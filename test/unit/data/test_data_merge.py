@@ -4,6 +4,7 @@ from typing import List
 
 import numpy as np
 import pytest
+from scipy import sparse
 
 from examples.simple.regression.regression_with_tuning import get_regression_dataset
 from fedot.core.data.data import InputData, OutputData
@@ -214,6 +215,35 @@ def test_data_merge_tables_with_equal_length_but_different_indices():
     assert all(np.isin(merged_data.idx, output.idx).all() for output in outputs)
 
 
+def test_data_merge_tables_with_equal_shuffled_indices():
+    """ Outputs with the same index don't need an alignment, and the order of elements is kept """
+    outputs = generate_output_tables(input_lengths=[30] * 3, unique=False)
+    for output in outputs:
+        output.idx = outputs[0].idx.copy()
+
+    merger = DataMerger.get(outputs)
+    merged_data = merger.merge()
+
+    assert merger.has_common_index
+    assert np.array_equal(merged_data.idx, outputs[0].idx)
+    assert np.array_equal(merged_data.features, np.hstack([output.predict for output in outputs]))
+
+
+def test_data_merge_tables_with_unordered_indices():
+    """ Alignment of different unordered indices selects the same elements as np.isin """
+    outputs = generate_output_tables(input_lengths=[30] * 3, overlapping=True, unique=True)
+    for output in outputs:
+        output.idx = output.idx[::-1]
+
+    merger = DataMerger.get(outputs)
+    merged_data = merger.merge()
+
+    assert not merger.has_common_index
+    for output in outputs:
+        index_mask = np.isin(output.idx, merged_data.idx)
+        assert np.array_equal(merger.select_common(output.idx, output.predict), output.predict[index_mask])
+
+
 def test_data_merge_tables_with_unequal_nonunique_indices():
     outputs = generate_output_tables(input_lengths=[20, 25, 30], unique=False)
     with pytest.raises(ValueError, match='not equal and not unique'):
@@ -241,3 +271,15 @@ def test_data_merge_no_main_targets():
     merged_data = DataMerger.get(outputs).merge()
 
     assert np.equal(merged_data.target, outputs[1].target).all()
+
+
+def test_data_merge_sparse_and_dense_tables():
+    """ Sparse tables are merged with the dense ones without densifying and give the same features """
+    outputs = generate_output_tables(input_lengths=[30] * 3, overlapping=True, unique=True)
+    dense_merged = DataMerger.get(outputs).merge()
+    outputs[0].predict = sparse.csr_matrix(outputs[0].predict)
+    sparse_merged = DataMerger.get(outputs).merge()
+
+    assert sparse.isspmatrix_csr(sparse_merged.features)
+    assert np.array_equal(sparse_merged.idx, dense_merged.idx)
+    assert np.array_equal(sparse_merged.features.toarray(), dense_merged.features)
@@ -1,14 +1,19 @@
 import os
+from copy import deepcopy
 
 import numpy as np
+import pandas as pd
+from scipy.sparse import issparse
 from examples.simple.classification.classification_with_tuning import get_classification_dataset
 from examples.simple.regression.regression_with_tuning import get_regression_dataset
 from examples.simple.time_series_forecasting.gapfilling import generate_synthetic_data
 from fedot.core.data.data import InputData
 from fedot.core.data.data_split import train_test_data_setup
 from fedot.core.data.supplementary_data import SupplementaryData
+from fedot.core.operations.evaluation.operation_implementations.data_operations.categorical_encoders import \
+    LabelEncodingImplementation, MIN_ENCODED_COLUMNS_FOR_SPARSE
 from fedot.core.operations.evaluation.operation_implementations.data_operations. \
-    sklearn_transformations import ImputationImplementation
+    sklearn_transformations import ImputationImplementation, NormalizationImplementation, ScalingImplementation
 from fedot.core.operations.evaluation.operation_implementations.data_operations.ts_transformations import \
     CutImplementation, LaggedTransformationImplementation
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
@@ -391,6 +396,34 @@ def test_one_hot_encoding_new_category_in_test():
     assert predicted is not None
 
 
+def test_one_hot_encoding_high_cardinality_sparse_output():
+    """ Check that One Hot Encoding of many categories gives sparse table, which is taken
+    by the models supporting sparse input as is and is densified for the other ones
+    """
+    categories = np.array([f'category_{i}' for i in range(MIN_ENCODED_COLUMNS_FOR_SPARSE)], dtype=object)
+    samples = 2 * len(categories)
+    features = np.empty((samples, 2), dtype=object)
+    features[:, 0] = categories[np.arange(samples) % len(categories)]
+    features[:, 1] = np.random.rand(samples)
+    supp_data = SupplementaryData(column_types={'features': [NAME_CLASS_STR, NAME_CLASS_FLOAT]})
+    input_data = InputData(idx=np.arange(samples), features=features, target=np.random.randint(0, 2, samples),
+                           task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table,
+                           supplementary_data=supp_data)
+
+    one_hot_node = PrimaryNode('one_hot_encoding')
+    logit_node = SecondaryNode('logit', nodes_from=[one_hot_node])
+    dt_node = SecondaryNode('dt', nodes_from=[one_hot_node])
+    pipeline = Pipeline(SecondaryNode('logit', nodes_from=[logit_node, dt_node]))
+    pipeline.fit(input_data)
+    encoded = one_hot_node.predict(input_data).predict
+    predicted = pipeline.predict(input_data)
+
+    assert issparse(encoded)
+    assert encoded.shape == (samples, 1 + len(categories))
+    assert np.allclose(encoded[:, 0].toarray().ravel(), features[:, 1].astype(float))
+    assert predicted.predict.shape[0] == samples
+
+
 def test_knn_with_float_neighbors():
     """
     Check pipeline with k-nn fit and predict correctly if n_neighbors value
@@ -440,6 +473,25 @@ def test_imputation_binary_features_with_equal_categories_correct():
     assert np.isclose(predicted.predict[1, 1], 5.0)
 
 
+def test_imputation_binary_features_defined_on_fit():
+    """ Binary features are defined by the train table, so the continuous feature is not discretized
+    on the predict stage even if there are only two values of it in the new table """
+    train_features = np.array([[1.0, 'a'], [2.5, 'b'], [4.0, 'a'], [7.0, np.nan], [np.nan, 'b']], dtype=object)
+    test_features = np.array([[2.5, 'a'], [np.nan, 'b'], [4.0, np.nan]], dtype=object)
+    supp_data = SupplementaryData(column_types={'features': [NAME_CLASS_FLOAT, NAME_CLASS_STR]})
+    train_data, test_data = [InputData(idx=np.arange(len(features)), features=features, target=None,
+                                       task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table,
+                                       supplementary_data=supp_data)
+                             for features in [train_features, test_features]]
+
+    imputer = ImputationImplementation()
+    imputer.fit(train_data)
+    predicted = imputer.transform(test_data).predict
+
+    assert np.isclose(predicted[1, 0], 3.625)
+    assert list(predicted[:, 1]) == ['a', 'b', 'a']
+
+
 def test_label_encoding_correct():
     """
     Check if LabelEncoder can perform transformations correctly. Also the dataset
@@ -462,6 +514,32 @@ def test_label_encoding_correct():
     assert predicted_test.predict[0, 0] == 2
 
 
+def test_label_encoding_unseen_categories_and_gaps_correct():
+    """ Unseen categories get the codes after the known ones in order of appearance and keep them,
+    gaps remain nan and the source data isn't changed """
+    supp_data = SupplementaryData(column_types={'features': [NAME_CLASS_STR, NAME_CLASS_FLOAT]})
+    train_features = np.array([['b', 1.], ['a', 2.], [np.nan, 3.], ['c', 4.]], dtype=object)
+    test_features = np.array([['e', 1.], ['a', 2.], ['d', 3.], [np.nan, 4.], ['e', 5.]], dtype=object)
+    train_data, test_data = [InputData(idx=np.arange(len(features)), features=features, target=None,
+                                       task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table,
+                                       supplementary_data=deepcopy(supp_data))
+                             for features in [train_features, test_features]]
+
+    encoder = LabelEncodingImplementation()
+    encoder.fit(train_data)
+    encoded_train = encoder.transform(train_data, is_fit_pipeline_stage=True)
+    encoded_test = encoder.transform(test_data, is_fit_pipeline_stage=False)
+    encoded_test_again = encoder.transform(test_data, is_fit_pipeline_stage=False)
+
+    assert [encoded_train.predict[i, 0] for i in [0, 1, 3]] == [1, 0, 2]
+    assert [encoded_test.predict[i, 0] for i in [0, 1, 2, 4]] == [3, 0, 4, 3]
+    assert pd.isna(encoded_train.predict[2, 0]) and pd.isna(encoded_test.predict[3, 0])
+    assert pd.DataFrame(encoded_test.predict).equals(pd.DataFrame(encoded_test_again.predict))
+    assert test_data.features[0, 0] == 'e'
+    assert encoded_test.supplementary_data.column_types['features'] == [NAME_CLASS_INT, NAME_CLASS_FLOAT]
+    assert test_data.supplementary_data.column_types['features'] == [NAME_CLASS_STR, NAME_CLASS_FLOAT]
+
+
 def test_lagged_with_multivariate_time_series():
     """
     Checking the correct processing of multivariate time series in the lagged operation
@@ -549,3 +627,25 @@ def test_poly_features_on_big_datasets():
 
     n_rows, n_cols = transformed_features.predict.shape
     assert n_cols == 85
+
+
+def test_encoded_invariant_operations_keep_bool_columns():
+    """ Boolean columns (with at most two unique values including nan) are defined once for the table
+    and aren't transformed by the scaling and normalization """
+    features = np.random.normal(size=(50, 6))
+    features[:, 1] = np.random.randint(0, 2, size=50)
+    features[:, 3] = np.where(np.random.random(50) > 0.5, 5., np.nan)
+    features[:, 4] = np.nan
+    input_data = InputData(idx=np.arange(50), features=features, target=np.random.normal(size=50),
+                           task=Task(TaskTypesEnum.regression), data_type=DataTypesEnum.table)
+    bool_ids = [column_id for column_id in range(features.shape[1]) if len(np.unique(features[:, column_id])) <= 2]
+
+    for implementation in [ScalingImplementation(), NormalizationImplementation()]:
+        implementation.fit(input_data)
+        transformed = implementation.transform(input_data, is_fit_pipeline_stage=True).predict
+
+        assert list(implementation.bool_ids) == bool_ids == [1, 3, 4]
+        assert np.array_equal(transformed[:, :len(bool_ids)], features[:, bool_ids], equal_nan=True)
+        assert np.allclose(transformed[:, len(bool_ids):],
+                           implementation.operation.transform(features[:, implementation.ids_to_process]))
+    assert input_data.supplementary_data.bool_columns[0] is features
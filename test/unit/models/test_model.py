@@ -321,3 +321,21 @@ def test_pca_model_fit_with_wide_table():
 
     params, changed_hyperparams = pca_model.get_params()
     assert changed_hyperparams[0] == 'n_components'
+
+
+def test_model_predict_reuses_evaluation_strategy(classification_dataset):
+    train_data, test_data = train_test_data_setup(data=classification_dataset)
+    model = Model(operation_type='logit')
+    fitted_operation, _ = model.fit(params={'C': 1.0}, data=train_data)
+
+    model.predict(fitted_operation, test_data, is_fit_pipeline_stage=False, params={'C': 1.0})
+    strategy = model._eval_strategy
+    labels = model.predict(fitted_operation, test_data, is_fit_pipeline_stage=False, params={'C': 1.0},
+                           output_mode='labels')
+
+    # The strategy is created again only for the new params, output mode doesn't leak into the next predictions
+    assert model._eval_strategy is strategy
+    assert np.array_equal(np.unique(labels.predict), [0, 1])
+    model.predict(fitted_operation, test_data, is_fit_pipeline_stage=False, params={'C': 2.0})
+    assert model._eval_strategy is not strategy
+    assert model._eval_strategy.output_mode == 'default'
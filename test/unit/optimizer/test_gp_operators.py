@@ -1,5 +1,6 @@
 import datetime
 import os
+import time
 
 import numpy as np
 from deap import tools
@@ -12,8 +13,11 @@ from fedot.core.dag.validation_rules import DEFAULT_DAG_RULES
 from fedot.core.data.data import InputData
 from fedot.core.log import default_log
 from fedot.core.optimisers.adapters import DirectAdapter, PipelineAdapter
+from fedot.core.optimisers.gp_comp.evaluation_cost import EvaluationCostModel
+from fedot.core.optimisers.gp_comp.evaluation_guard import GuardedEvaluationPool
 from fedot.core.optimisers.gp_comp.gp_operators import filter_duplicates
-from fedot.core.optimisers.gp_comp.individual import Individual
+from fedot.core.optimisers.gp_comp.gp_optimiser import EvoGraphOptimiser, GPGraphOptimiserParameters
+from fedot.core.optimisers.gp_comp.individual import Individual, graph_structural_hash
 from fedot.core.optimisers.gp_comp.operators.crossover import CrossoverTypesEnum, crossover
 from fedot.core.optimisers.gp_comp.operators.evaluation import EvaluationDispatcher
 from fedot.core.optimisers.gp_comp.operators.mutation import MutationTypesEnum, _adapt_and_apply_mutations, mutation, \
@@ -142,6 +146,127 @@ def test_evaluate_individuals():
     assert all([ind.fitness.valid for ind in evaluated])
 
 
+def test_evaluation_cost_model_correct():
+    adapter = PipelineAdapter()
+    graph = adapter.adapt(pipeline_first())
+    cost_model = EvaluationCostModel()
+    assert cost_model.predict(graph) is None
+
+    nodes_keys = cost_model.nodes_keys(graph)
+    cost_model.update(zip(nodes_keys, [1.0] * len(nodes_keys)), evaluation_time=2.0 * len(nodes_keys))
+
+    assert np.isclose(cost_model.predict(graph), 2.0 * len(nodes_keys))
+    # Operations without observations can't be predicted
+    assert cost_model.predict(adapter.adapt(Pipeline(PrimaryNode('svc')))) is None
+
+
+def test_evaluate_individuals_skips_predicted_too_long():
+    task = Task(TaskTypesEnum.classification)
+    dataset_to_compose = InputData.from_csv(os.path.join(fedot_project_root(), 'test/data/simple_classification.csv'),
+                                            task=task)
+    objective_builder = DataObjectiveBuilder(Objective([ClassificationMetricsEnum.ROCAUC_penalty]))
+    objective_eval = objective_builder.build(dataset_to_compose)
+    adapter = PipelineAdapter()
+    population = [Individual(adapter.adapt(c)) for c in [pipeline_first(), pipeline_second()]]
+
+    cost_model = EvaluationCostModel()
+    for ind in population:
+        nodes_keys = cost_model.nodes_keys(ind.graph)
+        cost_model.update(zip(nodes_keys, [100.0] * len(nodes_keys)), evaluation_time=100.0 * len(nodes_keys))
+
+    with OptimisationTimer(timeout=datetime.timedelta(minutes=1)) as t:
+        evaluator = EvaluationDispatcher(objective_eval, adapter, timer=t, cost_model=cost_model)
+        evaluated = evaluator(population)
+    # All the individuals are skipped, so only one of them is evaluated regardless of time limit
+    assert len(evaluated) == 1
+    assert evaluated[0].fitness.valid
+    assert len(evaluated[0].metadata['nodes_fit_time_in_seconds']) == len(evaluated[0].graph.nodes)
+
+
+def _evaluate_with_violations(item: str):
+    if item == 'long':
+        time.sleep(60)
+    elif item == 'large':
+        memory = np.ones(2 ** 30 // 8)
+        time.sleep(60)
+        return memory.sum()
+    elif item == 'invalid':
+        raise ValueError('Invalid item')
+    return item
+
+
+def test_guarded_evaluation_pool_stops_violators():
+    pool = GuardedEvaluationPool(_evaluate_with_violations, n_workers=2, time_limit=5, memory_limit=512)
+    items = ['first', 'long', 'second', 'large', 'invalid', 'third']
+
+    start_time = time.time()
+    evaluated = {item: (result, reason) for item, result, reason in pool.imap_unordered(items)}
+
+    assert time.time() - start_time < 30
+    assert set(evaluated) == set(items)
+    for item in ['first', 'second', 'third']:
+        assert evaluated[item] == (item, None)
+    assert evaluated['long'][0] is None and 'time' in evaluated['long'][1]
+    assert evaluated['large'][0] is None and 'memory' in evaluated['large'][1]
+    assert evaluated['invalid'][0] is None and 'Invalid item' in evaluated['invalid'][1]
+
+
+class _ObjectiveEvalHangingOnGraph:
+    """ Objective evaluation that hangs on the graph with the given descriptive id """
+
+    def __init__(self, objective_eval, hanging_graph_id: str):
+        self.objective_eval = objective_eval
+        self.hanging_graph_id = hanging_graph_id
+
+    def __call__(self, graph):
+        if graph.root_node.descriptive_id == self.hanging_graph_id:
+            time.sleep(60)
+        return self.objective_eval(graph)
+
+    def cleanup(self, graph):
+        self.objective_eval.cleanup(graph)
+
+
+def test_evaluate_individuals_with_time_limit():
+    dataset_to_compose = InputData.from_csv(os.path.join(fedot_project_root(), 'test/data/simple_classification.csv'),
+                                            task=Task(TaskTypesEnum.classification))
+    objective_eval = DataObjectiveBuilder(Objective([ClassificationMetricsEnum.ROCAUC_penalty])) \
+        .build(dataset_to_compose)
+    adapter = PipelineAdapter()
+    population = [Individual(adapter.adapt(c)) for c in [pipeline_first(), pipeline_second()]]
+
+    evaluator = EvaluationDispatcher(objective_eval, adapter, evaluation_time_limit=datetime.timedelta(minutes=1))
+    evaluated = evaluator(population)
+    assert len(evaluated) == len(population)
+    assert all(ind.fitness.valid for ind in evaluated)
+
+    hanging_objective_eval = _ObjectiveEvalHangingOnGraph(objective_eval, pipeline_second().root_node.descriptive_id)
+    evaluator = EvaluationDispatcher(hanging_objective_eval, adapter,
+                                     evaluation_time_limit=datetime.timedelta(seconds=10))
+    evaluated = {ind.uid: ind for ind in evaluator(population)}
+
+    # The individual violating the limit is kept in the population with null fitness
+    assert set(evaluated) == {ind.uid for ind in population}
+    first, second = evaluated[population[0].uid], evaluated[population[1].uid]
+    assert first.fitness.valid and 'evaluation_failure' not in first.metadata
+    assert not second.fitness.valid and 'time' in second.metadata['evaluation_failure']
+
+
+def test_randomized_initial_population_has_unique_graphs():
+    requirements = PipelineComposerRequirements(primary=['scaling', 'logit', 'knn'], secondary=['logit', 'rf'],
+                                                max_depth=3, pop_size=20)
+    graph_params = GraphGenerationParams(adapter=PipelineAdapter(), advisor=PipelineChangeAdvisor(),
+                                         rules_for_constraint=DEFAULT_DAG_RULES)
+    optimiser = EvoGraphOptimiser(initial_graph=[pipeline_first()], requirements=requirements,
+                                  graph_generation_params=graph_params,
+                                  objective=Objective(ClassificationMetricsEnum.ROCAUC),
+                                  parameters=GPGraphOptimiserParameters())
+
+    population = optimiser._init_population(requirements.pop_size)
+
+    assert len({graph_structural_hash(ind.graph) for ind in population}) == len(population)
+
+
 def test_filter_duplicates():
     archive = tools.ParetoFront()
     archive_items = [pipeline_first(), pipeline_second(), pipeline_third()]
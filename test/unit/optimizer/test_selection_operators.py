@@ -1,10 +1,14 @@
+import random
+from copy import copy
 from functools import partial
 
+from examples.advanced.selection_benchmark import get_population, reference_individuals_selection
 from fedot.core.composer.advisor import PipelineChangeAdvisor
 from fedot.core.composer.gp_composer.gp_composer import PipelineComposerRequirements
 from fedot.core.debug.metrics import RandomMetric
 from fedot.core.optimisers.adapters import PipelineAdapter
 from fedot.core.optimisers.fitness.fitness import SingleObjFitness
+from fedot.core.optimisers.fitness.multi_objective_fitness import MultiObjFitness
 from fedot.core.optimisers.gp_comp.gp_operators import random_graph
 from fedot.core.optimisers.gp_comp.individual import Individual
 from fedot.core.optimisers.gp_comp.operators.selection import (
@@ -14,6 +18,7 @@ from fedot.core.optimisers.gp_comp.operators.selection import (
     selection,
     tournament_selection
 )
+from fedot.core.optimisers.graph import OptGraph, OptNode
 from fedot.core.optimisers.optimizer import GraphGenerationParams
 
 
@@ -99,3 +104,30 @@ def test_individuals_selection_equality_individuals():
     selected_individuals_ref = [str(ind) for ind in selected_individuals]
     assert (len(selected_individuals) == num_of_inds and
             len(set(selected_individuals_ref)) == 1)
+
+
+def test_individuals_selection_same_as_with_list_membership():
+    population = get_population(100)
+    graph_params = GraphGenerationParams(advisor=PipelineChangeAdvisor(), adapter=PipelineAdapter())
+
+    random.seed(1)
+    reference = reference_individuals_selection(copy(population), 50)
+    random.seed(1)
+    selected_individuals = individuals_selection(types=[SelectionTypesEnum.tournament],
+                                                 individuals=copy(population),
+                                                 pop_size=50, graph_params=graph_params)
+
+    assert [ind.uid for ind in selected_individuals] == [ind.uid for ind in reference]
+
+
+def test_selection_skips_individuals_with_invalid_fitness():
+    population = [Individual(OptGraph(OptNode('model'))) for _ in range(10)]
+    for ind_num, ind in enumerate(population[:6]):
+        ind.fitness = MultiObjFitness(values=(ind_num, 10 - ind_num), weights=-1)
+    # The rest of individuals are penalised with null fitness
+    graph_params = GraphGenerationParams(advisor=PipelineChangeAdvisor(), adapter=PipelineAdapter())
+
+    for selection_type in SelectionTypesEnum:
+        selected_individuals = selection(types=[selection_type], population=population,
+                                         pop_size=4, params=graph_params)
+        assert selected_individuals and all(ind.fitness.valid for ind in selected_individuals)
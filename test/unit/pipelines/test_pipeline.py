@@ -449,6 +449,55 @@ def test_pipeline_unfit(data_fixture, request):
         assert pipeline.predict(data)
 
 
+def test_pipeline_partial_fit_by_chunks_correct():
+    file_path = os.path.join(str(os.path.dirname(__file__)), '../../data/simple_regression_train.csv')
+    task = Task(TaskTypesEnum.regression)
+    full_data = InputData.from_csv(file_path, task=task)
+
+    # Parent node is shared by two nodes, so it must be trained once per chunk
+    scaling_node = PrimaryNode('scaling')
+    normalization_node = SecondaryNode('normalization', nodes_from=[scaling_node])
+    pipeline = Pipeline(SecondaryNode('sgdr', nodes_from=[scaling_node, normalization_node]))
+    for chunk in InputData.from_csv_chunks(file_path, chunk_size=20, task=task):
+        pipeline.partial_fit(chunk)
+    prediction = pipeline.predict(full_data)
+
+    assert pipeline.is_fitted
+    assert scaling_node.fitted_operation.operation.n_samples_seen_ == len(full_data.idx)
+    assert prediction.predict.shape[0] == len(full_data.idx)
+
+    with pytest.raises(ValueError):
+        Pipeline(SecondaryNode('ridge', nodes_from=[PrimaryNode('scaling')])).partial_fit(full_data)
+
+
+@pytest.mark.parametrize('output_mode', ['default', 'labels', 'full_probs'])
+def test_inference_plan_predict_same_as_pipeline(data_setup, output_mode):
+    train, test = train_test_data_setup(data_setup)
+    scaling_node = PrimaryNode('scaling')
+    pca_node = SecondaryNode('pca', nodes_from=[scaling_node])
+    logit_node = SecondaryNode('logit', nodes_from=[scaling_node, pca_node])
+    pipeline = Pipeline(SecondaryNode('dt', nodes_from=[logit_node, PrimaryNode('normalization')]))
+    pipeline.fit(train)
+
+    plan = pipeline.compile_inference_plan(test.task, output_mode=output_mode)
+    features_with_gap = np.array(test.features, dtype=float)
+    features_with_gap[0, 0] = np.nan
+    for features in [test.features[:1], test.features, features_with_gap]:
+        batch = InputData(idx=np.arange(len(features)), features=np.array(features), target=None,
+                          task=test.task, data_type=DataTypesEnum.table)
+        expected = pipeline.predict(batch, output_mode=output_mode).predict
+        predicted = plan.predict(features)
+
+        assert predicted.dtype == expected.dtype
+        assert np.array_equal(predicted, expected)
+
+    # Operations without prediction on tables can't be compiled
+    knn_pipeline = Pipeline(PrimaryNode('knn'))
+    knn_pipeline.fit(train)
+    with pytest.raises(ValueError):
+        knn_pipeline.compile_inference_plan(test.task)
+
+
 def test_ts_forecasting_pipeline_with_poly_features():
     """ Test pipeline with polynomial features in ts forecasting task """
     lagged_node = PrimaryNode('lagged')
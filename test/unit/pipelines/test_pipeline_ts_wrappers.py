@@ -6,6 +6,7 @@ from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.pipelines.ts_wrappers import fitted_values
 from fedot.core.pipelines.ts_wrappers import in_sample_ts_forecast, out_of_sample_ts_forecast, in_sample_fitted_values
+from fedot.core.pipelines.ts_wrappers import out_of_sample_ts_forecast_batch
 from fedot.core.repository.dataset_types import DataTypesEnum
 from fedot.core.repository.tasks import Task, TaskTypesEnum, TsForecastingParams
 
@@ -141,3 +142,62 @@ def test_fitted_values_correct():
         fitted_ts_values = fitted_func(ts_input, train_predicted)
 
         assert len(fitted_ts_values.predict) == len(ts_input.target) - 4
+
+
+def get_two_branches_lagged_pipeline():
+    node_lagged_short = PrimaryNode('lagged')
+    node_lagged_short.custom_params = {'window_size': 3}
+    node_lagged_long = PrimaryNode('lagged')
+    node_lagged_long.custom_params = {'window_size': 6}
+    node_scaling = SecondaryNode('scaling', nodes_from=[node_lagged_long])
+    node_ridge = SecondaryNode('ridge', nodes_from=[node_lagged_short])
+    node_final = SecondaryNode('linear', nodes_from=[node_scaling, node_ridge])
+    return Pipeline(node_final)
+
+
+def test_out_of_sample_ts_forecast_batch_correct():
+    forecast_length, horizon = 2, 7
+    train_input, _ = prepare_ts_for_in_sample(forecast_length, horizon)
+    task = train_input.task
+
+    batch = [np.sin(np.arange(length) / 3) * length for length in [20, 25, 32]]
+    smoothing_pipeline = Pipeline(SecondaryNode('linear',
+                                                nodes_from=[SecondaryNode('lagged',
+                                                                          nodes_from=[PrimaryNode('smoothing')])]))
+    for pipeline in [get_simple_short_lagged_pipeline(), get_two_branches_lagged_pipeline(), smoothing_pipeline]:
+        pipeline.fit(train_input)
+
+        batch_predicted = out_of_sample_ts_forecast_batch(pipeline=pipeline, time_series=batch,
+                                                          task=task, horizon=horizon)
+
+        assert batch_predicted.shape == (len(batch), horizon)
+        for ts, ts_predicted in zip(batch, batch_predicted):
+            predict_input = InputData(idx=np.arange(len(ts), len(ts) + forecast_length), features=ts,
+                                      target=None, task=task, data_type=DataTypesEnum.ts)
+            expected = out_of_sample_ts_forecast(pipeline=pipeline, input_data=predict_input, horizon=horizon)
+            assert np.allclose(expected, ts_predicted)
+
+
+def test_in_sample_ts_forecast_batch_matches_iterative_forecast():
+    forecast_length, horizon = 3, 11
+    time_series = np.sin(np.arange(60) / 4) * 10
+    task = Task(TaskTypesEnum.ts_forecasting, TsForecastingParams(forecast_length=forecast_length))
+    train_input = InputData(idx=np.arange(len(time_series) - horizon), features=time_series[:-horizon],
+                            target=time_series[:-horizon], task=task, data_type=DataTypesEnum.ts)
+    predict_input = InputData(idx=np.arange(len(time_series)), features=time_series,
+                              target=None, task=task, data_type=DataTypesEnum.ts)
+
+    pipeline = get_two_branches_lagged_pipeline()
+    pipeline.fit(train_input)
+
+    multi_predicted = in_sample_ts_forecast(pipeline=pipeline, input_data=predict_input, horizon=horizon)
+
+    # Forecast from each origin separately using actual values of the time series
+    expected = []
+    for origin in range(len(time_series) - horizon, len(time_series), forecast_length):
+        origin_input = InputData(idx=np.arange(origin, origin + forecast_length), features=time_series[:origin],
+                                 target=None, task=task, data_type=DataTypesEnum.ts)
+        expected.extend(np.ravel(pipeline.predict(origin_input).predict))
+
+    assert len(multi_predicted) == horizon
+    assert np.allclose(multi_predicted, expected[:horizon])
@@ -16,6 +16,7 @@ from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.pipelines.tuning.search_space import SearchSpace
 from fedot.core.pipelines.tuning.sequential import SequentialTuner
+from fedot.core.pipelines.tuning.trials_store import TuningTrialsStore
 from fedot.core.pipelines.tuning.tuner_interface import _greater_is_better, _calculate_loss_function
 from fedot.core.pipelines.tuning.unified import PipelineTuner
 from fedot.core.repository.tasks import Task, TaskTypesEnum
@@ -429,6 +430,69 @@ def test_early_stop_in_tuning(data_fixture, request):
     assert time() - start_node_tuner < 1
 
 
+@pytest.mark.parametrize('tuner_class, iterations, evaluations_number',
+                         [(PipelineTuner, 4, 4),
+                          # Iterations are divided between two nodes, but only one of them has hyperparameters
+                          (SequentialTuner, 4, 2)])
+def test_tuning_warm_started_from_trials_store(tuner_class, iterations, evaluations_number,
+                                               regression_dataset, tmp_path):
+    trials_store = TuningTrialsStore(str(tmp_path))
+    loss_values = []
+
+    def loss_function(target, predict):
+        if len(target) > 2:
+            loss_values.append(mse(target, predict))
+        return mse(target, predict)
+
+    for launch in range(2):
+        loss_values.clear()
+        pipeline = Pipeline(SecondaryNode('ridge', nodes_from=[PrimaryNode('scaling')]))
+        tuner = tuner_class(pipeline=pipeline, task=regression_dataset.task, iterations=iterations,
+                            trials_store=trials_store)
+        tuner.tune_pipeline(regression_dataset, loss_function=loss_function)
+        # Initial metric is evaluated only in the first launch, the final one - in both launches
+        assert len(loss_values) == evaluations_number + (2 if launch == 0 else 1)
+
+    space = tuner.search_space.get_node_params(node_id=0, operation_name='ridge')
+    # Trials of both launches are stored
+    assert len(trials_store.load_trials(pipeline, space.keys())) == 2 * evaluations_number
+
+
+@pytest.mark.parametrize('tuner_class', [PipelineTuner, SequentialTuner])
+def test_tuning_doesnt_return_stale_trials_from_store(tuner_class, regression_dataset, tmp_path):
+    trials_store = TuningTrialsStore(str(tmp_path))
+    pipeline = Pipeline(SecondaryNode('ridge', nodes_from=[PrimaryNode('scaling')]))
+    label = '0 || ridge | alpha'
+    stale_alpha = 9.99
+    # Loss of the stale trial was obtained on the previous data and can't be reached on the current one
+    trials_store.save_trials(pipeline, [label], [{'vals': {label: [stale_alpha]}, 'loss': -1e9}])
+
+    tuner = tuner_class(pipeline=pipeline, task=regression_dataset.task, iterations=4,
+                        trials_store=trials_store)
+    tuned_pipeline = tuner.tune_pipeline(regression_dataset, loss_function=mse)
+
+    assert tuned_pipeline.nodes[0].custom_params.get('alpha') != stale_alpha
+
+
+def test_tuning_returns_fitted_init_pipeline_with_cached_init_metric(regression_dataset, tmp_path):
+    trials_store = TuningTrialsStore(str(tmp_path))
+    is_init_metric_cached = False
+
+    def loss_function(target, predict):
+        # All the evaluations are worse than the initial metric in the second launch
+        return mse(target, predict) + (1e9 if is_init_metric_cached else 0)
+
+    for launch in range(2):
+        is_init_metric_cached = launch > 0
+        pipeline = Pipeline(SecondaryNode('ridge', nodes_from=[PrimaryNode('scaling')]))
+        tuner = PipelineTuner(pipeline=pipeline, task=regression_dataset.task, iterations=2,
+                              trials_store=trials_store)
+        tuned_pipeline = tuner.tune_pipeline(regression_dataset, loss_function=loss_function)
+
+    assert tuned_pipeline is tuner.init_pipeline
+    assert tuned_pipeline.is_fitted
+
+
 def test_search_space_correctness_after_customization():
     default_search_space = SearchSpace()
 
@@ -4,6 +4,7 @@ import numpy as np
 import pandas as pd
 
 from fedot.core.data.data import InputData
+from fedot.core.data.data_preprocessing import data_has_missing_values, features_profile
 from fedot.core.data.data_split import train_test_data_setup
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
@@ -173,3 +174,22 @@ def test_numerical_column_with_string_nans():
 
     n_rows, n_cols = data.features.shape
     assert n_cols == 1
+
+
+def test_features_profile_correct():
+    """ Profile of the table with strings, numbers and missing values in object columns is defined once """
+    features = np.array([['a', 1, 1.5, None],
+                         [np.nan, 2, np.nan, 'b'],
+                         ['c', 3, 2.5, 'b'],
+                         ['a', 4, 3.5, 2]], dtype=object)
+    input_data = InputData(idx=np.arange(4), features=features, target=np.array([0, 1, 0, 1]),
+                           task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table)
+
+    profile = features_profile(input_data)
+
+    assert profile.categorical_ids == [0, 3]
+    assert profile.non_categorical_ids == [1, 2]
+    assert list(profile.nan_counts) == [1, 0, 1, 1]
+    assert profile.cardinality == {0: 3, 3: 3}
+    assert data_has_missing_values(input_data)
+    assert features_profile(input_data) is profile
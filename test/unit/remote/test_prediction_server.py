@@ -0,0 +1,93 @@
+import glob
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import numpy as np
+import pytest
+
+from fedot.core.data.data import InputData
+from fedot.core.data.data_split import train_test_data_setup
+from fedot.core.pipelines.artifact import ARTIFACTS_SUPPORTED
+from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
+from fedot.core.pipelines.pipeline import Pipeline
+from fedot.core.repository.dataset_types import DataTypesEnum
+from fedot.core.repository.tasks import Task, TaskTypesEnum
+from fedot.remote import prediction_server
+from fedot.remote.prediction_server import PredictionServer, ServedPipeline
+
+
+def get_classification_data(rows_number: int = 300) -> InputData:
+    rng = np.random.default_rng(1)
+    features = rng.normal(size=(rows_number, 4))
+    target = (features[:, 0] + features[:, 1] > 0).astype(int)
+    return InputData(idx=np.arange(rows_number), features=features, target=target,
+                     task=Task(TaskTypesEnum.classification), data_type=DataTypesEnum.table)
+
+
+def post_json(url: str, content: dict) -> dict:
+    request = Request(url, data=json.dumps(content).encode('utf-8'), headers={'Content-Type': 'application/json'})
+    with urlopen(request) as response:
+        return json.loads(response.read())
+
+
+def exit_in_worker(*args):
+    os._exit(1)
+
+
+@pytest.mark.skipif(not ARTIFACTS_SUPPORTED, reason='Pipeline artifacts require Python 3.8+')
+def test_prediction_server_batches_concurrent_requests(tmp_path):
+    train_data, test_data = train_test_data_setup(get_classification_data())
+    pipeline = Pipeline(SecondaryNode('logit', nodes_from=[PrimaryNode('scaling')]))
+    pipeline.fit(train_data)
+
+    pipeline.save(os.path.join(tmp_path, 'json'), datetime_in_path=False)
+    json_path = glob.glob(os.path.join(tmp_path, 'json', '*.json'))[0]
+    artifact_path = pipeline.save_artifact(os.path.join(tmp_path, 'pipeline.fedot'))
+    served_pipelines = {'json': ServedPipeline(json_path, test_data.task),
+                        'artifact': ServedPipeline(artifact_path, test_data.task)}
+
+    with PredictionServer(served_pipelines, workers_number=1, max_batch_delay=0.05) as server:
+        # Rows are requested concurrently by single-row requests
+        with ThreadPoolExecutor(8) as executor:
+            responses = list(executor.map(lambda row: post_json(f'{server.url}/predict/artifact',
+                                                                {'features': row.tolist()}),
+                                          test_data.features))
+        predicted = np.concatenate([response['predict'] for response in responses])
+        labels = server.predict('json', test_data.features, output_mode='labels')
+        with urlopen(f'{server.url}/stats') as response:
+            stats = json.loads(response.read())
+
+        with pytest.raises(HTTPError) as exc:
+            post_json(f'{server.url}/predict/unknown', {'features': [[0., 0., 0., 0.]]})
+        assert exc.value.code == 404
+
+    assert np.allclose(predicted, pipeline.predict(test_data).predict)
+    assert np.array_equal(labels, pipeline.predict(test_data, output_mode='labels').predict)
+    assert stats['requests_number'] == len(test_data.idx) + 1
+    assert stats['batches_number'] < stats['requests_number']
+    assert stats['latency_p99_ms'] is not None
+
+
+def test_prediction_server_fails_batch_of_dead_worker(tmp_path, monkeypatch):
+    train_data, test_data = train_test_data_setup(get_classification_data())
+    pipeline = Pipeline(PrimaryNode('logit'))
+    pipeline.fit(train_data)
+    pipeline.save(os.path.join(tmp_path, 'json'), datetime_in_path=False)
+    served_pipelines = {'json': ServedPipeline(glob.glob(os.path.join(tmp_path, 'json', '*.json'))[0],
+                                               test_data.task)}
+
+    with PredictionServer(served_pipelines, workers_number=1, predict_timeout=3) as server:
+        # Worker process dies during the prediction, so the result of the task is never received
+        monkeypatch.setattr(prediction_server, '_predict_in_worker', exit_in_worker)
+        with pytest.raises(TimeoutError):
+            server.predict('json', test_data.features)
+        monkeypatch.undo()
+        # The worker is released, so the next requests are predicted by the restarted one
+        prediction = server.predict('json', test_data.features)
+        stats = server.stats()
+
+    assert np.allclose(prediction, pipeline.predict(test_data).predict)
+    assert stats['errors_number'] == 1
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import numpy as np
 from sklearn.metrics import mean_squared_error
 
@@ -51,6 +53,33 @@ def test_gapfilling_forward_ridge_correct():
     assert rmse_test < 1.0
 
 
+def test_gaps_dependency_levels_correct():
+    gap_list = [[10, 11], [30], [55, 56, 57], [100]]
+    gapfiller = ModelGapFiller(gap_value=-100.0, pipeline=get_simple_ts_pipeline(),
+                               max_train_length=20)
+
+    # The training part of every gap starts 20 elements before the gap
+    assert gapfiller._gaps_dependency_levels(gap_list) == [[0, 2, 3], [1]]
+    gapfiller.max_train_length = None
+    assert gapfiller._gaps_dependency_levels(gap_list) == [[0], [1], [2], [3]]
+
+
+def test_gapfilling_parallel_equals_sequential():
+    arr_with_gaps, _ = get_array_with_gaps({300: 10, 500: 20, 700: 15, 1000: 30})
+
+    filled_arrays = []
+    for n_jobs in [1, 2]:
+        gapfiller = ModelGapFiller(gap_value=-100.0, pipeline=get_simple_ts_pipeline(model_root='ridge'),
+                                   n_jobs=n_jobs, max_train_length=150)
+        with patch('multiprocessing.cpu_count', return_value=2):
+            filled_arrays.append((gapfiller.forward_filling(arr_with_gaps),
+                                  gapfiller.forward_inverse_filling(arr_with_gaps)))
+
+    for sequential, parallel in zip(*filled_arrays):
+        assert len(np.ravel(np.argwhere(sequential == -100.0))) == 0
+        assert np.array_equal(sequential, parallel)
+
+
 def test_linear_interpolation_fill_start_end():
     """ Linear interpolation can fill in the gaps correctly even gaps are placed
     at the beginning or at the end of time series
@@ -70,3 +99,50 @@ def test_gapfilling_ts_with_no_gaps():
     without_gap = simple_gapfill.local_poly_approximation(no_gap_arr)
 
     assert tuple(without_gap) == tuple(no_gap_arr)
+
+
+def _nearest_known(output_data: np.array, gap_value: float, index: int, n_neighbors: int):
+    i_known = np.ravel(np.argwhere(output_data != gap_value))
+    # Stable sorting defines the choice between equally distant elements
+    sorted_idx = np.argsort(np.abs(i_known - index), kind='stable')[:n_neighbors]
+    return i_known[sorted_idx], output_data[i_known[sorted_idx]]
+
+
+def reference_local_poly_approximation(input_data: np.array, gap_value: float = -100.0,
+                                       degree: int = 2, n_neighbors: int = 5) -> np.array:
+    """ Element by element implementation of SimpleGapFiller.local_poly_approximation """
+    output_data = np.array(input_data)
+    for gap_index in np.ravel(np.argwhere(output_data == gap_value)):
+        nearest_indices, nearest_values = _nearest_known(output_data, gap_value, gap_index, n_neighbors)
+        # Coordinates are shifted to the gap to keep the fit well-conditioned on long series
+        local_coefs = np.polyfit(nearest_indices - gap_index, nearest_values, degree)
+        output_data[gap_index] = np.polyval(local_coefs, 0)
+    return output_data
+
+
+def reference_batch_poly_approximation(input_data: np.array, gap_value: float = -100.0,
+                                       degree: int = 3, n_neighbors: int = 10) -> np.array:
+    """ Gap by gap implementation of SimpleGapFiller.batch_poly_approximation """
+    output_data = np.array(input_data)
+    gap_list = np.ravel(np.argwhere(output_data == gap_value))
+    for gap in np.split(gap_list, np.flatnonzero(np.diff(gap_list) > 1) + 1):
+        center_index = int((gap[0] + gap[-1]) / 2)
+        nearest_indices, nearest_values = _nearest_known(output_data, gap_value, center_index, n_neighbors)
+        local_coefs = np.polyfit(nearest_indices - center_index, nearest_values, degree)
+        output_data[gap] = np.polyval(local_coefs, gap - center_index)
+    return output_data
+
+
+def test_poly_approximations_match_gap_by_gap_filling():
+    """ Vectorized polynomial approximations give the same values as filling of the gaps one by one,
+    including the gaps at the beginning and at the end and the gaps close to each other
+    """
+    arr_with_gaps, _ = get_array_with_gaps({0: 3, 100: 1, 104: 7, 300: 20, 330: 2, 600: 15, 990: 10})
+    arr_with_gaps = np.hstack((arr_with_gaps, [-100.0] * 5))
+    simple_gapfill = SimpleGapFiller(gap_value=-100.0)
+
+    for params in [{}, {'degree': 1, 'n_neighbors': 3}, {'degree': 3, 'n_neighbors': 8}]:
+        assert np.allclose(simple_gapfill.local_poly_approximation(arr_with_gaps, **params),
+                           reference_local_poly_approximation(arr_with_gaps, **params), rtol=1e-9)
+        assert np.allclose(simple_gapfill.batch_poly_approximation(arr_with_gaps, **params),
+                           reference_batch_poly_approximation(arr_with_gaps, **params), rtol=1e-9)
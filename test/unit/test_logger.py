@@ -1,4 +1,6 @@
+import multiprocessing
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -32,6 +34,10 @@ def release_log(logger, log_file):
         os.remove(log_file)
 
 
+def log_message_in_process(log_file: str):
+    default_log('test_process_log', log_file=log_file).info('message from the process')
+
+
 def test_default_logger_setup_correctly():
     expected_logger_info_level = 10
     test_default_log = default_log('default_test_logger')
@@ -65,6 +71,8 @@ def test_logger_write_logs_correctly():
     except Exception:
         print('Captured error')
 
+    # Messages are written to the file asynchronously
+    test_log.flush()
     if os.path.exists(test_log_file):
         with open(test_log_file, 'r') as file:
             content = file.readlines()
@@ -116,3 +124,58 @@ def test_logger_repr():
     expected_repr_value = "Log object for default_test_logger_for_repr module"
 
     assert repr(test_default_log) == expected_repr_value
+
+
+def test_logger_formats_messages_lazily():
+    test_log = default_log('test_lazy_log', verbose_level=2)
+    constructed_messages = set()
+
+    def construct_message(level: str):
+        constructed_messages.add(level)
+        return f'{level} message'
+
+    # Debug messages are filtered out by verbosity level, so they aren't constructed
+    test_log.debug(lambda: construct_message('debug'))
+    test_log.info(lambda: construct_message('info'))
+    test_log.info('%s message', 'info')
+    test_log.flush()
+
+    assert constructed_messages == {'info'}
+
+
+def test_logger_release_handlers_keeps_shared_file_open(tmp_path):
+    log_file = os.path.join(tmp_path, 'shared_log.log')
+    released_log = default_log('test_released_log', log_file=log_file)
+    shared_log = default_log('test_shared_log', log_file=log_file)
+
+    released_log.info('message before release')
+    released_log.release_handlers()
+    file_handler = shared_log.handlers[0].listener.handlers[0]
+    assert file_handler.stream is not None and not file_handler.stream.closed
+    # Messages are recorded and flushed concurrently from several threads
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(lambda num: (shared_log.info('message %s', num), shared_log.flush()), range(20)))
+
+    with open(log_file, 'r') as file:
+        content = file.read()
+    assert 'message before release' in content
+    assert all(f'message {num}\n' in content for num in range(20))
+
+
+def test_logger_listener_close_is_idempotent(tmp_path):
+    listener = LogManager().get_listener(os.path.join(tmp_path, 'closed_log.log'))
+    listener.close()
+    # The listener is closed again at exit
+    listener.close()
+
+
+def test_logger_in_spawned_process(tmp_path, capfd):
+    log_file = os.path.join(tmp_path, 'process_log.log')
+    process = multiprocessing.get_context('spawn').Process(target=log_message_in_process, args=(log_file,))
+    process.start()
+    process.join()
+
+    assert process.exitcode == 0
+    assert 'Traceback' not in capfd.readouterr().err
+    with open(log_file, 'r') as file:
+        assert 'message from the process' in file.read()
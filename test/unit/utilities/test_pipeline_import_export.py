@@ -6,6 +6,7 @@ import numpy as np
 import pytest
 from sklearn.metrics import mean_absolute_error
 
+from fedot.core.pipelines.artifact import ARTIFACTS_SUPPORTED, PipelineArtifactReader, PipelineArtifactWriter
 from fedot.core.pipelines.node import PrimaryNode, SecondaryNode
 from fedot.core.pipelines.pipeline import Pipeline
 from fedot.core.pipelines.template import PipelineTemplate, extract_subtree_root
@@ -17,6 +18,8 @@ from test.unit.multimodal.data_generators import get_single_task_multimodal_tabu
 from test.unit.pipelines.test_decompose_pipelines import get_classification_data
 from test.unit.tasks.test_forecasting import get_multiscale_pipeline, get_simple_ts_pipeline, get_ts_data
 
+requires_artifacts = pytest.mark.skipif(not ARTIFACTS_SUPPORTED, reason='Pipeline artifacts require Python 3.8+')
+
 
 @pytest.fixture(scope='session', autouse=True)
 def preprocessing_files_before_and_after_tests(request):
@@ -471,3 +474,58 @@ def test_old_serialized_paths_load_correctly():
     pipeline_loaded.load(path)
 
     assert pipeline_loaded.nodes is not None
+
+
+@requires_artifacts
+@pytest.mark.parametrize('mmap_arrays', [True, False])
+def test_pipeline_artifact_export_import_correctly(tmp_path, mmap_arrays):
+    train_data, test_data = get_classification_data()
+
+    pipeline = Pipeline(SecondaryNode('logit', nodes_from=[PrimaryNode('scaling'), PrimaryNode('pca')]))
+    pipeline.fit(train_data)
+    prediction = pipeline.predict(test_data)
+
+    artifact_path = pipeline.save_artifact(os.path.join(tmp_path, 'pipeline.fedot'))
+
+    pipeline_loaded = Pipeline()
+    pipeline_loaded.load_artifact(artifact_path, mmap_arrays=mmap_arrays)
+    prediction_loaded = pipeline_loaded.predict(test_data)
+
+    assert pipeline_loaded.is_fitted
+    assert pipeline_loaded.root_node.descriptive_id == pipeline.root_node.descriptive_id
+    assert np.array_equal(prediction.predict, prediction_loaded.predict)
+
+
+@requires_artifacts
+@pytest.mark.parametrize('mmap_arrays', [True, False])
+def test_pipeline_artifact_large_arrays_mapped_correctly(tmp_path, mmap_arrays):
+    artifact_path = os.path.join(tmp_path, 'arrays.fedot')
+    weights = {'small': np.arange(10), 'large': np.random.rand(100, 50),
+               'fortran': np.asfortranarray(np.ones((50, 20))),
+               'non_contiguous': np.random.rand(100, 50)[:, ::2]}
+
+    writer = PipelineArtifactWriter()
+    writer.add_object('weights', weights)
+    writer.write(artifact_path, structure={})
+
+    loaded_weights = PipelineArtifactReader(artifact_path, mmap_arrays=mmap_arrays).load_object('weights')
+
+    for name, array in weights.items():
+        assert np.array_equal(array, loaded_weights[name])
+    # Large arrays are views into the mapped file which is read-only
+    assert loaded_weights['large'].flags.writeable != mmap_arrays
+    assert loaded_weights['non_contiguous'].flags.writeable != mmap_arrays
+    assert loaded_weights['fortran'].flags.f_contiguous
+    assert loaded_weights['small'].flags.writeable
+
+
+@requires_artifacts
+def test_unfitted_pipeline_artifact_export_import_correctly(tmp_path):
+    pipeline = create_pipeline()
+    artifact_path = pipeline.save_artifact(os.path.join(tmp_path, 'pipeline.fedot'))
+
+    pipeline_loaded = Pipeline()
+    pipeline_loaded.load_artifact(artifact_path)
+
+    assert pipeline_loaded.root_node.descriptive_id == pipeline.root_node.descriptive_id
+    assert not pipeline_loaded.is_fitted
@@ -1,10 +1,12 @@
+import gc
+import itertools
 from pathlib import Path
 
 import pytest
 
 from fedot.core.optimisers.fitness.fitness import SingleObjFitness
 from fedot.core.optimisers.fitness.multi_objective_fitness import MultiObjFitness
-from fedot.core.optimisers.gp_comp.individual import Individual
+from fedot.core.optimisers.gp_comp.individual import Individual, IndividualRecord, ParentOperator
 from fedot.core.optimisers.graph import OptGraph, OptNode
 from fedot.core.optimisers.opt_history import OptHistory
 from fedot.core.utils import DEFAULT_PARAMS_STUB
@@ -22,6 +24,20 @@ def create_individual():
     return indiviual
 
 
+def count_reachable_graphs(obj) -> int:
+    graphs_number = 0
+    visited_ids = set()
+    objects = [obj]
+    while objects:
+        obj = objects.pop()
+        if id(obj) in visited_ids or isinstance(obj, type):
+            continue
+        visited_ids.add(id(obj))
+        graphs_number += isinstance(obj, OptGraph)
+        objects.extend(gc.get_referents(obj))
+    return graphs_number
+
+
 def generate_history(generations_quantity, pop_size):
     history = OptHistory()
     for _ in range(generations_quantity):
@@ -76,6 +92,81 @@ def test_all_historical_quality():
     assert all_quality[0] == -0.9 and all_quality[4] == -1.4 and all_quality[5] == -1.3 and all_quality[10] == -1.2
 
 
+def test_history_keeps_full_graphs_only_for_last_generations_and_archive():
+    generations_quantity = 5
+    pop_size = 4
+    full_generations = 2
+    history = OptHistory(full_generations_number=full_generations)
+    full_history = OptHistory()
+
+    parents = []
+    best_individual = None
+    for generation_num in range(generations_quantity):
+        new_pop = []
+        for ind_num in range(pop_size):
+            ind = create_individual()
+            ind.fitness = SingleObjFitness(generation_num * pop_size + ind_num)
+            if parents:
+                ind.parent_operators = [ParentOperator(operator_type='mutation', operator_name='simple',
+                                                       parent_individuals=[parents[ind_num]])]
+            new_pop.append(ind)
+        # The best individual is kept in all the generations
+        best_individual = best_individual or new_pop[0]
+        new_pop[0] = best_individual
+        for hist in [history, full_history]:
+            hist.add_to_history(new_pop)
+            hist.add_to_archive_history([best_individual])
+        parents = new_pop
+
+    assert history.historical_fitness == full_history.historical_fitness
+    for generation_num, generation in enumerate(history.individuals):
+        is_full_generation = generation_num >= generations_quantity - full_generations
+        for ind in generation:
+            is_full_individual = is_full_generation or ind.uid == best_individual.uid
+            assert isinstance(ind, IndividualRecord) != is_full_individual
+    assert len(history.historical_pipelines) == full_generations * pop_size + generations_quantity - full_generations
+    # Quality is aligned with the pipelines kept with full graphs
+    assert history.historical_pipelines_quality == [ind.fitness.value for ind in itertools.chain(*history.individuals)
+                                                    if not isinstance(ind, IndividualRecord)]
+
+    # Ancestry of old individuals is kept with records of parents
+    record = history.individuals[2][1]
+    parent_record = record.parent_operators[0].parent_individuals[0]
+    assert isinstance(parent_record, IndividualRecord) and parent_record.uid == history.individuals[1][1].uid
+    assert record.graph_hash == parent_record.graph_hash
+    assert parent_record.nodes == [str(node) for node in best_individual.graph.nodes]
+
+    restored_history = OptHistory.load(history.save())
+    assert restored_history.historical_fitness == full_history.historical_fitness
+
+
+def test_history_with_retention_doesnt_keep_graphs_of_ancestry():
+    generations_quantity = 12
+    pop_size = 3
+    full_generations = 3
+    history = OptHistory(full_generations_number=full_generations)
+
+    population = []
+    for _ in range(generations_quantity):
+        parents = population
+        population = [create_individual() for _ in range(pop_size)]
+        for ind, parent in zip(population, parents):
+            ind.parent_operators = [ParentOperator(operator_type='mutation', operator_name='simple',
+                                                   parent_individuals=[parent])]
+        history.add_to_history(population)
+        history.add_to_archive_history(population[:1])
+
+    # Only the last generations and the last archive snapshots are kept with full graphs,
+    # the live ancestry of the population is not copied into the history
+    assert count_reachable_graphs(history) == full_generations * (pop_size + 1)
+
+
+@pytest.mark.parametrize('full_generations_number', [0, -1])
+def test_history_with_non_positive_retention_is_rejected(full_generations_number):
+    with pytest.raises(ValueError):
+        OptHistory(full_generations_number=full_generations_number)
+
+
 @pytest.mark.parametrize('plot_type', PlotTypesEnum)
 def test_history_show_saving_plots(tmp_path, plot_type: PlotTypesEnum):
     generations_quantity = 2